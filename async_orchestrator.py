@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio 기반 예약 오케스트레이션 (1번/2번 모드, config의 async_lanes가 2 이상일 때)
+
+GolfBookingBot은 이동 / 대기 / 알림이 모두 블로킹이고 타석을 하나씩 차례로 확인한다.
+여기서는 같은 계정으로 드라이버(레인) 여러 개를 띄우고, 이벤트 루프 위에서 다음을 협력 작업으로 돌린다.
+
+- 타석 확인: 레인마다 작업 하나가 타석 대기열에서 타석을 꺼내 확인 (Selenium 호출은 레인 수만큼의 스레드 풀에서 실행)
+- 캘린더 폴링: 한 바퀴 돌아도 슬롯이 없으면 async_poll_seconds 동안 async_poll_interval 간격으로 다시 확인
+- 카카오 알림 / 지표 파일 쓰기: 별도 I/O 스레드 풀 (예약 흐름을 막지 않음)
+- 구조적 취소: 1순위 시간을 찾으면 그 레인이 바로 예약하고 나머지 확인 작업은 취소
+  (이미 실행 중인 드라이버 명령은 끝까지 돌지만 다음 타석으로 넘어가지 않음)
+
+레인 0이 로그인(쿠키 저장)과 타석 링크 검색을 맡고, 나머지 레인은 같은 쿠키 파일로 타석 페이지에 들어간다.
+한 드라이버의 탭 여러 개는 WebDriver 명령이 세션 단위로 직렬화되므로 레인은 드라이버 단위로 나눈다.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANES = 2
+
+
+class AsyncBookingOrchestrator:
+    """레인(드라이버) 여러 개로 타석을 동시에 확인하는 asyncio 오케스트레이터"""
+
+    def __init__(self, config, driver_factory=None, bot_class=None):
+        """
+        Args:
+            config: 공통 설정 (async_lanes, async_poll_seconds, async_poll_interval, metrics_textfile ...)
+            driver_factory: 레인 드라이버 생성 함수 (None이면 Chrome, 벤치마크에서는 가짜 드라이버)
+            bot_class: 레인 봇 클래스 (golf_auto_booking을 스크립트로 실행할 때는 __main__의 GolfBookingBot을
+                넘겨야 모듈이 golf_auto_booking으로 한 번 더 로드되지 않음)
+        """
+        if bot_class is None:
+            from golf_auto_booking import GolfBookingBot as bot_class
+        self.config = config
+        self.lane_count = max(int(config.get('async_lanes', DEFAULT_LANES)), 1)
+        self.poll_seconds = config.get('async_poll_seconds', 0)
+        self.poll_interval = config.get('async_poll_interval', 0.5)
+        self.metrics_path = config.get('metrics_textfile')
+        self.metrics_interval = config.get('metrics_interval_seconds', 15)
+        # 지표 파일은 이벤트 루프의 flush 작업이 쓰므로 레인 봇은 자체 내보내기 스레드를 띄우지 않음
+        lane_config = {k: v for k, v in config.items() if k != 'metrics_textfile'}
+        self.lanes = [bot_class(lane_config, driver_factory) for _ in range(self.lane_count)]
+        self.lead = self.lanes[0]
+        if self.metrics_path:
+            self.lead.metrics.add_collector(self.lead._collect_runtime_metrics)
+        # 드라이버 명령은 레인 수만큼만 동시에 실행
+        self.driver_pool = ThreadPoolExecutor(max_workers=self.lane_count, thread_name_prefix='lane')
+        self.io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='async-io')
+
+    async def _on_lane(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.driver_pool, func, *args)
+
+    async def _on_io(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.io_pool, func, *args)
+
+    def run(self, mode):
+        """
+        실행 (블로킹 진입점)
+
+        Args:
+            mode: '1' (즉시 내일 예약) 또는 '2' (자정 대기)
+
+        Returns:
+            bool: 예약 성공 여부
+        """
+        try:
+            return asyncio.run(self.run_async(mode))
+        finally:
+            self.driver_pool.shutdown(wait=True)
+            self.io_pool.shutdown(wait=True)
+            for lane in self.lanes:
+                lane.close_driver()
+
+    async def run_async(self, mode):
+        tracer = self.lead.start_trace(f"mode{mode}_async")
+        tracer.meta['lanes'] = self.lane_count
+        for lane in self.lanes[1:]:
+            lane.tracer = tracer
+        flusher = asyncio.ensure_future(self._flush_metrics()) if self.metrics_path else None
+        success = False
+        try:
+            logger.info("=" * 60)
+            logger.info(f"⚡ 비동기 예약 ({mode}번 모드, 레인 {self.lane_count}개)")
+            logger.info("=" * 60)
+
+            if mode == '2':
+                with tracer.span('wait_prep'):
+                    await self._on_io(self.lead.wait_until_midnight)
+            with tracer.span('prep') as prep:
+                if not await self._prepare_lanes(refresh_login=mode == '2'):
+                    prep.attrs['ok'] = False
+                    self.lead.last_booking_info = {'error': '드라이버/로그인 준비 실패'}
+                    return False
+                logger.info(f"✅ 레인 {self.lane_count}개 준비 완료 ({prep.elapsed():.1f}초)")
+            if mode == '2':
+                with tracer.span('wait_midnight'):
+                    midnight = await self._on_io(self.lead.wait_for_exact_midnight)
+                tracer.mark('midnight', fire_error_ms=round((datetime.now() - midnight).total_seconds() * 1000, 3))
+
+            with tracer.span('booking'):
+                success, booking_info = await self.book_tomorrow_slot()
+            self.lead.last_booking_info = booking_info
+            await self._on_io(self.lead.send_kakao_notification, success, booking_info)
+            return success
+        finally:
+            if flusher:
+                flusher.cancel()
+                await asyncio.gather(flusher, return_exceptions=True)
+            await self._on_io(self.lead.finish_trace, success)
+            if self.metrics_path:
+                await self._on_io(self.lead.metrics.write_textfile, self.metrics_path)
+
+    async def _prepare_lanes(self, refresh_login=False):
+        """레인 0은 로그인까지, 나머지는 드라이버만 동시에 준비 (타석 페이지에서 쿠키 적용)"""
+        results = await asyncio.gather(
+            self._on_lane(self.lead.prepare_session, refresh_login),
+            *(self._on_lane(lane.setup_driver) for lane in self.lanes[1:]),
+            return_exceptions=True,
+        )
+        if results[0] is not True:
+            logger.error("❌ 레인 0 로그인 실패")
+            return False
+        failed = [i for i, ok in enumerate(results[1:], start=1) if ok is not True]
+        if failed:
+            # 드라이버가 뜬 레인만으로 계속
+            logger.warning(f"⚠️  레인 {len(failed)}개 드라이버 준비 실패 - 나머지 레인으로 진행")
+            for i in failed:
+                self.lanes[i].close_driver()
+            self.lanes = [lane for i, lane in enumerate(self.lanes) if i not in failed]
+        # 레인 0 로그인으로 쿠키 파일이 새로 저장됐을 수 있으므로 나머지 레인에 다시 일괄 설정
+        await asyncio.gather(*(self._on_lane(lane.inject_stored_cookies) for lane in self.lanes[1:]))
+        return True
+
+    async def _flush_metrics(self):
+        """지표 파일 주기 쓰기 (기존 TextfileExporter 스레드 대신 루프 작업)"""
+        while True:
+            try:
+                await self._on_io(self.lead.metrics.write_textfile, self.metrics_path)
+            except OSError as e:
+                logger.debug("지표 파일 쓰기 실패: %s", e)
+            await asyncio.sleep(self.metrics_interval)
+
+    async def book_tomorrow_slot(self):
+        """
+        내일 타석 예약 - 레인별로 타석을 나눠 동시에 확인
+
+        Returns:
+            tuple: (성공 여부, 예약 정보) - GolfBookingBot.book_tomorrow_slot과 같은 모양
+        """
+        lead = self.lead
+        booking_start = time.perf_counter()
+        booth_infos, error_info = await self._on_lane(lead._load_booth_links)
+        if booth_infos is None:
+            return False, error_info
+
+        tomorrow = datetime.now() + timedelta(days=1)
+        day_type = "평일" if tomorrow.weekday() < 5 else "주말"
+        time_ladder = lead._time_ladder(tomorrow)
+        logger.info(f"📅 예약일: {tomorrow.strftime('%Y-%m-%d')} / 🎯 희망 시간: {' > '.join(time_ladder)} - {day_type}")
+        scan_order, booth_by_num = lead._order_booths(booth_infos)
+
+        deadline = time.perf_counter() + self.poll_seconds
+        poll = 0
+        while True:
+            poll += 1
+            with lead.tracer.span('async_scan', poll=poll, lanes=len(self.lanes)):
+                found_slot, lane = await self._scan(scan_order, booth_by_num, tomorrow.day, time_ladder, booking_start)
+            if found_slot or time.perf_counter() >= deadline:
+                break
+            logger.info(f"🔁 예약 가능 슬롯 없음 - {self.poll_interval}초 후 다시 확인 ({poll}회)")
+            await asyncio.sleep(self.poll_interval)
+
+        if not found_slot:
+            logger.error(f"❌ {tomorrow.strftime('%Y-%m-%d')} ({day_type}) {', '.join(time_ladder)}에 예약 가능한 타석이 없습니다")
+            return False, {
+                'error': f'{tomorrow.strftime("%Y-%m-%d")} {", ".join(time_ladder)} 예약 불가',
+                'date': tomorrow.strftime('%Y-%m-%d'),
+                'time': time_ladder[0] if time_ladder else None,
+                'day_type': day_type
+            }
+
+        found_slot['branch'] = lead.branch['name']
+        logger.info(f"\n🎯 {found_slot['booth_text']} {found_slot['time']} 예약을 시작합니다...")
+        if not await self._on_lane(lane._commit_slot, found_slot):
+            return False, found_slot
+        logger.info("=" * 60)
+        logger.info(f"🎉 예약 완료! {found_slot['booth_text']} {found_slot['date']} {found_slot['time']}")
+        logger.info("=" * 60)
+        return True, found_slot
+
+    @staticmethod
+    def _check_booth(lane, span_name, booth_info, tomorrow_day, time_ladder):
+        """레인 스레드에서 타석 하나 확인 (span은 실행 스레드의 스택에 쌓이므로 루프의 작업끼리 섞이지 않음)"""
+        with lane.tracer.span(span_name, booth=booth_info['num']) as span:
+            result = lane._check_booth_availability(booth_info, tomorrow_day, time_ladder)
+            span.attrs['ok'] = bool(result)
+        return result
+
+    @staticmethod
+    def _log_lane_error(index, error):
+        logger.error(f"❌ 레인 {index} 타석 확인 오류: {type(error).__name__}: {error}", exc_info=error)
+
+    async def _scan(self, scan_order, booth_by_num, tomorrow_day, time_ladder, booking_start):
+        """
+        타석 대기열 한 바퀴 (레인마다 작업 하나)
+
+        1순위 시간을 찾은 레인이 나오면 나머지 작업을 취소한다. 끝까지 돌면
+        (시간 순위, 확인 순서)가 가장 좋은 후보부터, 그 레인이 다른 타석으로 넘어갔으면 다시 확인한다.
+
+        Returns:
+            tuple: (예약할 슬롯, 그 타석 페이지가 열린 레인) - 없으면 (None, None)
+        """
+        queue = asyncio.Queue()
+        for item in enumerate(scan_order):
+            queue.put_nowait(item)
+        candidates = []  # (시간 순위, 확인 순서, 결과, 레인)
+        current = {}  # 레인 → 열려 있는 타석의 확인 순서
+
+        async def worker(lane):
+            while not queue.empty():
+                scan_idx, booth_info = queue.get_nowait()
+                current[lane] = scan_idx
+                result = await self._on_lane(
+                    self._check_booth, lane, 'booth_scan', booth_info, tomorrow_day, time_ladder
+                )
+                lane.metrics.counter('golf_booths_scanned_total', '확인한 타석 수').inc(**lane.metric_labels)
+                if not result:
+                    continue
+                if not candidates:
+                    lane.metrics.histogram(
+                        'golf_time_to_first_slot_seconds', '예약 페이지 접속부터 첫 예약 가능 슬롯 발견까지'
+                    ).observe(time.perf_counter() - booking_start, **lane.metric_labels)
+                candidates.append((result['time_rank'], scan_idx, result, lane))
+                logger.info(f"🎉 {booth_info['text']}에서 {result['time']} 예약 가능! (희망 {result['time_rank'] + 1}순위)")
+                if result['time_rank'] == 0:
+                    return result, lane
+            return None, None
+
+        tasks = {asyncio.ensure_future(worker(lane)): i for i, lane in enumerate(self.lanes)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 한 레인이 죽어도 나머지 레인은 대기열을 계속 처리
+                failed = {task for task in done if task.exception()}
+                for task in failed:
+                    self._log_lane_error(tasks[task], task.exception())
+                for task in done - failed:
+                    found_slot, lane = task.result()
+                    if found_slot:
+                        if pending:
+                            logger.info(f"✂️  1순위 시간 확보 - 나머지 타석 확인 {len(pending)}개 취소")
+                        return found_slot, lane
+        finally:
+            for task in pending:
+                task.cancel()
+            pending = list(pending)
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for task, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    self._log_lane_error(tasks[task], result)
+
+        candidates.sort(key=lambda c: (c[0], c[1]))
+        for _, scan_idx, result, lane in candidates:
+            if current.get(lane) == scan_idx:
+                return result, lane
+            logger.info(f"\n🔁 {result['booth_text']} {result['time']} 재확인...")
+            retry = await self._on_lane(
+                self._check_booth, lane, 'booth_recheck', booth_by_num[result['booth_num']], tomorrow_day, [result['time']]
+            )
+            current[lane] = scan_idx
+            if retry:
+                return retry, lane
+        return None, None
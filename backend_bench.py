@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 백엔드별 명령 지연 벤치마크 (selenium vs cdp)
+
+fixture_server.py의 저장된 타석 페이지를 headless Chrome 하나에 띄우고, 같은 드라이버에서
+Selenium(chromedriver HTTP)과 DevTools 웹소켓 직접 연결로 타석 확인 루프의 핫 명령을 번갈아 반복해
+명령 한 번의 지연(평균 / p50 / p90 / p99)을 비교한다.
+
+- script: 짧은 스크립트 (document.title) - 순수 왕복 비용
+- current_url: 로그인 리다이렉트 확인
+- time_snapshot: 시간 버튼 스냅샷 (TIME_SLOT_SNAPSHOT_JS)
+- date_state: 예약일 버튼 찾기 + 클래스 / 표시 여부 (selenium은 봇과 같이 요소 명령 4번, cdp는 스크립트 1번)
+- click: 예약일 버튼 클릭
+- navigate: 타석 페이지 이동 (load 이벤트까지)
+
+사용법:
+    python backend_bench.py --iterations 200
+    python backend_bench.py --op script --op click --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 벤치마크 로그가 golf_booking.log에 섞이지 않음
+setup_logging('backend_bench.log', json_file=None)
+
+from selenium.webdriver.common.by import By  # noqa: E402
+
+from booking_trace import percentile  # noqa: E402
+from browser_backend import FIND_BY_XPATH_JS, CdpBackend, SeleniumBackend  # noqa: E402
+from fixture_server import FIXTURE_BOOTH, FIXTURE_DAY, FixtureServer  # noqa: E402
+from golf_auto_booking import (  # noqa: E402
+    CALENDAR_DATE_STATE_JS, CALENDAR_DATE_XPATH, TIME_SLOT_SNAPSHOT_JS, GolfBookingBot,
+)
+from replay_bench import replay_config  # noqa: E402
+
+DATE_XPATH = CALENDAR_DATE_XPATH.format(day=FIXTURE_DAY)
+
+
+def _selenium_date_state(backend, server):
+    span = backend.driver.find_element(By.XPATH, f"//span[@class='num' and text()='{FIXTURE_DAY}']")
+    button = span.find_element(By.XPATH, "./ancestor::button[contains(@class, 'calendar_date')]")
+    return button.get_attribute('class'), button.is_displayed()
+
+
+def _cdp_date_state(backend, server):
+    return backend.run_script(CALENDAR_DATE_STATE_JS, DATE_XPATH, 1000, await_promise=True)
+
+
+# (이름, selenium 함수, cdp 함수) - 같은 동작을 백엔드별로
+OPS = [
+    ('script', lambda b, s: b.run_script("return document.title;"), None),
+    ('current_url', lambda b, s: b.current_url(), None),
+    ('time_snapshot', lambda b, s: b.run_script(TIME_SLOT_SNAPSHOT_JS), None),
+    ('date_state', _selenium_date_state, _cdp_date_state),
+    ('click', lambda b, s: b.click(FIND_BY_XPATH_JS, DATE_XPATH), None),
+    ('navigate', lambda b, s: b.navigate(s.booth_url(FIXTURE_BOOTH)), None),
+]
+
+
+def bench_op(backend, server, func, iterations, warmup=3):
+    """명령 반복 실행 (ms 단위 통계)"""
+    for _ in range(warmup):
+        func(backend, server)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(backend, server)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'p50_ms': round(percentile(samples, 50), 3),
+        'p90_ms': round(percentile(samples, 90), 3),
+        'p99_ms': round(percentile(samples, 99), 3),
+    }
+
+
+def run_suite(driver, server, iterations, ops=None):
+    """
+    명령별로 두 백엔드를 번갈아 측정 (같은 페이지 상태에서 비교)
+
+    Returns:
+        dict: {명령: {'selenium': 통계, 'cdp': 통계}}
+    """
+    backends = {'selenium': SeleniumBackend(driver), 'cdp': CdpBackend(driver)}
+    results = {}
+    try:
+        for name, selenium_func, cdp_func in OPS:
+            if ops and name not in ops:
+                continue
+            driver.get(server.booth_url(FIXTURE_BOOTH))
+            results[name] = {
+                'selenium': bench_op(backends['selenium'], server, selenium_func, iterations),
+                'cdp': bench_op(backends['cdp'], server, cdp_func or selenium_func, iterations),
+            }
+    finally:
+        backends['cdp'].close()
+    return results
+
+
+def format_results(results):
+    lines = [f"{'명령':<14} {'selenium p50':>13} {'p99':>8} {'cdp p50':>9} {'p99':>8} {'배속(p50)':>10}"]
+    for name, stats in results.items():
+        sel, cdp = stats['selenium'], stats['cdp']
+        speedup = f"{sel['p50_ms'] / cdp['p50_ms']:.1f}x" if cdp['p50_ms'] else '-'
+        lines.append(
+            f"{name:<14} {sel['p50_ms']:>13.2f} {sel['p99_ms']:>8.2f} "
+            f"{cdp['p50_ms']:>9.2f} {cdp['p99_ms']:>8.2f} {speedup:>10}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='브라우저 백엔드별 명령 지연 벤치마크 (selenium vs cdp)')
+    parser.add_argument('--iterations', type=int, default=100, help='명령별 반복 횟수')
+    parser.add_argument('--op', action='append', choices=[name for name, _, _ in OPS],
+                        help='명령만 실행 (여러 번 지정 가능)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        bot = GolfBookingBot(replay_config())
+        if not bot.setup_driver():
+            print("❌ 드라이버를 시작할 수 없습니다")
+            sys.exit(1)
+        try:
+            # 없는 요소를 찾을 때 암묵적 대기가 측정에 섞이지 않도록
+            bot.driver.implicitly_wait(0)
+            results = run_suite(bot.driver, server, args.iterations, args.op)
+            browser = bot.driver.capabilities.get('browserVersion')
+        finally:
+            bot.close_driver()
+
+    report = {
+        'measured_at': datetime.now().isoformat(timespec='seconds'),
+        'browser_version': browser,
+        'iterations': args.iterations,
+        'results': results,
+    }
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 없는 HTTP 예약 확정
+
+슬롯을 찾은 뒤 Selenium 클릭 체인(시간 클릭 → 다음 → 로그인 → 동의하고 예약하기 → URL 확인)
+대신 로그인된 세션 쿠키로 예약 요청을 직접 보내고, 예약 완료 리소스
+(/my/bookings/{예약번호}?popup=bookingCompletion)로 확정 여부를 확인한다.
+
+예약 요청 모양은 config의 http_commit_request 템플릿으로 지정한다 (네이버 예약 페이지의 실제 요청은
+브라우저 개발자 도구나 세션 기록(record_session)의 예약 API 응답 목록으로 확인).
+문자열 안의 {이름}은 예약할 슬롯 값으로 바뀐다:
+    origin, biz_id, item_id, booth, date(YYYY-MM-DD), time(HH:MM), start(YYYY-MM-DDTHH:MM:00)
+
+    "http_commit_request": {
+        "method": "POST",
+        "url": "{origin}/booking/6/bizes/{biz_id}/commit",
+        "json": {"itemId": "{item_id}", "startDateTime": "{start}"},
+        "headers": {"Referer": "{origin}/booking/6/bizes/{biz_id}/items/{item_id}"}
+    }
+
+예약번호는 응답의 리다이렉트 URL / JSON(bookingId) / 본문의 /my/bookings/{번호} 순으로 찾는다.
+결과(outcome)는 네 가지다:
+    booked      예약번호 + 완료 리소스 확인
+    unconfirmed 예약번호는 받았지만 완료 리소스 확인 실패 (예약은 된 것으로 보고 다시 클릭하지 않음)
+    unknown     요청은 보냈지만 결과를 모름 (응답 타임아웃 / 5xx / 예약번호 없는 2xx)
+    rejected    확실히 예약되지 않음 (요청이 나가지 않았거나, 로그인 리다이렉트 / 예약번호 없는 4xx)
+호출한 쪽은 rejected일 때만 Selenium 경로로 이어서 예약한다 (unknown에서 다시 시도하면 중복 예약 위험).
+"""
+
+import re
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_util import request_not_sent
+
+BOOKING_ORIGIN = 'https://booking.naver.com'
+COMPLETION_PATH = '/my/bookings/{booking_id}?popup=bookingCompletion'
+BOOKING_ID_RE = re.compile(r'/my/bookings/(\d+)')
+ITEM_ID_RE = re.compile(r'/items/(\d+)')
+LOGIN_HOST = 'nid.naver.com'
+DEFAULT_TIMEOUT = 5.0
+
+BOOKED = 'booked'
+UNCONFIRMED = 'unconfirmed'
+UNKNOWN = 'unknown'
+REJECTED = 'rejected'
+
+
+def slot_fields(slot, biz_id, origin=BOOKING_ORIGIN):
+    """
+    템플릿에 채울 슬롯 값
+
+    Args:
+        slot: _check_booth_availability 결과 (booth_num, booth_href, date, time)
+        biz_id: 지점 biz id
+        origin: 예약 서버 주소
+    """
+    match = ITEM_ID_RE.search(slot.get('booth_href') or '')
+    return {
+        'origin': origin.rstrip('/'),
+        'biz_id': biz_id,
+        'item_id': match.group(1) if match else slot['booth_num'],
+        'booth': slot['booth_num'],
+        'date': slot['date'],
+        'time': slot['time'],
+        'start': f"{slot['date']}T{slot['time']}:00",
+    }
+
+
+def render(template, fields):
+    """템플릿(문자열 / dict / list)의 {이름}을 슬롯 값으로 치환"""
+    if isinstance(template, str):
+        return template.format(**fields)
+    if isinstance(template, dict):
+        return {key: render(value, fields) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render(value, fields) for value in template]
+    return template
+
+
+def _find_key(data, key):
+    if isinstance(data, dict):
+        if data.get(key) is not None:
+            return data[key]
+        data = list(data.values())
+    if isinstance(data, list):
+        for value in data:
+            found = _find_key(value, key)
+            if found is not None:
+                return found
+    return None
+
+
+def find_booking_id(response):
+    """예약 요청 응답에서 예약번호 찾기 (리다이렉트 URL → JSON bookingId → 본문)"""
+    for url in [response.url, *(r.headers.get('Location', '') for r in response.history)]:
+        match = BOOKING_ID_RE.search(url or '')
+        if match:
+            return match.group(1)
+    if 'json' in response.headers.get('Content-Type', ''):
+        try:
+            found = _find_key(response.json(), 'bookingId')
+        except ValueError:
+            found = None
+        if found is not None:
+            return str(found)
+    match = BOOKING_ID_RE.search(response.text or '')
+    return match.group(1) if match else None
+
+
+class HttpBookingClient:
+    """로그인 쿠키를 옮겨 받은 requests 세션으로 예약 요청 + 완료 확인"""
+
+    def __init__(self, request_template, origin=BOOKING_ORIGIN, timeout=DEFAULT_TIMEOUT):
+        """
+        Args:
+            request_template: method / url / params / json / data / headers 템플릿
+            origin: 예약 서버 주소 (모의 서버 벤치마크에서는 로컬 주소)
+            timeout: 요청당 타임아웃 (초)
+        """
+        self.request_template = dict(request_template)
+        self.origin = origin.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def load_cookies(self, cookies, user_agent=None):
+        """Selenium get_cookies() 결과를 세션에 복사 (브라우저와 같은 로그인 상태)"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+    def commit(self, fields):
+        """
+        예약 요청 전송 → 예약 완료 리소스로 확정 확인
+
+        Returns:
+            dict: outcome(booked / unconfirmed / unknown / rejected), ok, booking_id, status, url, error,
+                submit_ms, confirm_ms
+        """
+        result = {'outcome': REJECTED, 'ok': False, 'booking_id': None, 'status': None, 'url': None,
+                  'error': None, 'submit_ms': None, 'confirm_ms': None}
+        try:
+            request = render(self.request_template, fields)
+        except (KeyError, IndexError, ValueError) as e:
+            result['error'] = f"예약 요청 템플릿 오류: {e!r}"
+            return result
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                request.get('method', 'POST'), request['url'],
+                params=request.get('params'), json=request.get('json'), data=request.get('data'),
+                headers=request.get('headers'), timeout=self.timeout, allow_redirects=True,
+            )
+        except requests.RequestException as e:
+            result['error'] = f"예약 요청 실패: {type(e).__name__}"
+            if not request_not_sent(e):
+                result['outcome'] = UNKNOWN
+            return result
+        finally:
+            result['submit_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        result.update(status=response.status_code, url=response.url)
+        booking_id = find_booking_id(response)
+        if not booking_id:
+            if LOGIN_HOST in response.url:
+                result['error'] = '로그인 필요 (세션 쿠키 만료)'
+            else:
+                result['error'] = f"예약번호 없음 (HTTP {response.status_code})"
+                if not 400 <= response.status_code < 500:
+                    result['outcome'] = UNKNOWN
+            return result
+        result.update(outcome=UNCONFIRMED, booking_id=booking_id)
+
+        # 리다이렉트로 이미 완료 리소스를 받았으면 그 응답으로 확인
+        completion = response
+        if not (BOOKING_ID_RE.search(response.url) and 'popup=bookingCompletion' in response.url):
+            confirm_start = time.perf_counter()
+            try:
+                completion = self.session.get(
+                    self.origin + COMPLETION_PATH.format(booking_id=booking_id), timeout=self.timeout
+                )
+            except requests.RequestException as e:
+                result['error'] = f"완료 확인 실패: {type(e).__name__}"
+                return result
+            finally:
+                result['confirm_ms'] = round((time.perf_counter() - confirm_start) * 1000, 1)
+        if completion.status_code != 200 or LOGIN_HOST in completion.url:
+            result['error'] = f"완료 확인 실패 (HTTP {completion.status_code})"
+            return result
+        result.update(outcome=BOOKED, ok=True, url=completion.url)
+        return result
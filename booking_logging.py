@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 로깅 설정 모듈
+
+- 로거는 레코드를 큐에 넣기만 하고, 포맷/파일 쓰기/콘솔 출력은 백그라운드 스레드가 처리
+- 사람이 읽는 로그(golf_booking.log) + JSON lines 구조화 로그(golf_booking.jsonl)
+- 크기 기준 로테이션 + 지난 로그 gzip 압축 (golf_booking.log.1.gz ...)
+- lazy(): 비싼 디버그 메시지를 실제로 기록될 때만 만들기
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 10
+
+_listener = None
+
+
+class LazyMessage:
+    """
+    로그 인자를 기록 시점에 만드는 래퍼
+
+    예: logger.debug("시간 상태: %s", lazy(format_states, slots))
+    로그 레벨에 걸러지면 함수가 호출되지 않는다. 포맷은 백그라운드 스레드에서
+    일어나므로 함수는 이미 수집한 값만 사용해야 한다 (WebDriver 호출 금지).
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+
+def lazy(func, *args):
+    """LazyMessage 생성 헬퍼"""
+    return LazyMessage(func, *args)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    한 줄에 레코드 하나씩 JSON으로 출력
+
+    extra={'fields': {...}} 로 넘긴 값은 fields 키에 그대로 담는다.
+    """
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage().strip(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry['fields'] = fields
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 만들어 버리므로,
+    같은 프로세스 안의 리스너로만 넘기는 이 모듈에서는 포맷을 리스너에 맡긴다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def _gzip_namer(name):
+    return name + '.gz'
+
+
+def _gzip_rotator(source, dest):
+    """로테이션된 로그를 gzip으로 압축 (기록 스레드에서 실행)"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _rotating_handler(path, max_bytes, backup_count):
+    """크기(max_bytes) 기준 로테이션 핸들러 (지난 로그는 log.N.gz)"""
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def setup_logging(log_file='golf_booking.log', json_file='golf_booking.jsonl', level=logging.INFO,
+                  max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+    """
+    루트 로거를 큐 기반 비동기 로깅으로 설정 (여러 번 호출해도 한 번만 적용)
+
+    Args:
+        log_file: 사람이 읽는 로그 파일
+        json_file: JSON lines 로그 파일 (None이면 생략)
+        level: 로그 레벨
+        max_bytes: 이 크기를 넘으면 로테이션
+        backup_count: 보관할 압축 로그 개수
+
+    Returns:
+        QueueListener: 백그라운드 기록기
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    text_formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+
+    file_handler = _rotating_handler(log_file, max_bytes, backup_count)
+    file_handler.setFormatter(text_formatter)
+    handlers.append(file_handler)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(text_formatter)
+    handlers.append(stream_handler)
+
+    if json_file:
+        json_handler = _rotating_handler(json_file, max_bytes, backup_count)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 기록하고 백그라운드 기록기 종료"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
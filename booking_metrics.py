@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예약 지표 레지스트리 + Prometheus textfile 내보내기
+
+네트워크 리스너 없이 주기적으로 Prometheus 텍스트 형식 파일을 쓴다
+(node_exporter textfile collector 등으로 수집).
+
+    registry = get_metrics_registry()
+    registry.counter('golf_login_total', '로그인 경로별 횟수').inc(path='cookie')
+    registry.histogram('golf_time_to_confirm_seconds', '...').observe(4.2)
+    start_textfile_exporter('metrics/golf_booking.prom', interval=15)
+"""
+
+import atexit
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key, extra=None):
+    pairs = list(key) + list(extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """현재 값"""
+
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        if self.buckets[-1] != float('inf'):
+            self.buckets += (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][i] += 1
+            state['sum'] += value
+            state['count'] += 1
+
+    def _render_value(self, key, state):
+        lines = []
+        for bound, count in zip(self.buckets, state['counts']):
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', _format_value(bound))])} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{_format_labels(key)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """프로세스 전체 지표 레지스트리 (이름이 같으면 같은 지표를 돌려줌)"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, **kwargs)
+            return metric
+
+    def counter(self, name, help_text=''):
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name, help_text=''):
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name, help_text='', buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def add_collector(self, func):
+        """내보내기 직전에 호출할 함수 등록 (게이지 갱신용)"""
+        with self._lock:
+            self._collectors.append(func)
+
+    def remove_collector(self, func):
+        with self._lock:
+            if func in self._collectors:
+                self._collectors.remove(func)
+
+    def collect(self):
+        with self._lock:
+            collectors = list(self._collectors)
+        for func in collectors:
+            try:
+                func()
+            except Exception as e:
+                logger.debug("지표 수집 실패: %s", e)
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        self.collect()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """원자적으로 textfile 쓰기 (수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def instrument_driver(self, driver, **labels):
+        """WebDriver 명령 수 카운터 (driver.execute 감싸기)"""
+        if getattr(driver, '_metrics_registry', None) is self:
+            return driver
+        commands = self.counter('golf_webdriver_commands_total', 'WebDriver 명령(chromedriver 왕복) 수')
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            commands.inc(command=driver_command, **labels)
+            return original(driver_command, params)
+
+        driver.execute = execute
+        driver._metrics_registry = self
+        return driver
+
+
+class TextfileExporter:
+    """주기적으로 textfile을 쓰는 백그라운드 스레드"""
+
+    def __init__(self, registry, path, interval=15):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-exporter', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.flush()
+            self._stop.wait(self.interval)
+
+    def flush(self):
+        try:
+            self.registry.write_textfile(self.path)
+        except Exception as e:
+            logger.warning(f"⚠️  지표 파일 쓰기 실패: {str(e)}")
+
+    def stop(self):
+        self._stop.set()
+        self.flush()
+
+
+def process_tree_rss_bytes(root_pid):
+    """
+    프로세스와 모든 하위 프로세스의 RSS 합계 (chromedriver → Chrome 프로세스들)
+
+    ps를 사용하므로 Linux/macOS에서 동작한다 (psutil 불필요).
+    """
+    output = subprocess.run(
+        ['ps', '-A', '-o', 'pid=,ppid=,rss='],
+        capture_output=True, text=True, timeout=5, check=True
+    ).stdout
+    children = {}
+    rss = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        pid, ppid, kb = (int(p) for p in parts)
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = kb
+    total = 0
+    stack = [root_pid]
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * 1024
+
+
+_registry = MetricsRegistry()
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def get_metrics_registry():
+    """프로세스 공용 지표 레지스트리"""
+    return _registry
+
+
+def start_textfile_exporter(path, interval=15):
+    """textfile 내보내기 시작 (프로세스당 한 번, 이후 호출은 기존 exporter 반환)"""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = TextfileExporter(_registry, path, interval).start()
+            atexit.register(_exporter.stop)
+            logger.info(f"📈 지표 파일 내보내기: {path} ({interval}초마다)")
+        return _exporter
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예약 단계별 지연 시간 추적 모듈
+
+- span: 단조 시계(perf_counter) 기준 시작/종료 시각을 기록하는 구간 (중첩 가능)
+- 실행(run)마다 JSON 타임라인 저장
+- Chrome trace-event 형식으로 변환 (chrome://tracing, Perfetto에서 열기)
+- WebDriver 명령 프로파일러 (단계별 명령 횟수 / 소요 시간 / p50·p99)
+
+사용법:
+    python booking_trace.py traces/run_20251124_000000_mode2.json > mode2.trace.json
+"""
+
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """추적 구간 하나"""
+
+    __slots__ = ('name', 'start', 'end', 'depth', 'parent', 'thread', 'attrs')
+
+    def __init__(self, name, start, depth, parent, thread, attrs):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.depth = depth
+        self.parent = parent
+        self.thread = thread
+        self.attrs = attrs
+
+    def elapsed(self):
+        """경과 시간 (초) - 끝난 구간이면 전체 소요 시간"""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+
+class Tracer:
+    """
+    실행 단위 span 기록기
+
+    span은 스레드별 스택으로 중첩을 추적하고, 시각은 실행 시작 기준 ms로 저장한다.
+    """
+
+    def __init__(self, run_name='run', meta=None):
+        self.run_name = run_name
+        self.meta = dict(meta or {})
+        self.started_at = datetime.now()
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.marks = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """
+        구간 기록
+
+        Args:
+            name: 단계 이름 (예: 'login', 'booth_scan')
+            attrs: 추가 속성 (예: booth=11)
+        """
+        stack = self._stack()
+        span = Span(
+            name,
+            time.perf_counter(),
+            len(stack),
+            stack[-1].name if stack else None,
+            threading.current_thread().name,
+            attrs,
+        )
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attrs['error'] = type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def mark(self, name, **attrs):
+        """순간 이벤트 기록 (예: 자정 도달)"""
+        with self._lock:
+            self.marks.append((name, time.perf_counter(), threading.current_thread().name, attrs))
+
+    def current_phase(self):
+        """현재 스레드에서 진행 중인 가장 안쪽 단계 이름 (없으면 None)"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1].name if stack else None
+
+    def _ms(self, t):
+        return round((t - self.origin) * 1000, 3)
+
+    def span_dicts(self, spans=None):
+        """span 목록을 시작 순서대로 딕셔너리로 변환"""
+        spans = sorted(self.spans if spans is None else spans, key=lambda s: s.start)
+        return [
+            {
+                'name': s.name,
+                'start_ms': self._ms(s.start),
+                'end_ms': self._ms(s.end),
+                'duration_ms': round((s.end - s.start) * 1000, 3),
+                'depth': s.depth,
+                'parent': s.parent,
+                'thread': s.thread,
+                'attrs': s.attrs,
+            }
+            for s in spans
+        ]
+
+    def last_spans(self, count=20):
+        """최근에 끝난 span (플라이트 레코더 등에서 사용)"""
+        with self._lock:
+            spans = list(self.spans[-count:])
+        return self.span_dicts(spans)
+
+    def elapsed_ms(self):
+        """실행 시작 후 경과 시간 (ms)"""
+        return self._ms(time.perf_counter())
+
+    def phase_durations(self):
+        """단계 이름별 총 소요 시간 (ms)"""
+        totals = {}
+        for span in self.spans:
+            totals[span.name] = round(totals.get(span.name, 0) + (span.end - span.start) * 1000, 3)
+        return totals
+
+    def to_dict(self):
+        """JSON 타임라인"""
+        return {
+            'run': self.run_name,
+            'started_at': self.started_at.isoformat(timespec='milliseconds'),
+            'meta': self.meta,
+            'spans': self.span_dicts(),
+            'marks': [
+                {'name': name, 'at_ms': self._ms(t), 'thread': thread, 'attrs': attrs}
+                for name, t, thread, attrs in self.marks
+            ],
+            'phase_totals_ms': self.phase_durations(),
+        }
+
+    def save(self, directory='traces', chrome_export=False):
+        """
+        타임라인 JSON 저장
+
+        Args:
+            directory: 저장 폴더
+            chrome_export: True면 Chrome trace-event 파일도 함께 저장
+
+        Returns:
+            str: 저장한 타임라인 파일 경로 (실패 시 None)
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            base = f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}_{self.run_name}"
+            path = os.path.join(directory, f"{base}.json")
+            timeline = self.to_dict()
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(timeline, f, ensure_ascii=False, indent=1, default=str)
+            if chrome_export:
+                with open(os.path.join(directory, f"{base}.trace.json"), 'w', encoding='utf-8') as f:
+                    json.dump(to_chrome_trace(timeline), f, ensure_ascii=False, default=str)
+            logger.info(f"🧭 단계별 타임라인 저장: {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"⚠️  타임라인 저장 실패: {str(e)}")
+            return None
+
+
+def to_chrome_trace(timeline):
+    """
+    JSON 타임라인 → Chrome trace-event 형식
+
+    Args:
+        timeline: Tracer.to_dict() 결과 (또는 저장된 타임라인 JSON)
+
+    Returns:
+        dict: {'traceEvents': [...]} (ts/dur 단위: μs)
+    """
+    threads = {}
+    events = []
+    for span in timeline['spans']:
+        tid = threads.setdefault(span['thread'], len(threads) + 1)
+        events.append({
+            'name': span['name'],
+            'cat': 'booking',
+            'ph': 'X',
+            'ts': int(span['start_ms'] * 1000),
+            'dur': int(span['duration_ms'] * 1000),
+            'pid': 1,
+            'tid': tid,
+            'args': span['attrs'],
+        })
+    for mark in timeline.get('marks', []):
+        tid = threads.setdefault(mark['thread'], len(threads) + 1)
+        events.append({
+            'name': mark['name'],
+            'cat': 'booking',
+            'ph': 'i',
+            's': 'p',
+            'ts': int(mark['at_ms'] * 1000),
+            'pid': 1,
+            'tid': tid,
+            'args': mark['attrs'],
+        })
+    for thread, tid in threads.items():
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': thread}})
+    return {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms',
+        'otherData': {'run': timeline.get('run'), 'started_at': timeline.get('started_at')},
+    }
+
+
+class CommandProfiler:
+    """
+    WebDriver 명령 프로파일러 (opt-in)
+
+    driver.execute를 감싸 모든 WebDriver 명령(= chromedriver HTTP 왕복)의 횟수와
+    소요 시간을 현재 예약 단계별로 집계한다. WebElement 호출(get_attribute, .text,
+    is_displayed 등)도 driver.execute를 거치므로 함께 기록된다.
+    """
+
+    def __init__(self, phase_fn=None):
+        """
+        Args:
+            phase_fn: 현재 단계 이름을 돌려주는 함수 (예: tracer.current_phase)
+        """
+        self.phase_fn = phase_fn or (lambda: None)
+        self._samples = {}  # (단계, 명령) -> [소요 시간(초), ...]
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def attach(self, driver):
+        """드라이버 인스턴스의 execute를 계측 버전으로 교체 (중복 적용 안 함)"""
+        if getattr(driver, '_command_profiler', None) is self:
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = original(driver_command, params)
+                failed = False
+                return result
+            finally:
+                self.record(driver_command, time.perf_counter() - start, failed)
+
+        driver.execute = execute
+        driver._command_profiler = self
+        return driver
+
+    def record(self, command, seconds, failed=False):
+        """명령 한 건 기록 (WebDriver 밖의 명령 - 예: DevTools 직접 연결 - 도 같은 표에 집계)"""
+        key = (self.phase_fn() or '-', command)
+        with self._lock:
+            if failed:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            self._samples.setdefault(key, []).append(seconds)
+
+    def reset(self):
+        """집계 초기화 (실행마다 호출)"""
+        with self._lock:
+            self._samples.clear()
+            self._errors.clear()
+
+    def summary(self):
+        """
+        단계/명령별 집계
+
+        Returns:
+            list: [{'phase', 'command', 'count', 'errors', 'total_ms', 'p50_ms', 'p99_ms'}, ...]
+                  (총 소요 시간 내림차순)
+        """
+        with self._lock:
+            items = [(key, sorted(samples)) for key, samples in self._samples.items()]
+            errors = dict(self._errors)
+        rows = []
+        for (phase, command), samples in items:
+            rows.append({
+                'phase': phase,
+                'command': command,
+                'count': len(samples),
+                'errors': errors.get((phase, command), 0),
+                'total_ms': round(sum(samples) * 1000, 1),
+                'p50_ms': round(percentile(samples, 50) * 1000, 1),
+                'p99_ms': round(percentile(samples, 99) * 1000, 1),
+            })
+        rows.sort(key=lambda r: r['total_ms'], reverse=True)
+        return rows
+
+    def format_table(self, rows=None, limit=30):
+        """요약 표 문자열 (로그 출력용)"""
+        rows = self.summary() if rows is None else rows
+        if not rows:
+            return "WebDriver 명령 기록 없음"
+        total_count = sum(r['count'] for r in rows)
+        total_ms = sum(r['total_ms'] for r in rows)
+        lines = [
+            f"WebDriver 명령 {total_count}회 / {total_ms:.0f}ms",
+            f"{'단계':<16} {'명령':<28} {'횟수':>6} {'오류':>4} {'합계ms':>9} {'p50ms':>8} {'p99ms':>8}",
+        ]
+        for r in rows[:limit]:
+            lines.append(
+                f"{r['phase']:<16} {r['command']:<28} {r['count']:>6} {r['errors']:>4} "
+                f"{r['total_ms']:>9.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+            )
+        if len(rows) > limit:
+            lines.append(f"... 외 {len(rows) - limit}개")
+        return '\n'.join(lines)
+
+
+def percentile(sorted_samples, pct):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(int(-(-pct * len(sorted_samples) // 100)), 1)
+    return sorted_samples[rank - 1]
+
+
+def traced(name, **static_attrs):
+    """
+    GolfBookingBot 메서드를 span으로 감싸는 데코레이터 (self.tracer 사용)
+
+    반환값이 bool 또는 (bool, ...) 이면 span 속성 ok에 기록한다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name, **static_attrs) as span:
+                result = func(self, *args, **kwargs)
+                ok = result[0] if isinstance(result, tuple) and result else result
+                if isinstance(ok, bool):
+                    span.attrs['ok'] = ok
+                return result
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("사용법: python booking_trace.py <타임라인 JSON>")
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        json.dump(to_chrome_trace(json.load(f)), sys.stdout, ensure_ascii=False)
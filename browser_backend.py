@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 백엔드 (자정 직후 반복 구간의 핫 명령: 스크립트 실행 / 페이지 이동 / 클릭)
+
+Selenium 명령 하나는 Python → HTTP → chromedriver → DevTools(CDP) → Chrome을 거친다.
+DevTools 웹소켓에 직접 붙으면 chromedriver HTTP 왕복을 건너뛸 수 있으므로, 타석 확인 루프에서 자주 쓰는
+명령만 백엔드를 거치게 하고 드라이버 생성 / 로그인 / 예약 단계처럼 드문 경로는 그대로 Selenium을 쓴다.
+
+- selenium (기본): 기존과 같은 WebDriver 명령
+- cdp: chromedriver가 띄운 Chrome의 debuggerAddress로 현재 탭의 웹소켓에 직접 연결
+  (websocket-client 필요, 연결할 수 없으면 selenium 백엔드로 진행)
+
+CDP 명령은 driver.execute를 거치지 않으므로 세션 기록 / 지표의 WebDriver 명령 수에는 잡히지 않는다
+(명령 프로파일러를 넘기면 'cdp:<메서드>'로 함께 집계).
+
+    backend = create_backend('cdp', driver, profiler=bot.profiler)
+    backend.navigate(url)
+    slots = backend.run_script(TIME_SLOT_SNAPSHOT_JS)   # CDP에서는 요소가 {}로 온다
+    backend.click("return document.querySelector('button.btn_next');")
+"""
+
+import collections
+import json
+import logging
+import threading
+import time
+import urllib.request
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('selenium', 'cdp')
+DEFAULT_TIMEOUT = 10.0
+
+# XPath로 요소 하나 찾기 (click / BackendElement의 find_script)
+FIND_BY_XPATH_JS = """
+return document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+"""
+
+# XPath로 찾은 요소가 나타날 때까지 페이지 안에서 대기 (CDP는 Promise 하나로 끝남)
+WAIT_FOR_XPATH_JS = """
+var xpath = arguments[0], deadline = Date.now() + arguments[1];
+function find() {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+return new Promise(function (resolve) {
+    (function poll() {
+        if (find()) return resolve(true);
+        if (Date.now() >= deadline) return resolve(false);
+        setTimeout(poll, 20);
+    })();
+});
+"""
+
+# 클릭할 요소를 화면 가운데로 스크롤하고 중심 좌표 반환 (요소 찾기 스크립트를 감쌈)
+CLICK_POINT_JS = """
+(function () {
+    var node = (function () { %s }).apply(null, %s);
+    if (!node) return null;
+    node.scrollIntoView({block: 'center', inline: 'center'});
+    var rect = node.getBoundingClientRect();
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+})()
+"""
+
+
+# Selenium get_cookies() 항목 중 Network.setCookies가 그대로 받는 키 (expiry는 expires로 바꿈)
+COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+
+
+def to_cdp_cookies(cookies):
+    """Selenium 쿠키 목록 → Network.setCookies의 cookies 인자"""
+    converted = []
+    for cookie in cookies:
+        param = {key: cookie[key] for key in COOKIE_FIELDS if cookie.get(key) is not None}
+        if cookie.get('expiry') is not None:
+            param['expires'] = cookie['expiry']
+        converted.append(param)
+    return converted
+
+
+class CdpError(Exception):
+    """DevTools 명령 실패 (프로토콜 오류 / 스크립트 예외)"""
+
+
+class SeleniumBackend:
+    """WebDriver 명령 그대로 (기본 백엔드)"""
+
+    name = 'selenium'
+    # run_script 결과의 요소가 WebElement로 오는지 (False면 BackendElement로 클릭)
+    direct = False
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run_script(self, body, *args, await_promise=False):
+        """
+        스크립트 실행 (execute_script와 같은 함수 본문, 인자는 arguments[i])
+
+        Args:
+            await_promise: 스크립트가 Promise를 반환하면 결과를 기다림
+        """
+        if not await_promise:
+            return self.driver.execute_script(body, *args)
+        return self.driver.execute_async_script(
+            "var done = arguments[arguments.length - 1];"
+            "Promise.resolve((function () {" + body + "}).apply(null, Array.prototype.slice.call(arguments, 0, -1)))"
+            ".then(done, function (e) { done(null); });",
+            *args
+        )
+
+    def navigate(self, url, timeout=DEFAULT_TIMEOUT):
+        self.driver.get(url)
+
+    def wait_for(self, xpath, timeout=DEFAULT_TIMEOUT):
+        """xpath 요소가 나타날 때까지 대기 (나타나면 True)"""
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
+            return True
+        except TimeoutException:
+            return False
+
+    def click(self, find_script, *args):
+        """find_script(요소를 return하는 함수 본문)로 찾은 요소 클릭"""
+        element = self.driver.execute_script(find_script, *args)
+        if element is None:
+            raise NoSuchElementException(f"클릭할 요소 없음: {find_script.strip()[:60]}")
+        element.click()
+
+    def set_cookies(self, cookies):
+        """쿠키 여러 개를 도메인과 상관없이 한 번에 설정 (chromedriver의 CDP 명령, Chrome이 아니면 False)"""
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return False
+        self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': to_cdp_cookies(cookies)})
+        return True
+
+    def current_url(self):
+        return self.driver.current_url
+
+    def close(self):
+        pass
+
+
+class CdpConnection:
+    """DevTools 웹소켓 연결 (요청 id로 응답을 맞추고, 그 사이 온 이벤트는 보관)"""
+
+    def __init__(self, ws_url, timeout=DEFAULT_TIMEOUT, profiler=None):
+        import websocket  # websocket-client (cdp 백엔드에서만 필요)
+
+        # Chrome 111+는 Origin 헤더가 있는 웹소켓 연결을 거부하므로 Origin 없이 연결
+        self.ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True)
+        self.timeout = timeout
+        self.profiler = profiler
+        self.events = collections.deque(maxlen=200)
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def send(self, method, params=None):
+        """
+        명령 전송 후 응답 대기
+
+        Returns:
+            dict: 응답의 result
+
+        Raises:
+            CdpError: 프로토콜 오류 응답
+        """
+        start = time.perf_counter()
+        failed = True
+        try:
+            with self._lock:
+                self._next_id += 1
+                message_id = self._next_id
+                self.ws.settimeout(self.timeout)
+                self.ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+                while True:
+                    message = json.loads(self.ws.recv())
+                    if message.get('id') == message_id:
+                        break
+                    if 'method' in message:
+                        self.events.append(message)
+            if 'error' in message:
+                raise CdpError(f"{method}: {message['error'].get('message')}")
+            failed = False
+            return message.get('result', {})
+        finally:
+            if self.profiler:
+                self.profiler.record(f"cdp:{method}", time.perf_counter() - start, failed)
+
+    def wait_event(self, method, timeout):
+        """
+        이벤트가 올 때까지 대기
+
+        Returns:
+            dict: 이벤트 params (시간 안에 안 오면 None)
+        """
+        import websocket
+
+        deadline = time.perf_counter() + timeout
+        with self._lock:
+            for event in list(self.events):
+                if event['method'] == method:
+                    self.events.remove(event)
+                    return event.get('params', {})
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self.ws.settimeout(remaining)
+                try:
+                    message = json.loads(self.ws.recv())
+                except websocket.WebSocketTimeoutException:
+                    return None
+                if message.get('method') == method:
+                    return message.get('params', {})
+                if 'method' in message:
+                    self.events.append(message)
+
+    def close(self):
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+def page_websocket_url(driver):
+    """
+    chromedriver가 띄운 Chrome에서 드라이버의 현재 탭에 해당하는 DevTools 웹소켓 주소
+
+    chromedriver는 goog:chromeOptions.debuggerAddress(host:port)에 DevTools를 열어 두고,
+    창 핸들이 곧 DevTools target id다.
+    """
+    address = (driver.capabilities.get('goog:chromeOptions') or {}).get('debuggerAddress')
+    if not address:
+        raise CdpError("debuggerAddress 없음 (Chrome이 아닌 드라이버)")
+    with urllib.request.urlopen(f"http://{address}/json", timeout=2) as response:
+        targets = json.load(response)
+    pages = [t for t in targets if t.get('type') == 'page' and t.get('webSocketDebuggerUrl')]
+    handle = driver.current_window_handle
+    target = next((t for t in pages if t.get('id') == handle), None) or (pages[0] if pages else None)
+    if not target:
+        raise CdpError(f"{address}에 연결할 탭 없음")
+    return target['webSocketDebuggerUrl']
+
+
+class CdpBackend:
+    """DevTools 웹소켓 직접 연결 (핫 명령만, 나머지는 같은 드라이버의 Selenium)"""
+
+    name = 'cdp'
+    direct = True
+
+    def __init__(self, driver, timeout=DEFAULT_TIMEOUT, profiler=None):
+        self.driver = driver
+        self.timeout = timeout
+        self.cdp = CdpConnection(page_websocket_url(driver), timeout=timeout, profiler=profiler)
+        self.cdp.send('Page.enable')
+
+    def _evaluate(self, expression, await_promise=False):
+        result = self.cdp.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': await_promise,
+        })
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise CdpError((details.get('exception') or {}).get('description') or details.get('text'))
+        return result.get('result', {}).get('value')
+
+    def run_script(self, body, *args, await_promise=False):
+        """스크립트 실행 (Runtime.evaluate 한 번, 결과는 값으로 - DOM 요소는 {}로 옴)"""
+        return self._evaluate(
+            "(function () {%s}).apply(null, %s)" % (body, json.dumps(args)), await_promise=await_promise
+        )
+
+    def navigate(self, url, timeout=None):
+        """Page.navigate 후 load 이벤트까지 대기 (driver.get과 같은 기준)"""
+        timeout = timeout or self.timeout
+        # chromedriver는 CDP 이동을 모르므로 iframe 안(entryIframe 등)에 있었다면 최상위 문서로 되돌려 둠
+        self.driver.switch_to.default_content()
+        self.cdp.events.clear()
+        result = self.cdp.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise CdpError(f"페이지 이동 실패: {result['errorText']}")
+        if self.cdp.wait_event('Page.loadEventFired', timeout) is None:
+            raise TimeoutException(f"페이지 로드 타임아웃: {url}")
+
+    def wait_for(self, xpath, timeout=DEFAULT_TIMEOUT):
+        return bool(self.run_script(WAIT_FOR_XPATH_JS, xpath, int(timeout * 1000), await_promise=True))
+
+    def click(self, find_script, *args):
+        """
+        요소 클릭: 스크립트로 중심 좌표를 구한 뒤 Input.dispatchMouseEvent (실제 마우스 클릭과 같은 trusted 이벤트)
+        """
+        point = self._evaluate(CLICK_POINT_JS % (find_script, json.dumps(args)))
+        if not point:
+            raise NoSuchElementException(f"클릭할 요소 없음: {find_script.strip()[:60]}")
+        for event_type in ('mousePressed', 'mouseReleased'):
+            self.cdp.send('Input.dispatchMouseEvent', {
+                'type': event_type, 'x': point['x'], 'y': point['y'], 'button': 'left', 'clickCount': 1,
+            })
+
+    def set_cookies(self, cookies):
+        self.cdp.send('Network.setCookies', {'cookies': to_cdp_cookies(cookies)})
+        return True
+
+    def current_url(self):
+        return self._evaluate('location.href')
+
+    def close(self):
+        self.cdp.close()
+
+
+class BackendElement:
+    """
+    백엔드로 클릭하는 요소 (CDP 스크립트 결과에는 WebElement가 없으므로 찾는 스크립트를 들고 있음)
+
+    예약 흐름의 time_btn처럼 .click()만 쓰는 자리에 WebElement 대신 넣는다.
+    """
+
+    def __init__(self, backend, find_script, *args):
+        self.backend = backend
+        self.find_script = find_script
+        self.args = args
+
+    def click(self):
+        self.backend.click(self.find_script, *self.args)
+
+
+def create_backend(name, driver, profiler=None):
+    """
+    백엔드 생성 (cdp 연결에 실패하면 selenium)
+
+    Args:
+        name: 'selenium' 또는 'cdp' (config: browser_backend)
+        profiler: CDP 명령도 함께 집계할 CommandProfiler
+    """
+    if name == 'cdp':
+        try:
+            backend = CdpBackend(driver, profiler=profiler)
+            logger.info("✅ DevTools 직접 연결 (cdp 백엔드)")
+            return backend
+        except Exception as e:
+            logger.warning(f"⚠️  DevTools 직접 연결 실패 - Selenium으로 진행: {type(e).__name__}: {e}")
+    elif name not in BACKENDS:
+        logger.warning(f"⚠️  알 수 없는 browser_backend '{name}' - Selenium으로 진행")
+    return SeleniumBackend(driver)
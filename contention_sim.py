@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 봇 동시 경쟁 시뮬레이터 (같은 슬롯 풀을 두고 book_tomorrow_slot() 여러 개를 동시에 실행)
+
+봇마다 프로세스 하나(ProcessPoolExecutor)를 쓰고, 모두 같은 오픈 시각(release_at)에 출발한다.
+타석 탐색 순서 / priority_seats / 희망 시간 / 동시 실행 수에 따라 승률과 예약까지 걸린 시간이
+어떻게 달라지는지 본다.
+
+백엔드:
+- fake: fake_driver.FakeDriver (브라우저 없음). 슬롯 재고는 프로세스 간 공유 딕셔너리(SlotInventory)
+  타석 페이지를 열 때 이미 팔린 시간은 unselectable로 보이고, '동의하고 예약하기' 클릭 시 원자적으로
+  선점한다 (이미 팔렸으면 실패 페이지). --latency / --jitter로 명령당 왕복 지연을 준다
+- mock: mock_booking_server.MockBookingServer (봇마다 headless Chrome). 서버의 슬롯 재고를 공유하며
+  모의 경쟁자 없이 봇끼리만 경쟁한다
+
+전략(--scenario JSON 파일, 목록):
+    [{"name": "popular", "count": 4, "priority_seats": [11, 10, 1], "time_ladder": ["06:00", "08:00"]},
+     {"name": "shuffle", "count": 4, "order": "shuffle"}]
+    - priority_seats: 우선순위 타석 (나머지는 번호 순으로 뒤에 확인)
+    - order: ascending / descending / shuffle (priority_seats가 없을 때 전체 타석 순서, shuffle은 봇·라운드마다)
+    - time_ladder: 희망 시간 (기본값: 06:00, 08:00 - 저장된 페이지의 예약 가능 시간)
+
+--scale을 여러 번 주면 전략별 봇 수에 배수를 곱해 동시 실행 수별로 비교한다.
+
+사용법:
+    python contention_sim.py --rounds 5
+    python contention_sim.py --scale 1 --scale 2 --scale 4 --skip-sleeps --latency 0.02 --jitter 0.01
+    python contention_sim.py --backend mock --scenario strategies.json --rounds 3 --json
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from multiprocessing import Manager, get_context
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 시뮬레이션 로그가 golf_booking.log에 섞이지 않음
+# (봇 수십 개의 진행 로그가 겹치므로 경고 이상만 남김)
+setup_logging('contention_sim.log', json_file=None, level=logging.WARNING)
+
+from mock_bench import distribution  # noqa: E402
+
+BOOTH_NUMBERS = list(range(1, 12))
+DEFAULT_TIME_LADDER = ['06:00', '08:00']
+DEFAULT_SCENARIO = [
+    {'name': 'popular', 'count': 4, 'priority_seats': [11, 10, 1]},
+    {'name': 'ascending', 'count': 4, 'order': 'ascending'},
+    {'name': 'descending', 'count': 4, 'order': 'descending'},
+    {'name': 'shuffle', 'count': 4, 'order': 'shuffle'},
+]
+ORDERS = ('ascending', 'descending', 'shuffle')
+BOOTH_PATH_RE = re.compile(r'/items/(\d+)')
+
+
+class SlotInventory:
+    """프로세스 간 공유 슬롯 재고 ((타석, 시간) → (봇, 선점 시각))"""
+
+    def __init__(self, manager):
+        self._claims = manager.dict()
+        self._lock = manager.Lock()
+
+    def reset(self):
+        self._claims.clear()
+
+    def taken_times(self, booth):
+        return {time_text for num, time_text in self._claims.keys() if num == booth}
+
+    def claim(self, booth, time_text, owner):
+        """비어 있으면 owner에게 배정 (원자적)"""
+        with self._lock:
+            if (booth, time_text) in self._claims:
+                return False
+            self._claims[(booth, time_text)] = (owner, time.time())
+            return True
+
+    def claims(self):
+        return dict(self._claims)
+
+
+def scan_order(strategy, rng):
+    """전략의 priority_seats (order만 있으면 전체 타석 순서로 변환)"""
+    if strategy.get('priority_seats'):
+        return list(strategy['priority_seats'])
+    order = strategy.get('order', 'ascending')
+    if order not in ORDERS:
+        raise ValueError(f"알 수 없는 탐색 순서: {order} ({', '.join(ORDERS)})")
+    booths = list(BOOTH_NUMBERS)
+    if order == 'descending':
+        booths.reverse()
+    elif order == 'shuffle':
+        rng.shuffle(booths)
+    return booths
+
+
+def _booth_of(url):
+    match = BOOTH_PATH_RE.search(url or '')
+    return int(match.group(1)) if match else None
+
+
+def fake_driver_factory(job, owner):
+    """공유 재고를 쓰는 FakeDriver 만들기 (워커 프로세스 안에서 호출)"""
+    from fake_driver import (
+        ON_LOAD,
+        TRANSITIONS,
+        FakeDriver,
+        FakeSite,
+        go_to_order,
+        select_time,
+        snapshot_time_slots,
+        submit_booking,
+    )
+    from golf_auto_booking import to_24h_slots
+
+    inventory = job['inventory']
+    site = FakeSite(booth_numbers=BOOTH_NUMBERS, open_day=(datetime.now() + timedelta(days=1)).day)
+    chosen = {}
+
+    def mark_taken(driver, document):
+        # 다른 봇이 이미 선점한 시간은 예약 불가로 표시 (hide_time_slots보다 먼저 실행)
+        taken = inventory.taken_times(_booth_of(driver.current_document_url))
+        for slot in to_24h_slots(snapshot_time_slots(document)):
+            if slot['time'] in taken:
+                slot['element'].add_class('unselectable')
+
+    def remember_time(driver, button):
+        slot = next((s for s in to_24h_slots(snapshot_time_slots(driver.document)) if s['element'] is button), None)
+        chosen.update(booth=_booth_of(driver.current_document_url), time=slot['time'] if slot else None)
+        select_time(driver, button)
+
+    def commit(driver, button):
+        if chosen.get('time') and inventory.claim(chosen['booth'], chosen['time'], owner):
+            submit_booking(driver, button)
+        else:
+            driver.navigate(f"{site.order_url}/sold-out")
+
+    rules = {select_time: remember_time, submit_booking: commit, go_to_order: go_to_order}
+    transitions = [(matches, rules.get(action, action)) for matches, action in TRANSITIONS]
+    on_load = dict(ON_LOAD, booth=[mark_taken, *ON_LOAD['booth']])
+    return lambda: FakeDriver(site, transitions=transitions, on_load=on_load,
+                              latency=job['latency'], jitter=job['jitter'], seed=job['seed'])
+
+
+def run_bot(job):
+    """
+    봇 하나 실행 (워커 프로세스): 드라이버 준비 → release_at까지 대기 → book_tomorrow_slot()
+
+    Returns:
+        dict: 승리 여부 / 오픈 → 예약 확정 ms / 잡은 타석·시간 / 확인한 타석 수 / 충돌 여부
+    """
+    from fake_bench import SleepRecorder, fake_config
+    from fixture_server import rewrite_url
+    from golf_auto_booking import GolfBookingBot
+
+    strategy = job['strategy']
+    owner = f"{strategy['name']}#{job['bot']}"
+    rng = random.Random(job['seed'])
+    config = dict(
+        fake_config(strategy.get('time_ladder') or DEFAULT_TIME_LADDER),
+        priority_seats=scan_order(strategy, rng),
+        booth_numbers=BOOTH_NUMBERS,
+    )
+    factory = fake_driver_factory(job, owner) if job['backend'] == 'fake' else None
+    bot = GolfBookingBot(config, driver_factory=factory)
+    if job['backend'] == 'mock':
+        bot.branch['map_url'] = rewrite_url(bot.branch['map_url'], job['base_url'])
+
+    result = {'strategy': strategy['name'], 'bot': job['bot'], 'round': job['round'], 'scale': job['scale'],
+              'won': False, 'booked_ms': None, 'booth': None, 'time': None, 'time_rank': None,
+              'booths_scanned': 0, 'collision': False, 'late_ms': None, 'error': None}
+    if not bot.setup_driver():
+        result['error'] = '드라이버 시작 실패'
+        return result
+    try:
+        remaining = job['release_at'] - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        release_perf = time.perf_counter()
+        result['late_ms'] = round(max(-remaining, 0) * 1000, 1)
+        tracer = bot.start_trace('contention')
+        with (SleepRecorder() if job['skip_sleeps'] else nullcontext()):
+            success, info = bot.book_tomorrow_slot()
+        spans = tracer.span_dicts()
+        # 브라우저 경로는 confirm, HTTP 확정 경로는 http_commit 단계가 끝난 시각
+        confirms = [span for span in spans if span['name'] in ('confirm', 'http_commit')]
+        result.update(
+            won=bool(success),
+            booth=info.get('booth_num'),
+            time=info.get('time'),
+            time_rank=info.get('time_rank'),
+            booths_scanned=sum(1 for span in spans if span['name'] == 'booth_scan'),
+            # 빈 슬롯을 찾아 예약을 시도했지만 다른 봇이 먼저 확정한 경우
+            collision=not success and info.get('time') is not None,
+            error=None if success else info.get('error'),
+        )
+        if success and confirms:
+            offset_ms = (tracer.origin - release_perf) * 1000
+            result['booked_ms'] = round(confirms[-1]['end_ms'] + offset_ms, 1)
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        bot.close_driver()
+    return result
+
+
+def warm_up(seconds):
+    """워커 프로세스 미리 띄우기 (봇 모듈 불러오기 포함 - 첫 라운드 출발이 늦지 않도록)"""
+    import fake_bench  # noqa: F401
+    time.sleep(seconds)
+
+
+def expand(scenario, scale):
+    """전략별 봇 수 × scale 만큼의 (전략, 봇 번호) 목록"""
+    bots = []
+    for strategy in scenario:
+        for index in range(max(1, round(strategy.get('count', 1) * scale))):
+            bots.append((strategy, index + 1))
+    return bots
+
+
+def simulate(scenario, scales=(1,), rounds=3, lead=5.0, backend='fake', latency=0.0, jitter=0.0,
+             skip_sleeps=False, seed=None):
+    """
+    scale마다 rounds번 경쟁 실행
+
+    Returns:
+        list: 봇 실행 결과 (run_bot 반환값)
+    """
+    results = []
+    server = None
+    with Manager() as manager:
+        inventory = SlotInventory(manager)
+        if backend == 'mock':
+            from mock_booking_server import MockBookingServer
+
+            server = MockBookingServer(booth_numbers=BOOTH_NUMBERS, latency=latency, jitter=jitter,
+                                       competitors=0, seed=seed).start()
+        try:
+            for scale in scales:
+                bots = expand(scenario, scale)
+                with ProcessPoolExecutor(max_workers=len(bots), mp_context=get_context('spawn')) as pool:
+                    # 작업이 모두 대기 중이어야 워커가 봇 수만큼 뜬다
+                    list(pool.map(warm_up, [0.5] * len(bots)))
+                    for round_index in range(rounds):
+                        inventory.reset()
+                        release_at = time.time() + lead
+                        if server:
+                            server.arm(release_at)
+                        jobs = [{
+                            'strategy': strategy, 'bot': index, 'round': round_index + 1, 'scale': scale,
+                            'release_at': release_at, 'backend': backend, 'inventory': inventory,
+                            'base_url': server.base_url if server else None,
+                            'latency': latency, 'jitter': jitter, 'skip_sleeps': skip_sleeps,
+                            'seed': None if seed is None else hash((seed, scale, round_index, bot_index)),
+                        } for bot_index, (strategy, index) in enumerate(bots)]
+                        outcome = list(pool.map(run_bot, jobs))
+                        results.extend(outcome)
+                        wins = sum(1 for r in outcome if r['won'])
+                        late = max((r['late_ms'] or 0) for r in outcome)
+                        print(f"  x{scale:g} 라운드 {round_index + 1}/{rounds}: 봇 {len(outcome)}개 / 예약 {wins}건"
+                              + (f" (⚠️ 최대 {late:.0f}ms 늦게 출발 - --lead를 늘리세요)" if late > 50 else ''),
+                              file=sys.stderr)
+        finally:
+            if server:
+                server.stop()
+    return results
+
+
+def summarize(results):
+    """(scale, 전략)별 승률 / 1순위 시간 비율 / 예약 시간 분포 / 확인 타석 수 / 충돌 수"""
+    groups = {}
+    for result in results:
+        groups.setdefault((result['scale'], result['strategy']), []).append(result)
+    summary = []
+    for (scale, name), runs in groups.items():
+        wins = [r for r in runs if r['won']]
+        summary.append({
+            'scale': scale,
+            'strategy': name,
+            'bots': len({r['bot'] for r in runs}),
+            'runs': len(runs),
+            'wins': len(wins),
+            'win_rate': round(len(wins) / len(runs), 3),
+            'first_choice_rate': round(sum(1 for r in wins if r['time_rank'] == 0) / len(runs), 3),
+            'booked_ms': distribution(r['booked_ms'] for r in wins),
+            'booths_scanned': round(sum(r['booths_scanned'] for r in runs) / len(runs), 1),
+            'collisions': sum(1 for r in runs if r['collision']),
+            # 빈 슬롯이 없어서 진 경우(예약 불가)를 뺀 실패 (드라이버 / 페이지 오류)
+            'errors': sum(1 for r in runs if not r['won'] and not r['collision']
+                          and r['error'] and '예약 불가' not in r['error']),
+        })
+    return summary
+
+
+def format_summary(summary):
+    lines = [
+        f"{'배수':>4} {'전략':<14} {'봇':>3} {'승률':>6} {'1순위':>6} {'예약p50ms':>10} {'예약p90ms':>10} "
+        f"{'확인타석':>8} {'충돌':>5} {'오류':>5}",
+    ]
+    for row in summary:
+        booked = row['booked_ms'] or {}
+        lines.append(
+            f"{row['scale']:>4g} {row['strategy']:<14} {row['bots']:>3} {row['win_rate'] * 100:>5.0f}% "
+            f"{row['first_choice_rate'] * 100:>5.0f}% {booked.get('p50', '-'):>10} {booked.get('p90', '-'):>10} "
+            f"{row['booths_scanned']:>8} {row['collisions']:>5} {row['errors']:>5}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='같은 슬롯 풀을 두고 여러 봇을 동시에 돌리는 경쟁 시뮬레이터')
+    parser.add_argument('--scenario', help='전략 목록 JSON 파일 (기본값: popular / ascending / descending / shuffle 각 4개)')
+    parser.add_argument('--scale', type=float, action='append', help='전략별 봇 수 배수 (여러 번 지정 가능, 기본값: 1)')
+    parser.add_argument('--rounds', type=int, default=3, help='배수별 반복 횟수')
+    parser.add_argument('--lead', type=float, default=5.0, help='라운드 시작 후 오픈까지 (초, 프로세스/드라이버 준비 포함)')
+    parser.add_argument('--backend', choices=['fake', 'mock'], default='fake', help='가짜 드라이버 / 모의 서버 + Chrome')
+    parser.add_argument('--latency', type=float, default=0.0, help='명령(fake) / 요청(mock)당 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 흔들림 (표준편차, 초)')
+    parser.add_argument('--skip-sleeps', action='store_true', help='봇 코드 안의 고정 대기(time.sleep) 건너뛰기')
+    parser.add_argument('--seed', type=int, help='난수 시드 (shuffle 순서 / 지연 흔들림)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    scenario = DEFAULT_SCENARIO
+    if args.scenario:
+        with open(args.scenario, 'r', encoding='utf-8') as f:
+            scenario = json.load(f)
+    results = simulate(
+        scenario, scales=args.scale or [1], rounds=args.rounds, lead=args.lead, backend=args.backend,
+        latency=args.latency, jitter=args.jitter, skip_sleeps=args.skip_sleeps, seed=args.seed,
+    )
+    summary = summarize(results)
+    if args.json:
+        json.dump({'summary': summary, 'runs': results}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 없는 예약 알고리즘 벤치마크 (fake_driver.FakeDriver)
+
+Chrome 대신 저장된 페이지를 파이썬 안에서 다루는 가짜 드라이버로 예약 경로를 수천 번 돌려
+"봇 코드 자체"의 계산 시간과 WebDriver 명령 수를 측정한다. 브라우저/네트워크 잡음이 없으므로
+선택자·타석 탐색 순서 같은 알고리즘 변경 전후를 비교하기 좋다.
+
+- replay: 타석 하나 확인 → 시간 선택 → 다음 → 동의 → 완료 확인 (replay_bench.replay_once와 같은 경로)
+- booking: book_tomorrow_slot() 전체 (지도 → iframe → 타석 링크 → 우선순위 순 타석 확인 → 예약)
+  저장된 캘린더의 예약 가능 날짜를 내일 날짜로 바꿔서 실행한다
+
+코드 안의 고정 대기(time.sleep)는 기본적으로 건너뛰고 "건너뛴 대기 시간"으로 따로 집계한다
+(--real-sleep이면 실제로 대기). 단계별 시간은 대기를 뺀 계산 시간이다.
+
+사용법:
+    python fake_bench.py --iterations 2000
+    python fake_bench.py --mode booking --iterations 300 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 벤치마크 로그가 golf_booking.log에 섞이지 않음
+setup_logging('fake_bench.log', json_file=None)
+
+import golf_auto_booking  # noqa: E402
+from booking_trace import percentile  # noqa: E402
+from fake_driver import FakeDriver, FakeSite  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+from replay_bench import replay_config, replay_once  # noqa: E402
+
+class _RecordingTime:
+    """time 모듈 대역: sleep만 기록하고 바로 반환, 나머지는 실제 time 모듈"""
+
+    def __init__(self, real, calls):
+        self._real = real
+        self._calls = calls
+
+    def sleep(self, seconds):
+        self._calls.append(seconds)
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+class SleepRecorder:
+    """
+    golf_auto_booking 안의 time.sleep을 건너뛰고 요청된 대기 시간만 기록
+
+    모듈의 time 이름만 바꾸므로 로그 기록 스레드 등 다른 모듈의 대기는 그대로다.
+    """
+
+    def __init__(self, module=golf_auto_booking):
+        self.module = module
+        self.calls = []
+
+    def __enter__(self):
+        self._real = self.module.time
+        self.module.time = _RecordingTime(self._real, self.calls)
+        return self
+
+    def __exit__(self, *exc):
+        self.module.time = self._real
+
+    def take(self):
+        """지금까지 기록된 대기 합계(초)를 돌려주고 초기화"""
+        total = sum(self.calls)
+        self.calls.clear()
+        return total
+
+
+def fake_config(time_ladder):
+    return dict(replay_config(), time_ladder={'default': time_ladder})
+
+
+def run_booking(bot, site):
+    tracer = bot.start_trace('fake_booking')
+    with tracer.span('total'):
+        success, _ = bot.book_tomorrow_slot()
+    return success, tracer.phase_durations()
+
+
+def run_replay(bot, site):
+    return replay_once(bot, site, site.source_day, [site.slot_time])
+
+
+RUNNERS = {'replay': run_replay, 'booking': run_booking}
+
+
+def bench(mode, iterations, real_sleep=False, site=None):
+    """
+    가짜 드라이버로 mode 경로 반복 실행
+
+    Args:
+        site: FakeSite (None이면 저장된 픽스처, session_replay.ArchiveSite면 기록된 세션)
+
+    Returns:
+        dict: 초당 실행 수 / 성공 수 / 실행당 명령 수 / 건너뛴 대기 / 단계별 통계
+    """
+    site = site or FakeSite()
+    if mode == 'booking':
+        # book_tomorrow_slot은 "내일" 날짜를 찾으므로 캘린더의 예약 가능 날짜를 내일로 바꿔 둔다
+        site.open_day = (datetime.now() + timedelta(days=1)).day
+    bot = GolfBookingBot(fake_config([site.slot_time]), driver_factory=lambda: FakeDriver(site))
+    if not bot.setup_driver():
+        raise RuntimeError("가짜 드라이버를 시작할 수 없습니다")
+    runner = RUNNERS[mode]
+    samples = []
+    skipped = []
+    successes = 0
+    try:
+        commands_before = bot.driver.command_count
+        with (nullcontext() if real_sleep else SleepRecorder()) as recorder:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                success, phases = runner(bot, site)
+                successes += 1 if success else 0
+                samples.append(phases)
+                if recorder:
+                    skipped.append(recorder.take())
+            elapsed = time.perf_counter() - started
+        commands = bot.driver.command_count - commands_before
+    finally:
+        bot.close_driver()
+    return {
+        'mode': mode,
+        'iterations': iterations,
+        'success': successes,
+        'elapsed_s': round(elapsed, 3),
+        'per_second': round(iterations / elapsed, 1) if elapsed else None,
+        'commands_per_run': round(commands / iterations, 1) if iterations else None,
+        'skipped_sleep_s': round(sum(skipped) / len(skipped), 2) if skipped else 0.0,
+        'phases': summarize(samples),
+    }
+
+
+def summarize(samples):
+    """단계별 평균 / p50 / p95 (ms)"""
+    names = []
+    for sample in samples:
+        names.extend(name for name in sample if name not in names)
+    summary = {}
+    for name in names:
+        values = sorted(sample[name] for sample in samples if name in sample)
+        summary[name] = {
+            'count': len(values),
+            'mean_ms': round(sum(values) / len(values), 3),
+            'p50_ms': round(percentile(values, 50), 3),
+            'p95_ms': round(percentile(values, 95), 3),
+        }
+    return summary
+
+
+def format_report(report):
+    lines = [
+        f"{report['mode']} {report['iterations']}회 / 성공 {report['success']}회 / "
+        f"{report['per_second']}회/초 / 실행당 명령 {report['commands_per_run']}개 / "
+        f"건너뛴 대기 {report['skipped_sleep_s']}초/회",
+        f"{'단계':<14} {'횟수':>6} {'평균ms':>9} {'p50ms':>9} {'p95ms':>9}",
+    ]
+    for phase, stats in report['phases'].items():
+        lines.append(
+            f"{phase:<14} {stats['count']:>6} {stats['mean_ms']:>9.3f} "
+            f"{stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 드라이버로 예약 알고리즘 벤치마크 (브라우저 없음)')
+    parser.add_argument('--mode', choices=sorted(RUNNERS), default='replay', help='실행 경로')
+    parser.add_argument('--iterations', type=int, default=1000, help='반복 횟수')
+    parser.add_argument('--real-sleep', action='store_true', help='코드 안의 time.sleep을 실제로 대기')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    report = bench(args.mode, args.iterations, real_sleep=args.real_sleep)
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_report(report))
+    sys.exit(0 if report['success'] == report['iterations'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 없는 최소 DOM (fake_driver.py용)
+
+- html.parser로 저장된 페이지를 트리로 변환 (표준 라이브러리만 사용)
+- 예약 코드가 쓰는 XPath 1.0 부분 집합: //, /, |, ., .., 축(ancestor:: 등), *, text(), node(),
+  @속성, [조건] (and / or / not / contains / starts-with / normalize-space / 위치 번호)
+- CSS 선택자 부분 집합: 태그, #id, .class, [속성], [속성=|*=|^=|$=|~="값"], 자손/자식(>) 결합자, 쉼표
+
+텍스트 노드는 자식 목록 안의 str로 표현한다.
+"""
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+             'param', 'source', 'track', 'wbr'}
+
+
+class Node:
+    """요소 노드 (문서 루트는 tag가 '#document')"""
+
+    __slots__ = ('tag', 'attrs', 'children', 'parent', 'order', 'flat')
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+        self.order = 0
+        # 문서 노드만 사용: 자손 요소 목록 캐시 (구조가 바뀌면 renumber()로 다시 만듦)
+        self.flat = None
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attrs}>"
+
+    @property
+    def classes(self):
+        return self.attrs.get('class', '').split()
+
+    def has_class(self, name):
+        return name in self.classes
+
+    def add_class(self, name):
+        if not self.has_class(name):
+            self.attrs['class'] = ' '.join(self.classes + [name])
+
+    def remove_class(self, predicate):
+        """predicate(클래스 이름)가 참인 클래스 제거"""
+        self.attrs['class'] = ' '.join(c for c in self.classes if not predicate(c))
+
+    def elements(self):
+        return [child for child in self.children if child.__class__ is Node]
+
+    def iter_descendants(self):
+        """자손 요소 (문서 순서, 자신 제외)"""
+        if self.flat is not None:
+            yield from self.flat
+            return
+        stack = [child for child in reversed(self.children) if child.__class__ is Node]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.children:
+                stack.extend([child for child in reversed(node.children) if child.__class__ is Node])
+
+    def iter_ancestors(self):
+        """조상 요소 (가까운 순서, 문서 루트 제외)"""
+        node = self.parent
+        while node is not None and node.tag != '#document':
+            yield node
+            node = node.parent
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def closest(self, tag):
+        """자신 또는 가장 가까운 조상 중 tag 요소"""
+        if self.tag == tag:
+            return self
+        return next((node for node in self.iter_ancestors() if node.tag == tag), None)
+
+    def text_content(self):
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return ''.join(parts)
+
+    def previous_element_sibling(self):
+        if self.parent is None:
+            return None
+        siblings = self.parent.elements()
+        index = siblings.index(self)
+        return siblings[index - 1] if index > 0 else None
+
+    def clone(self, parent=None):
+        """트리 복사 (저장된 페이지를 한 번만 파싱하고 로드마다 복사해서 사용)"""
+        flat = [] if self.flat is not None else None
+        copy = self._copy(parent, flat)
+        copy.flat = flat
+        return copy
+
+    def _copy(self, parent, flat):
+        # 문서 순서(전위)로 복사하므로 flat이 곧 자손 캐시
+        copy = Node(self.tag, dict(self.attrs), parent)
+        copy.order = self.order
+        if flat is not None and parent is not None:
+            flat.append(copy)
+        copy.children = [child if child.__class__ is str else child._copy(copy, flat) for child in self.children]
+        return copy
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.document = Node('#document')
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: (value if value is not None else '') for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {name: (value if value is not None else '') for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html):
+    """HTML 문자열 → 문서 노드"""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    renumber(builder.document)
+    return builder.document
+
+
+def renumber(document):
+    """문서 순서 번호 / 자손 캐시 다시 만들기 (노드를 옮긴 뒤 호출)"""
+    document.flat = None
+    flat = list(document.iter_descendants())
+    for index, node in enumerate(flat, 1):
+        node.order = index
+    document.flat = flat
+
+
+def to_html(node):
+    """노드 → HTML 문자열 (page_source용, 속성 값만 이스케이프)"""
+    if isinstance(node, str):
+        return node.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    inner = ''.join(to_html(child) for child in node.children)
+    if node.tag == '#document':
+        return inner
+    attrs = ''.join(
+        f' {name}="{value.replace("&", "&amp;").replace(chr(34), "&quot;")}"' for name, value in node.attrs.items()
+    )
+    if node.tag in VOID_TAGS:
+        return f"<{node.tag}{attrs}>"
+    return f"<{node.tag}{attrs}>{inner}</{node.tag}>"
+
+
+def string_value(item):
+    return item if isinstance(item, str) else item.text_content()
+
+
+# ==================== XPath ====================
+
+_XPATH_TOKEN_RE = re.compile(r"""\s*(?:
+    (?P<str>'[^']*'|"[^"]*")
+  | (?P<num>\d+(?:\.\d+)?)
+  | (?P<op>//|::|!=|\.\.|[/|\[\](),=@*.])
+  | (?P<name>[A-Za-z_][\w-]*)
+)""", re.VERBOSE)
+
+
+class XPathError(ValueError):
+    pass
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _XPATH_TOKEN_RE.match(expression, position)
+        if not match or match.end() == position:
+            raise XPathError(f"지원하지 않는 XPath: {expression!r} (위치 {position})")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'str':
+            value = value[1:-1]
+        elif kind == 'num':
+            value = float(value)
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+class _XPathParser:
+    """재귀 하강 파서 → 튜플 AST"""
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def accept(self, value):
+        kind, token = self.peek()
+        if kind in ('op', 'name') and token == value:
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, value):
+        if not self.accept(value):
+            raise XPathError(f"{self.expression!r}: '{value}' 필요 (토큰 {self.peek()})")
+
+    def parse(self):
+        expr = self.parse_or()
+        if self.index != len(self.tokens):
+            raise XPathError(f"{self.expression!r}: 해석하지 못한 토큰 {self.peek()}")
+        return expr
+
+    def parse_or(self):
+        expr = self.parse_and()
+        while self.accept('or'):
+            expr = ('or', expr, self.parse_and())
+        return expr
+
+    def parse_and(self):
+        expr = self.parse_equality()
+        while self.accept('and'):
+            expr = ('and', expr, self.parse_equality())
+        return expr
+
+    def parse_equality(self):
+        expr = self.parse_union()
+        kind, token = self.peek()
+        if kind == 'op' and token in ('=', '!='):
+            self.index += 1
+            expr = ('eq', expr, self.parse_union(), token == '!=')
+        return expr
+
+    def parse_union(self):
+        expr = self.parse_value()
+        while self.accept('|'):
+            expr = ('union', expr, self.parse_value())
+        return expr
+
+    def parse_value(self):
+        kind, token = self.peek()
+        if kind == 'str':
+            self.index += 1
+            return ('lit', token)
+        if kind == 'num':
+            self.index += 1
+            return ('num', token)
+        if kind == 'op' and token == '(':
+            self.index += 1
+            expr = self.parse_or()
+            self.expect(')')
+            predicates = []
+            while self.accept('['):
+                predicates.append(self.parse_or())
+                self.expect(']')
+            return ('filter', expr, predicates) if predicates else expr
+        if kind == 'name' and self.peek(1) == ('op', '(') and token not in ('text', 'node'):
+            self.index += 2
+            args = []
+            if not self.accept(')'):
+                args.append(self.parse_or())
+                while self.accept(','):
+                    args.append(self.parse_or())
+                self.expect(')')
+            return ('func', token, args)
+        return self.parse_path()
+
+    def parse_path(self):
+        absolute = None
+        if self.accept('//'):
+            absolute = '//'
+        elif self.accept('/'):
+            absolute = '/'
+        steps = [('//' if absolute == '//' else '/', self.parse_step())]
+        while True:
+            if self.accept('//'):
+                steps.append(('//', self.parse_step()))
+            elif self.accept('/'):
+                steps.append(('/', self.parse_step()))
+            else:
+                break
+        if absolute is None and len(steps) == 1:
+            # 조건식 안에서 자주 쓰는 @속성 / text() / . 은 경로 평가 없이 바로 계산
+            axis, test, predicates = steps[0][1]
+            if not predicates and axis == 'attribute':
+                return ('attr', test)
+            if not predicates and axis == 'child' and test == 'text()':
+                return ('texts',)
+            if not predicates and axis == 'self':
+                return ('self',)
+        return ('path', absolute, steps)
+
+    def parse_step(self):
+        if self.accept('.'):
+            return ('self', None, [])
+        if self.accept('..'):
+            return ('parent', None, [])
+        if self.accept('@'):
+            kind, token = self.peek()
+            self.index += 1
+            return ('attribute', token, [])
+        axis = 'child'
+        kind, token = self.peek()
+        if kind == 'name' and self.peek(1) == ('op', '::'):
+            axis = token
+            self.index += 2
+        kind, token = self.peek()
+        if kind == 'op' and token == '*':
+            self.index += 1
+            test = '*'
+        elif kind == 'name' and token in ('text', 'node') and self.peek(1) == ('op', '('):
+            self.index += 2
+            self.expect(')')
+            test = token + '()'
+        elif kind == 'name':
+            self.index += 1
+            test = token.lower()
+        else:
+            raise XPathError(f"{self.expression!r}: 노드 이름 필요 (토큰 {self.peek()})")
+        predicates = []
+        while self.accept('['):
+            predicates.append(self.parse_or())
+            self.expect(']')
+        return (axis, test, predicates)
+
+
+@lru_cache(maxsize=512)
+def compile_xpath(expression):
+    return _XPathParser(expression).parse()
+
+
+def _axis(node, axis, test):
+    if isinstance(node, str):
+        return []
+    if axis == 'self':
+        return [node]
+    if axis == 'parent':
+        return [node.parent] if node.parent is not None and node.parent.tag != '#document' else []
+    if axis == 'attribute':
+        return [node.attrs[test]] if test in node.attrs else []
+    if axis == 'child':
+        if test == 'text()':
+            return [child for child in node.children if isinstance(child, str)]
+        if test == 'node()':
+            return list(node.children)
+        return node.elements()
+    if axis == 'descendant':
+        return list(node.flat) if node.flat is not None else list(node.iter_descendants())
+    if axis == 'descendant-or-self':
+        return [node] + list(node.iter_descendants())
+    if axis == 'ancestor':
+        return list(node.iter_ancestors())
+    if axis == 'ancestor-or-self':
+        return [node] + list(node.iter_ancestors())
+    if axis in ('following-sibling', 'preceding-sibling'):
+        if node.parent is None:
+            return []
+        siblings = node.parent.elements()
+        index = siblings.index(node)
+        return siblings[index + 1:] if axis == 'following-sibling' else list(reversed(siblings[:index]))
+    raise XPathError(f"지원하지 않는 축: {axis}")
+
+
+def _node_filter(items, test):
+    if test == 'node()':
+        return items
+    if test == 'text()':
+        return [item for item in items if item.__class__ is str]
+    if test == '*':
+        return [item for item in items if item.__class__ is Node]
+    return [item for item in items if item.__class__ is Node and item.tag == test]
+
+
+def _apply_step(contexts, step):
+    axis, test, predicates = step
+    results = []
+    seen = set()
+    for context in contexts:
+        candidates = _axis(context, axis, test)
+        if axis not in ('self', 'parent', 'attribute'):
+            candidates = _node_filter(candidates, test)
+        for predicate in predicates:
+            size = len(candidates)
+            candidates = [
+                item for position, item in enumerate(candidates, 1)
+                if _predicate(_evaluate(predicate, item, position, size), position)
+            ]
+        for item in candidates:
+            if isinstance(item, str):
+                results.append(item)
+            elif id(item) not in seen:
+                seen.add(id(item))
+                results.append(item)
+    return results
+
+
+def _descendant_or_self(contexts):
+    results = []
+    seen = set()
+    for context in contexts:
+        if isinstance(context, str):
+            continue
+        for node in [context] + list(context.iter_descendants()):
+            if id(node) not in seen:
+                seen.add(id(node))
+                results.append(node)
+    return results
+
+
+def _sort(items):
+    if all(isinstance(item, Node) for item in items):
+        items.sort(key=lambda node: node.order)
+    return items
+
+
+def _evaluate_path(path, context):
+    _, absolute, steps = path
+    nodes = [context.root()] if absolute else [context]
+    for separator, step in steps:
+        if separator == '//':
+            axis, test, predicates = step
+            if axis == 'child' and test not in ('text()', 'node()') and not any(map(_positional, predicates)):
+                # //x 는 자손 전체에서 바로 찾기 (descendant-or-self 목록을 만들지 않음)
+                nodes = _apply_step(nodes, ('descendant', test, predicates))
+                continue
+            nodes = _descendant_or_self(nodes)
+        nodes = _apply_step(nodes, step)
+    return _sort(nodes) if len(steps) > 1 or absolute else nodes
+
+
+def _positional(expr):
+    """위치에 따라 결과가 달라지는 조건식인지 ([2], [last()], [position() < 3] 등)"""
+    if not isinstance(expr, tuple):
+        return False
+    if expr[0] == 'num' or (expr[0] == 'func' and expr[1] in ('position', 'last')):
+        return True
+    return any(_positional(part) for part in expr[1:] if isinstance(part, tuple)) or any(
+        _positional(arg) for part in expr[1:] if isinstance(part, list) for arg in part
+    )
+
+
+def _to_string(value):
+    if isinstance(value, list):
+        return string_value(value[0]) if value else ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+def _to_bool(value):
+    # 노드 목록 / 문자열은 비어 있지 않으면, 숫자는 0이 아니면 참
+    return bool(value)
+
+
+def _predicate(value, position):
+    if isinstance(value, float):
+        return position == value
+    return _to_bool(value)
+
+
+def _equals(left, right):
+    if isinstance(left, list) and isinstance(right, str):
+        return any(string_value(item) == right for item in left)
+    if isinstance(left, list) or isinstance(right, list):
+        left_items = [string_value(i) for i in left] if isinstance(left, list) else [_to_string(left)]
+        right_items = [string_value(i) for i in right] if isinstance(right, list) else [_to_string(right)]
+        if isinstance(left, float) or isinstance(right, float):
+            try:
+                return any(float(a) == float(b) for a in left_items for b in right_items)
+            except ValueError:
+                return False
+        return any(a == b for a in left_items for b in right_items)
+    if isinstance(left, float) or isinstance(right, float):
+        try:
+            return float(_to_string(left)) == float(_to_string(right))
+        except ValueError:
+            return False
+    return _to_string(left) == _to_string(right)
+
+
+def _evaluate(expr, context, position=1, size=1):
+    kind = expr[0]
+    if kind == 'lit':
+        return expr[1]
+    if kind == 'num':
+        return expr[1]
+    if kind == 'attr':
+        value = context.attrs.get(expr[1]) if isinstance(context, Node) else None
+        return [] if value is None else [value]
+    if kind == 'texts':
+        return [child for child in context.children if isinstance(child, str)] if isinstance(context, Node) else []
+    if kind == 'self':
+        return [context]
+    if kind == 'path':
+        return _evaluate_path(expr, context)
+    if kind == 'union':
+        left = _evaluate(expr[1], context, position, size)
+        right = _evaluate(expr[2], context, position, size)
+        merged = list(left)
+        seen = {id(item) for item in left}
+        merged.extend(item for item in right if id(item) not in seen)
+        return _sort(merged)
+    if kind == 'filter':
+        items = _evaluate(expr[1], context, position, size)
+        for predicate in expr[2]:
+            count = len(items)
+            items = [item for index, item in enumerate(items, 1)
+                     if _predicate(_evaluate(predicate, item, index, count), index)]
+        return items
+    if kind == 'or':
+        return _to_bool(_evaluate(expr[1], context, position, size)) or _to_bool(_evaluate(expr[2], context, position, size))
+    if kind == 'and':
+        return _to_bool(_evaluate(expr[1], context, position, size)) and _to_bool(_evaluate(expr[2], context, position, size))
+    if kind == 'eq':
+        result = _equals(_evaluate(expr[1], context, position, size), _evaluate(expr[2], context, position, size))
+        return not result if expr[3] else result
+    if kind == 'func':
+        return _call(expr[1], [_evaluate(arg, context, position, size) for arg in expr[2]], context, position, size)
+    raise XPathError(f"알 수 없는 식: {expr!r}")
+
+
+def _call(name, args, context, position, size):
+    if name == 'contains':
+        return _to_string(args[1]) in _to_string(args[0])
+    if name == 'starts-with':
+        return _to_string(args[0]).startswith(_to_string(args[1]))
+    if name == 'not':
+        return not _to_bool(args[0])
+    if name == 'normalize-space':
+        text = _to_string(args[0]) if args else string_value(context)
+        return ' '.join(text.split())
+    if name == 'string':
+        return _to_string(args[0]) if args else string_value(context)
+    if name == 'position':
+        return float(position)
+    if name == 'last':
+        return float(size)
+    if name == 'count':
+        return float(len(args[0]))
+    if name == 'true':
+        return True
+    if name == 'false':
+        return False
+    raise XPathError(f"지원하지 않는 XPath 함수: {name}()")
+
+
+def xpath(context, expression):
+    """
+    XPath 평가 → 요소 목록 (문서 순서)
+
+    text() 등 텍스트 결과는 제외한다 (WebDriver도 요소만 돌려줌).
+    """
+    result = _evaluate(compile_xpath(expression), context)
+    if not isinstance(result, list):
+        raise XPathError(f"요소를 돌려주지 않는 XPath: {expression!r}")
+    return [item for item in result if isinstance(item, Node)]
+
+
+# ==================== CSS ====================
+
+_CSS_PART_RE = re.compile(r"""
+    (?P<tag>^[a-zA-Z][\w-]*|^\*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+))?\s*\]
+""", re.VERBOSE)
+
+
+@lru_cache(maxsize=512)
+def compile_css(selector):
+    """'a b > c, d' → [[(결합자, 조건), ...], ...] (오른쪽부터 검사하도록 뒤집어 저장)"""
+    groups = []
+    for group in selector.split(','):
+        tokens = re.findall(r'>|[^\s>]+(?:\[[^\]]*\])*', group.replace('>', ' > '))
+        compounds = []
+        combinator = ' '
+        for token in tokens:
+            if token == '>':
+                combinator = '>'
+                continue
+            compounds.append((combinator, _compile_compound(token, selector)))
+            combinator = ' '
+        groups.append(list(reversed(compounds)))
+    return groups
+
+
+def _compile_compound(token, selector):
+    conditions = []
+    position = 0
+    while position < len(token):
+        match = _CSS_PART_RE.match(token, position)
+        if not match or match.end() == position:
+            raise ValueError(f"지원하지 않는 CSS 선택자: {selector!r}")
+        if match.group('tag'):
+            if match.group('tag') != '*':
+                conditions.append(('tag', match.group('tag').lower(), None))
+        elif match.group('id'):
+            conditions.append(('=', 'id', match.group('id')))
+        elif match.group('cls'):
+            conditions.append(('~=', 'class', match.group('cls')))
+        else:
+            value = match.group('value')
+            if value and value[0] in '"\'':
+                value = value[1:-1]
+            conditions.append((match.group('op') or 'has', match.group('attr'), value))
+        position = match.end()
+    return conditions
+
+
+def _matches_compound(node, conditions):
+    for op, name, value in conditions:
+        if op == 'tag':
+            if node.tag != name:
+                return False
+            continue
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if op == '=' and actual != value:
+            return False
+        if op == '~=' and value not in actual.split():
+            return False
+        if op == '*=' and value not in actual:
+            return False
+        if op == '^=' and not actual.startswith(value):
+            return False
+        if op == '$=' and not actual.endswith(value):
+            return False
+    return True
+
+
+def _matches(node, compounds):
+    _, conditions = compounds[0]
+    if not _matches_compound(node, conditions):
+        return False
+    if len(compounds) == 1:
+        return True
+    combinator = compounds[0][0]
+    if combinator == '>':
+        parent = node.parent
+        return parent is not None and parent.tag != '#document' and _matches(parent, compounds[1:])
+    return any(_matches(ancestor, compounds[1:]) for ancestor in node.iter_ancestors())
+
+
+@lru_cache(maxsize=512)
+def _required_tags(selector):
+    """모든 그룹의 맨 오른쪽 조건에 태그가 있으면 그 태그 집합 (태그로 먼저 거르기)"""
+    tags = set()
+    for group in compile_css(selector):
+        tag = next((name for op, name, _ in group[0][1] if op == 'tag'), None)
+        if tag is None:
+            return None
+        tags.add(tag)
+    return frozenset(tags)
+
+
+def css_select(context, selector):
+    """CSS 선택자 → 자손 요소 목록 (문서 순서)"""
+    groups = compile_css(selector)
+    tags = _required_tags(selector)
+    nodes = context.iter_descendants()
+    if tags is not None:
+        nodes = [node for node in nodes if node.tag in tags]
+    return [node for node in nodes if any(_matches(node, group) for group in groups)]
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 없는 가짜 WebDriver (벤치마크 / 예약 알고리즘 검증용)
+
+저장된 네이버 페이지(fixture_server.py와 같은 파일)를 fake_dom.py로 한 번 파싱해 두고,
+GolfBookingBot이 쓰는 WebDriver API(find_element(s), click, text, get_attribute, execute_script,
+switch_to.frame, current_url, page_source, add_cookie ...)를 파이썬 안에서 처리한다.
+
+- 공개 메서드는 모두 self.execute(명령, 인자)를 거치므로 CommandProfiler / FlightRecorder /
+  메트릭 계측에 실제 드라이버와 같은 명령 이름으로 기록된다
+- 네이버 URL을 그대로 받는다 (재작성 불필요)
+    map.naver.com/.../place/{id}      → entryIframe 하나짜리 지도 페이지
+    pcmap.place.naver.com/place/{id}  → 예약 탭 + 타석 링크 목록
+    booking.naver.com/.../items/{N}   → booking_dateandtime.html
+    booking.naver.com/.../order       → booking.html
+    booking.naver.com/my/bookings/... → booking_complete.html
+- 화면 전환은 TRANSITIONS 규칙으로 흉내 낸다
+    페이지 로드 시 시간 버튼(btn_time) 목록 숨김 → 날짜(calendar_date) 클릭 시 표시
+    시간 클릭 → '다음' 활성화 → 예약 확인 페이지 → '동의하고 예약하기' → popup=bookingCompletion
+- 암묵적 대기(implicitly_wait)는 기록만 한다. 없는 요소는 바로 NoSuchElementException
+
+사용법:
+    bot = GolfBookingBot(config, driver_factory=FakeDriver)
+    bot = GolfBookingBot(config, driver_factory=lambda: FakeDriver(FakeSite(open_day=26)))
+"""
+
+import logging
+import random
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from fake_dom import Node, css_select, parse_html, renumber, to_html, xpath
+from fixture_server import (
+    DEFAULT_BIZ_ID,
+    DEFAULT_BOOKING_ID,
+    FIXTURE_DAY,
+    FIXTURE_TIME,
+    load_fixture,
+    map_page_html,
+    place_page_html,
+    strip_assets,
+)
+
+logger = logging.getLogger(__name__)
+
+BOOKING_ORIGIN = 'https://booking.naver.com'
+PLACE_ORIGIN = 'https://pcmap.place.naver.com'
+BLANK_URL = 'about:blank'
+NOT_FOUND_HTML = '<html><head><title>404</title></head><body>not found</body></html>'
+
+
+class FakeSite:
+    """
+    URL → 문서 라우팅 (페이지는 한 번만 파싱하고 로드할 때마다 복사)
+
+    open_day를 주면 저장된 캘린더의 예약 가능 날짜(source_day) 숫자를 그 날짜로 바꿔
+    book_tomorrow_slot()처럼 "내일" 날짜를 찾는 경로도 그대로 돌릴 수 있다.
+    """
+
+    # 저장된 페이지 기준 예약 가능한 날짜 / 시간
+    source_day = FIXTURE_DAY
+    slot_time = FIXTURE_TIME
+
+    def __init__(self, biz_id=DEFAULT_BIZ_ID, booth_numbers=range(1, 12),
+                 booking_id=DEFAULT_BOOKING_ID, open_day=None):
+        self.biz_id = biz_id
+        self.booth_numbers = list(booth_numbers)
+        self.booking_id = booking_id
+        self.open_day = open_day
+        self._templates = {}
+
+    def booth_url(self, booth_num):
+        return f"{BOOKING_ORIGIN}/booking/6/bizes/{self.biz_id}/items/{booth_num}"
+
+    @property
+    def order_url(self):
+        return f"{BOOKING_ORIGIN}/booking/6/bizes/{self.biz_id}/order"
+
+    @property
+    def complete_url(self):
+        return f"{BOOKING_ORIGIN}/my/bookings/{self.booking_id}?popup=bookingCompletion"
+
+    def page_for(self, url):
+        """
+        URL별 페이지
+
+        Returns:
+            tuple: (페이지 종류, 캐시 키, HTML 만드는 함수)
+        """
+        parts = urlsplit(url)
+        host, path = parts.netloc, parts.path
+        if host == 'map.naver.com':
+            match = re.search(r'/place/(\d+)', path)
+            place_id = match.group(1) if match else '0'
+            return 'map', f"map:{place_id}", lambda: map_page_html(f"{PLACE_ORIGIN}/place/{place_id}")
+        if host == urlsplit(PLACE_ORIGIN).netloc:
+            return 'place', 'place', lambda: place_page_html(
+                (num, self.booth_url(num)) for num in self.booth_numbers)
+        if host == urlsplit(BOOKING_ORIGIN).netloc:
+            if path == urlsplit(self.order_url).path:
+                return 'order', 'order', lambda: strip_assets(load_fixture('booking.html'))
+            if re.match(r'^/booking/\d+/bizes/\d+/items/\d+', path):
+                return 'booth', 'booth', lambda: strip_assets(load_fixture('booking_dateandtime.html'))
+            if path.startswith('/my/bookings/'):
+                return 'complete', 'complete', lambda: strip_assets(load_fixture('booking_complete.html'))
+        if url == BLANK_URL:
+            return 'blank', 'blank', lambda: '<html><head></head><body></body></html>'
+        return 'not_found', 'not_found', lambda: NOT_FOUND_HTML
+
+    def load(self, url):
+        """
+        URL의 새 문서
+
+        Returns:
+            tuple: (페이지 종류, 문서 노드)
+        """
+        kind, key, build = self.page_for(url)
+        template = self._templates.get(key)
+        if template is None:
+            template = parse_html(build())
+            if kind == 'booth' and self.open_day:
+                relabel_open_day(template, self.open_day, self.source_day)
+            self._templates[key] = template
+        return kind, template.clone()
+
+
+def relabel_open_day(document, day, source_day=FIXTURE_DAY):
+    """캘린더에서 예약 가능한 source_day 버튼의 숫자를 day로 (원래 day 숫자는 source_day로 맞바꿈)"""
+    if day == source_day:
+        return
+    spans = css_select(document, 'button.calendar_date span.num')
+    target = next((s for s in spans if s.text_content().strip() == str(source_day)
+                   and not s.parent.has_class('unselectable')), None)
+    if target is None:
+        return
+    for span in spans:
+        if span is not target and span.text_content().strip() == str(day):
+            span.children = [str(source_day)]
+    target.children = [str(day)]
+
+
+# ==================== 화면 전환 규칙 ====================
+
+def hide_time_slots(driver, document):
+    """페이지 로드 시: 시간 버튼 목록을 문서에서 떼어 둠 (날짜를 고르기 전에는 없음)"""
+    lists = []
+    for button in css_select(document, 'button.btn_time'):
+        time_list = button.closest('ul') or button
+        if all(time_list is not seen for seen in lists):
+            lists.append(time_list)
+    for time_list in lists:
+        parent = time_list.parent
+        driver.page_state.setdefault('hidden_times', []).append(
+            (parent, parent.children.index(time_list), time_list))
+        parent.children.remove(time_list)
+    if lists:
+        renumber(document)
+
+
+def select_calendar_date(driver, button):
+    for selected in css_select(driver.document, 'button.calendar_date.selected'):
+        selected.remove_class(lambda name: name == 'selected')
+    button.add_class('selected')
+    hidden = driver.page_state.pop('hidden_times', [])
+    for parent, index, time_list in hidden:
+        time_list.parent = parent
+        parent.children.insert(index, time_list)
+    if hidden:
+        renumber(driver.document)
+
+
+def select_time(driver, button):
+    for selected in css_select(driver.document, 'button.btn_time.selected'):
+        selected.remove_class(lambda name: name == 'selected')
+    button.add_class('selected')
+    for next_button in css_select(driver.document, 'button[data-click-code="nextbuttonview.request"]'):
+        next_button.remove_class(lambda name: 'disabled' in name)
+
+
+def go_to_order(driver, button):
+    driver.navigate(driver.site.order_url)
+
+
+def submit_booking(driver, button):
+    driver.navigate(driver.site.complete_url)
+
+
+def follow_link(driver, link):
+    driver.navigate(urljoin(driver.current_document_url, link.attrs['href']))
+
+
+def _has_click_code(code):
+    return lambda node: node.tag == 'button' and node.attrs.get('data-click-code') == code
+
+
+# (대상 판별, 동작): 클릭된 요소와 그 조상 중 처음 맞는 규칙 하나만 실행 (이벤트 위임과 같은 방식)
+TRANSITIONS = [
+    (lambda node: node.tag == 'button' and node.has_class('calendar_date'), select_calendar_date),
+    (lambda node: node.tag == 'button' and node.has_class('btn_time'), select_time),
+    (_has_click_code('nextbuttonview.request'), go_to_order),
+    (_has_click_code('submitbutton.submit'), submit_booking),
+    (lambda node: node.tag == 'a' and node.attrs.get('href', '#')[:1] not in ('#', '')
+     and node.attrs.get('target') != '_blank', follow_link),
+]
+
+# 페이지 종류 → 로드 직후 실행할 함수
+ON_LOAD = {
+    'booth': [hide_time_slots],
+}
+
+
+# ==================== 스크립트 ====================
+
+def snapshot_time_slots(document):
+    """TIME_SLOT_SNAPSHOT_JS와 같은 결과 (element는 Node)"""
+    slots = []
+    for button in css_select(document, 'button.btn_time'):
+        time_list = button.closest('ul')
+        title = time_list.previous_element_sibling() if time_list else None
+        slots.append({
+            'element': button,
+            'text': button.text_content().strip(),
+            'period': title.text_content().strip() if title is not None and title.has_class('time_title') else '',
+            'disabled': 'disabled' in button.attrs,
+            'unselectable': button.has_class('unselectable'),
+            'visible': is_node_displayed(button),
+        })
+    return slots
+
+
+def _script_click(driver, args):
+    driver.dispatch_click(args[0])
+
+
+# (스크립트 판별, 처리 함수(driver, 인자 목록)): 인자/반환값의 요소는 Node로 주고받는다
+SCRIPT_HANDLERS = [
+    (lambda script: 'button.btn_time' in script and 'period' in script,
+     lambda driver, args: snapshot_time_slots(driver.document)),
+    (lambda script: 'scrollIntoView' in script, lambda driver, args: None),
+    (lambda script: script.strip().rstrip(';') == 'arguments[0].click()', _script_click),
+    (lambda script: 'document.readyState' in script, lambda driver, args: 'complete'),
+    (lambda script: 'location.href' in script, lambda driver, args: driver.current_document_url),
+    (lambda script: 'navigator.userAgent' in script, lambda driver, args: driver.USER_AGENT),
+]
+
+
+def is_node_displayed(node):
+    """문서에 붙어 있고, 자신/조상에 display:none / hidden이 없으면 표시된 것으로 봄"""
+    if node.root().tag != '#document':
+        return False
+    for current in [node, *node.iter_ancestors()]:
+        if current.tag in ('head', 'script', 'style', 'template') or 'hidden' in current.attrs:
+            return False
+        style = current.attrs.get('style', '').replace(' ', '')
+        if 'display:none' in style or 'visibility:hidden' in style:
+            return False
+    return not (node.tag == 'input' and node.attrs.get('type') == 'hidden')
+
+
+def _visible_text(node):
+    return ' '.join(node.text_content().split()) if is_node_displayed(node) else ''
+
+
+# ==================== 요소 / 드라이버 ====================
+
+class FakeElement:
+    """WebElement 대역 (요청은 모두 드라이버의 execute로 전달)"""
+
+    def __init__(self, parent, element_id):
+        self.parent = parent
+        self.id = element_id
+
+    def __repr__(self):
+        return f"<FakeElement {self.id}>"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def _execute(self, command, params=None):
+        return self.parent.execute(command, dict(params or {}, id=self.id))['value']
+
+    @property
+    def tag_name(self):
+        return self._execute(Command.GET_ELEMENT_TAG_NAME)
+
+    @property
+    def text(self):
+        return self._execute(Command.GET_ELEMENT_TEXT)
+
+    def click(self):
+        self._execute(Command.CLICK_ELEMENT)
+
+    def get_attribute(self, name):
+        return self._execute(Command.GET_ELEMENT_ATTRIBUTE, {'name': name})
+
+    def get_dom_attribute(self, name):
+        return self._execute(Command.GET_ELEMENT_ATTRIBUTE, {'name': name, 'dom': True})
+
+    def get_property(self, name):
+        return self._execute(Command.GET_ELEMENT_PROPERTY, {'name': name})
+
+    def is_displayed(self):
+        # selenium 4에는 표시 여부 명령 상수가 없음 (실제 드라이버는 isDisplayed atom 스크립트) - 가짜 드라이버 전용 키
+        return self._execute('isElementDisplayed')
+
+    def is_enabled(self):
+        return self._execute(Command.IS_ELEMENT_ENABLED)
+
+    def is_selected(self):
+        return self._execute(Command.IS_ELEMENT_SELECTED)
+
+    def send_keys(self, *value):
+        self._execute(Command.SEND_KEYS_TO_ELEMENT, {'text': ''.join(str(v) for v in value)})
+
+    def clear(self):
+        self._execute(Command.CLEAR_ELEMENT)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._execute(Command.FIND_CHILD_ELEMENT, {'using': by, 'value': value})
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._execute(Command.FIND_CHILD_ELEMENTS, {'using': by, 'value': value})
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def frame(self, frame_reference):
+        self._driver.execute(Command.SWITCH_TO_FRAME, {'id': frame_reference})
+
+    def default_content(self):
+        self._driver.execute(Command.SWITCH_TO_FRAME, {'id': None})
+
+    def parent_frame(self):
+        self._driver.execute(Command.SWITCH_TO_PARENT_FRAME)
+
+    def window(self, window_name):
+        self._driver.execute(Command.SWITCH_TO_WINDOW, {'handle': window_name})
+
+
+class FakeDriver:
+    """
+    가짜 WebDriver (창 하나, iframe 한 단계)
+
+    Args:
+        site: FakeSite (None이면 기본 타석 1~11번)
+        transitions: 클릭 규칙 목록 (기본 TRANSITIONS)
+        on_load: 페이지 종류 → 로드 후 실행할 함수 목록 (기본 ON_LOAD)
+        latency / jitter: 명령당 추가 지연 / 흔들림 (초, 정규분포 표준편차 - 브라우저 왕복 흉내)
+        seed: 흔들림 난수 시드 (재현용)
+    """
+
+    WINDOW_HANDLE = 'fake-window'
+    USER_AGENT = 'Mozilla/5.0 (fake_driver)'
+
+    def __init__(self, site=None, transitions=None, on_load=None, latency=0.0, jitter=0.0, seed=None):
+        self.site = site or FakeSite()
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self.transitions = TRANSITIONS if transitions is None else transitions
+        self.on_load = ON_LOAD if on_load is None else on_load
+        self.switch_to = FakeSwitchTo(self)
+        self.capabilities = {'browserName': 'fake', 'browserVersion': 'fake'}
+        self.implicit_wait = 0
+        self.cookies = []
+        self.page_kind = None
+        self.page_state = {}
+        self.command_count = 0
+        self._url = BLANK_URL
+        self._top = None
+        self._frame = None
+        self._frame_url = None
+        self._frames = {}
+        self._elements = {}
+        self._quit = False
+        self._commands = {
+            Command.GET: lambda p: self.navigate(p['url']),
+            Command.REFRESH: lambda p: self.navigate(self._url),
+            Command.GET_CURRENT_URL: lambda p: self._url,
+            Command.GET_TITLE: lambda p: self._title(),
+            Command.GET_PAGE_SOURCE: lambda p: to_html(self.document),
+            Command.FIND_ELEMENT: lambda p: self._find_one(self.document, p),
+            Command.FIND_ELEMENTS: lambda p: self._find_all(self.document, p),
+            Command.FIND_CHILD_ELEMENT: lambda p: self._find_one(self._node(p['id']), p),
+            Command.FIND_CHILD_ELEMENTS: lambda p: self._find_all(self._node(p['id']), p),
+            Command.CLICK_ELEMENT: lambda p: self._click(self._node(p['id'])),
+            Command.GET_ELEMENT_TEXT: lambda p: _visible_text(self._node(p['id'])),
+            Command.GET_ELEMENT_TAG_NAME: lambda p: self._node(p['id']).tag,
+            Command.GET_ELEMENT_ATTRIBUTE: lambda p: self._attribute(self._node(p['id']), p['name'], p.get('dom')),
+            Command.GET_ELEMENT_PROPERTY: lambda p: self._attribute(self._node(p['id']), p['name'], False),
+            'isElementDisplayed': lambda p: is_node_displayed(self._node(p['id'])),
+            Command.IS_ELEMENT_ENABLED: lambda p: 'disabled' not in self._node(p['id']).attrs,
+            Command.IS_ELEMENT_SELECTED: lambda p: self._node(p['id']).has_class('selected'),
+            Command.SEND_KEYS_TO_ELEMENT: lambda p: self._set_value(self._node(p['id']), p['text'], append=True),
+            Command.CLEAR_ELEMENT: lambda p: self._set_value(self._node(p['id']), '', append=False),
+            Command.W3C_EXECUTE_SCRIPT: lambda p: self._run_script(p['script'], p['args']),
+            Command.SWITCH_TO_FRAME: lambda p: self._switch_frame(p['id']),
+            Command.SWITCH_TO_PARENT_FRAME: lambda p: self._switch_frame(None),
+            Command.SWITCH_TO_WINDOW: lambda p: None,
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda p: self.WINDOW_HANDLE,
+            Command.W3C_GET_WINDOW_HANDLES: lambda p: [self.WINDOW_HANDLE],
+            Command.ADD_COOKIE: lambda p: self._add_cookie(p['cookie']),
+            Command.GET_ALL_COOKIES: lambda p: [dict(cookie) for cookie in self.cookies],
+            Command.DELETE_ALL_COOKIES: lambda p: self.cookies.clear(),
+            Command.SET_TIMEOUTS: lambda p: None,
+            Command.SCREENSHOT: lambda p: '',
+            Command.QUIT: lambda p: self._close(),
+        }
+
+    # ---------- WebDriver 명령 ----------
+
+    def execute(self, driver_command, params=None):
+        """명령 처리 (계측 래퍼가 감싸는 지점, 응답 형식은 {'value': ...})"""
+        if self._quit and driver_command != Command.QUIT:
+            raise WebDriverException("fake driver: 이미 종료됨")
+        handler = self._commands.get(driver_command)
+        if handler is None:
+            raise WebDriverException(f"fake driver: 지원하지 않는 명령 {driver_command}")
+        self.command_count += 1
+        delay = self.latency + (self._random.gauss(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return {'value': self._wrap(handler(params or {}))}
+
+    def get(self, url):
+        self.execute(Command.GET, {'url': url})
+
+    def refresh(self):
+        self.execute(Command.REFRESH)
+
+    @property
+    def current_url(self):
+        return self.execute(Command.GET_CURRENT_URL)['value']
+
+    @property
+    def title(self):
+        return self.execute(Command.GET_TITLE)['value']
+
+    @property
+    def page_source(self):
+        return self.execute(Command.GET_PAGE_SOURCE)['value']
+
+    @property
+    def current_window_handle(self):
+        return self.execute(Command.W3C_GET_CURRENT_WINDOW_HANDLE)['value']
+
+    @property
+    def window_handles(self):
+        return self.execute(Command.W3C_GET_WINDOW_HANDLES)['value']
+
+    def find_element(self, by=By.ID, value=None):
+        return self.execute(Command.FIND_ELEMENT, {'using': by, 'value': value})['value']
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.execute(Command.FIND_ELEMENTS, {'using': by, 'value': value})['value']
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': list(args)})['value']
+
+    def implicitly_wait(self, time_to_wait):
+        self.implicit_wait = time_to_wait
+        self.execute(Command.SET_TIMEOUTS, {'implicit': int(float(time_to_wait) * 1000)})
+
+    def set_page_load_timeout(self, time_to_wait):
+        self.execute(Command.SET_TIMEOUTS, {'pageLoad': int(float(time_to_wait) * 1000)})
+
+    def add_cookie(self, cookie_dict):
+        self.execute(Command.ADD_COOKIE, {'cookie': cookie_dict})
+
+    def get_cookies(self):
+        return self.execute(Command.GET_ALL_COOKIES)['value']
+
+    def delete_all_cookies(self):
+        self.execute(Command.DELETE_ALL_COOKIES)
+
+    def get_screenshot_as_png(self):
+        self.execute(Command.SCREENSHOT)
+        return b''
+
+    def save_screenshot(self, filename):
+        # 그릴 화면이 없으므로 실제 드라이버의 저장 실패와 같게 False
+        self.execute(Command.SCREENSHOT)
+        return False
+
+    def quit(self):
+        self.execute(Command.QUIT)
+
+    # ---------- 브라우저 동작 (명령 없이 페이지가 스스로 하는 일) ----------
+
+    @property
+    def document(self):
+        """현재 검색 대상 문서 (iframe 안이면 iframe 문서)"""
+        if self._frame is not None:
+            return self._frame
+        if self._top is None:
+            self.navigate(BLANK_URL)
+        return self._top
+
+    @property
+    def current_document_url(self):
+        return self._frame_url if self._frame is not None else self._url
+
+    def navigate(self, url):
+        """최상위 문서 교체 (이전 요소는 모두 stale, iframe 선택 해제)"""
+        self._url = url
+        self.page_kind, self._top = self.site.load(url)
+        self._frame = self._frame_url = None
+        self._frames = {}
+        self._elements.clear()
+        self.page_state = {}
+        for hook in self.on_load.get(self.page_kind, ()):
+            hook(self, self._top)
+
+    def dispatch_click(self, node):
+        """클릭 이벤트: 자신/조상 중 처음 맞는 전환 규칙 실행 (disabled 버튼은 무시)"""
+        for current in [node, *node.iter_ancestors()]:
+            for matches, action in self.transitions:
+                if matches(current):
+                    if 'disabled' not in current.attrs:
+                        action(self, current)
+                    return
+
+    # ---------- 내부 ----------
+
+    def _close(self):
+        self._quit = True
+        self._top = self._frame = None
+        self._elements.clear()
+
+    def _title(self):
+        titles = css_select(self._top, 'title') if self._top is not None else []
+        return titles[0].text_content().strip() if titles else ''
+
+    def _wrap(self, value):
+        """응답 안의 Node → FakeElement"""
+        if isinstance(value, Node):
+            element_id = str(id(value))
+            self._elements[element_id] = value
+            return FakeElement(self, element_id)
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, FakeElement):
+            return self._node(value.id)
+        if isinstance(value, (list, tuple)):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+    def _node(self, element_id):
+        node = self._elements.get(element_id)
+        if node is None or (node.root() is not self._top and node.root() not in self._frames.values()):
+            raise StaleElementReferenceException(f"stale element: {element_id}")
+        return node
+
+    def _query(self, context, by, value):
+        if by == By.XPATH:
+            return xpath(context, value)
+        if by == By.CSS_SELECTOR:
+            return css_select(context, value)
+        if by == By.ID:
+            return [node for node in context.iter_descendants() if node.attrs.get('id') == value]
+        if by == By.NAME:
+            return [node for node in context.iter_descendants() if node.attrs.get('name') == value]
+        if by == By.CLASS_NAME:
+            return [node for node in context.iter_descendants() if node.has_class(value)]
+        if by == By.TAG_NAME:
+            return [node for node in context.iter_descendants() if node.tag == value.lower()]
+        if by == By.LINK_TEXT:
+            return [node for node in context.iter_descendants() if node.tag == 'a' and _visible_text(node) == value]
+        if by == By.PARTIAL_LINK_TEXT:
+            return [node for node in context.iter_descendants() if node.tag == 'a' and value in _visible_text(node)]
+        raise WebDriverException(f"fake driver: 지원하지 않는 선택 방식 {by}")
+
+    def _find_all(self, context, params):
+        return self._query(context, params['using'], params['value'])
+
+    def _find_one(self, context, params):
+        found = self._query(context, params['using'], params['value'])
+        if not found:
+            raise NoSuchElementException(f"no such element: {params['using']}={params['value']!r}")
+        return found[0]
+
+    def _click(self, node):
+        if not is_node_displayed(node):
+            raise ElementNotInteractableException("element not interactable")
+        self.dispatch_click(node)
+
+    def _attribute(self, node, name, dom):
+        if name in ('textContent', 'innerText'):
+            return node.text_content() if name == 'textContent' else _visible_text(node)
+        if name == 'outerHTML':
+            return to_html(node)
+        value = node.attrs.get(name)
+        if dom or value is None:
+            return value
+        # WebElement.get_attribute는 href/src를 절대 URL로 돌려줌
+        if name in ('href', 'src'):
+            return urljoin(self.current_document_url, value)
+        return value
+
+    def _set_value(self, node, text, append):
+        node.attrs['value'] = (node.attrs.get('value', '') if append else '') + text
+
+    def _run_script(self, script, args):
+        for matches, handler in SCRIPT_HANDLERS:
+            if matches(script):
+                return handler(self, self._unwrap(args))
+        logger.debug("fake driver: 처리하지 않는 스크립트 %.60s", script.strip())
+        return None
+
+    def _switch_frame(self, reference):
+        if reference is None:
+            self._frame = self._frame_url = None
+            return
+        frames = [node for node in self._top.iter_descendants() if node.tag in ('iframe', 'frame')]
+        if isinstance(reference, FakeElement):
+            target = self._node(reference.id)
+        elif isinstance(reference, int):
+            target = frames[reference] if 0 <= reference < len(frames) else None
+        else:
+            target = next((node for node in frames
+                           if reference in (node.attrs.get('id'), node.attrs.get('name'))), None)
+        if target is None or target.tag not in ('iframe', 'frame'):
+            raise NoSuchFrameException(f"no such frame: {reference!r}")
+        # iframe 문서는 최상위 문서가 바뀔 때까지 유지 (다시 들어가도 같은 요소)
+        self._frame_url = urljoin(self._url, target.attrs.get('src', BLANK_URL))
+        if id(target) not in self._frames:
+            self._frames[id(target)] = self.site.load(self._frame_url)[1]
+        self._frame = self._frames[id(target)]
+
+    def _add_cookie(self, cookie):
+        self.cookies = [c for c in self.cookies if c.get('name') != cookie.get('name')] + [dict(cookie)]
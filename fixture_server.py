@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 네이버 예약 페이지를 로컬에서 서빙하는 픽스처 서버
+
+- booking_dateandtime.html: 타석 예약 페이지 (캘린더 + 시간 버튼)
+- booking.html: 예약 정보 확인 / 동의하고 예약하기
+- booking_complete.html: 예약 완료 (/my/bookings/{id}?popup=bookingCompletion)
+- 지도(map.naver.com) 페이지와 entryIframe 안의 타석 링크 목록은 서버가 생성
+
+저장된 페이지의 외부 스크립트/스타일은 제거하고, 대신 작은 스크립트를 넣어 화면 전환을 흉내 낸다
+(시간 선택 → '다음' 활성화, '다음' → 예약 확인 페이지, '동의하고 예약하기' → 완료 페이지).
+
+URL 재작성:
+    https://booking.naver.com/<path>  →  http://127.0.0.1:<port>/<path>
+    https://map.naver.com/<path>      →  http://127.0.0.1:<port>/map/<path>
+
+사용법:
+    python fixture_server.py [포트]
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BIZ_ID = '1063794'
+DEFAULT_BOOKING_ID = '1084554957'
+
+# 저장된 booking_dateandtime.html 기준 예약 가능한 날짜 / 시간 / 타석
+FIXTURE_DAY = 25
+FIXTURE_TIME = '06:00'
+FIXTURE_BOOTH = 11
+
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+_LINK_RE = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_BOOKING_HOST_RE = re.compile(r'https?://booking\.naver\.com')
+_MAP_HOST_RE = re.compile(r'https?://map\.naver\.com')
+
+# 저장된 페이지에 넣는 상태 전환 스크립트
+STATE_SCRIPT = """
+<script>
+document.addEventListener('click', function (event) {
+  var target = event.target.closest('button');
+  if (!target) { return; }
+  var code = target.getAttribute('data-click-code');
+  if (target.classList.contains('calendar_date')) {
+    document.querySelectorAll('.calendar_date.selected').forEach(function (b) { b.classList.remove('selected'); });
+    target.classList.add('selected');
+  } else if (target.classList.contains('btn_time')) {
+    document.querySelectorAll('.btn_time.selected').forEach(function (b) { b.classList.remove('selected'); });
+    target.classList.add('selected');
+    document.querySelectorAll('[data-click-code="nextbuttonview.request"]').forEach(function (b) {
+      b.className = b.className.replace(/\\S*disabled\\S*/g, '').trim();
+    });
+  } else if (code === 'nextbuttonview.request') {
+    window.location.href = '%(order_path)s';
+  } else if (code === 'submitbutton.submit') {
+    window.location.href = '%(complete_path)s';
+  }
+});
+</script>
+"""
+
+
+def rewrite_url(url, base_url):
+    """네이버 예약/지도 URL을 로컬 서버 URL로 변환 (그 외 URL은 그대로)"""
+    if _BOOKING_HOST_RE.match(url):
+        return _BOOKING_HOST_RE.sub(base_url, url, count=1)
+    if _MAP_HOST_RE.match(url):
+        return _MAP_HOST_RE.sub(base_url + '/map', url, count=1)
+    return url
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def strip_assets(html):
+    """저장된 페이지의 외부 스크립트/스타일 링크 제거"""
+    return _LINK_RE.sub('', _SCRIPT_RE.sub('', html))
+
+
+def sanitize_page(html, base_url, script=''):
+    """외부 스크립트/스타일 제거 + 네이버 링크를 로컬 서버로 재작성 + 상태 스크립트 추가"""
+    html = strip_assets(html)
+    html = _BOOKING_HOST_RE.sub(base_url, html)
+    html = _MAP_HOST_RE.sub(base_url + '/map', html)
+    if '</body>' in html:
+        return html.replace('</body>', script + '</body>', 1)
+    return html + script
+
+
+def map_page_html(iframe_src):
+    """지도 페이지 (entryIframe 하나)"""
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        f'<iframe id="entryIframe" name="entryIframe" src="{iframe_src}" '
+        'style="width:100%;height:900px;border:0"></iframe></body></html>'
+    )
+
+
+def place_page_html(booths):
+    """entryIframe 안의 업체 페이지 (예약 탭 + 타석 링크 목록)
+
+    Args:
+        booths: (타석 번호, 예약 페이지 URL) 목록
+    """
+    links = ''.join(
+        f'<li><a href="{url}" target="_blank">{num}번타석예약</a></li>'
+        for num, url in booths
+    )
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        '<div class="place_fixed_maintab"><a href="#booking" role="tab">예약</a></div>'
+        f'<ul class="booking_list">{links}</ul></body></html>'
+    )
+
+
+class FixtureServer:
+    """
+    픽스처 HTTP 서버 (백그라운드 스레드)
+
+    서브클래스는 page_for()를 바꿔 응답을 바꿀 수 있다 (예: 자정 오픈 시뮬레이션).
+    """
+
+    state_script = STATE_SCRIPT
+
+    def __init__(self, host='127.0.0.1', port=0, biz_id=DEFAULT_BIZ_ID,
+                 booth_numbers=range(1, 12), booking_id=DEFAULT_BOOKING_ID):
+        self.biz_id = biz_id
+        self.booth_numbers = list(booth_numbers)
+        self.booking_id = booking_id
+        self.request_counts = {}
+        self._counts_lock = threading.Lock()
+        self._fixtures = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                logger.debug("fixture %s", format % args)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def url(self, path):
+        return self.base_url + path
+
+    def booth_url(self, booth_num):
+        return self.url(f"/booking/6/bizes/{self.biz_id}/items/{booth_num}")
+
+    def rewrite(self, url):
+        return rewrite_url(url, self.base_url)
+
+    @property
+    def order_path(self):
+        return f"/booking/6/bizes/{self.biz_id}/order"
+
+    @property
+    def complete_path(self):
+        return f"/my/bookings/{self.booking_id}?popup=bookingCompletion"
+
+    def script_params(self):
+        """state_script에 채울 값"""
+        return {'order_path': self.order_path, 'complete_path': self.complete_path}
+
+    def _fixture(self, name):
+        # 파일 읽기 + 정리는 한 번만 (서빙 시간이 측정에 섞이지 않도록)
+        page = self._fixtures.get(name)
+        if page is None:
+            script = self.state_script % self.script_params()
+            page = self._fixtures[name] = sanitize_page(load_fixture(name), self.base_url, script)
+        return page
+
+    def map_page(self, place_path):
+        return map_page_html(f"/place/{place_path}")
+
+    def place_page(self):
+        return place_page_html((num, self.booth_url(num)) for num in self.booth_numbers)
+
+    def page_for(self, path, query):
+        """
+        경로별 응답
+
+        Returns:
+            tuple: (상태 코드, HTML) 또는 (상태 코드, HTML, 추가 헤더 dict)
+        """
+        if path.startswith('/map/'):
+            match = re.search(r'/place/(\d+)', path)
+            return 200, self.map_page(match.group(1) if match else '0')
+        if path.startswith('/place/'):
+            return 200, self.place_page()
+        if path == self.order_path:
+            return 200, self._fixture('booking.html')
+        if re.match(r'^/booking/6/bizes/\d+/items/\d+', path):
+            return 200, self._fixture('booking_dateandtime.html')
+        if path.startswith('/my/bookings/'):
+            return 200, self._fixture('booking_complete.html')
+        return 404, '<html><body>not found</body></html>'
+
+    def _handle(self, request):
+        parts = urlsplit(request.path)
+        with self._counts_lock:
+            self.request_counts[parts.path] = self.request_counts.get(parts.path, 0) + 1
+        status, body, *rest = self.page_for(parts.path, parts.query)
+        payload = body.encode('utf-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'text/html; charset=utf-8')
+        request.send_header('Content-Length', str(len(payload)))
+        for name, value in (rest[0] if rest else {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(payload)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8800
+    with FixtureServer(port=port) as fixture_server:
+        print(f"픽스처 서버: {fixture_server.base_url}")
+        print(f"  지도:   {fixture_server.url('/map/p/entry/place/1076834793')}")
+        print(f"  타석:   {fixture_server.booth_url(11)}")
+        print(f"  완료:   {fixture_server.url(fixture_server.complete_path)}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실패 플라이트 레코더
+
+- 최근 WebDriver 명령을 링 버퍼에 기록 (명령, 단계, 소요 시간, 오류)
+- 실패 시 스크린샷 / DOM / 현재 URL / 최근 단계 span / 최근 명령을
+  failures/YYYYMMDD_HHMMSS_fff_<사유>/ 번들로 저장
+- 스크린샷 / DOM / URL은 실패 시점에 바로 읽고 (드라이버는 스레드 안전하지 않고 페이지도 곧 바뀜),
+  디스크 쓰기만 백그라운드 스레드에서 실행해 진행 중인 재시도/대체 경로를 오래 막지 않음
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class FlightRecorder:
+    """드라이버 이벤트 링 버퍼 + 비동기 실패 캡처"""
+
+    def __init__(self, directory='failures', capacity=200, span_count=30, phase_fn=None):
+        """
+        Args:
+            directory: 번들 저장 폴더
+            capacity: 보관할 최근 WebDriver 명령 수
+            span_count: 번들에 넣을 최근 단계 span 수
+            phase_fn: 현재 단계 이름을 돌려주는 함수
+        """
+        self.directory = directory
+        self.span_count = span_count
+        self.phase_fn = phase_fn or (lambda: None)
+        self.events = deque(maxlen=capacity)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='flight-recorder')
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def attach(self, driver):
+        """드라이버 execute를 감싸 명령을 링 버퍼에 기록 (중복 적용 안 함)"""
+        if getattr(driver, '_flight_recorder', None) is self:
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            # 캡처 스레드 자신의 명령은 기록하지 않음
+            if getattr(self._local, 'capturing', False):
+                return original(driver_command, params)
+            start = time.perf_counter()
+            error = None
+            try:
+                return original(driver_command, params)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                self.events.append({
+                    'at': datetime.now().isoformat(timespec='milliseconds'),
+                    'command': driver_command,
+                    'phase': self.phase_fn(),
+                    'ms': round((time.perf_counter() - start) * 1000, 1),
+                    'error': error,
+                })
+
+        driver.execute = execute
+        driver._flight_recorder = self
+        return driver
+
+    def capture(self, driver, reason, spans=None, extra=None):
+        """
+        실패 번들 캡처 (드라이버 상태는 바로 읽고, 저장은 백그라운드)
+
+        링 버퍼 / span / URL / 제목 / 스크린샷 / DOM은 호출한 스레드에서 지금 수집하고
+        파일 쓰기만 백그라운드 스레드에 맡긴다.
+
+        Args:
+            driver: WebDriver (None이면 드라이버 정보 없이 저장)
+            reason: 실패 사유 (폴더 이름에 사용)
+            spans: 최근 단계 span 목록 (Tracer.last_spans)
+            extra: 번들에 함께 저장할 정보
+
+        Returns:
+            Future: 번들 경로를 돌려주는 Future
+        """
+        captured_at = datetime.now()
+        bundle = {
+            'reason': reason,
+            'captured_at': captured_at.isoformat(timespec='milliseconds'),
+            'phase': self.phase_fn(),
+            'events': list(self.events),
+            'spans': list(spans or [])[-self.span_count:],
+            'extra': extra or {},
+        }
+        files = self._collect(driver, bundle) if driver is not None else {}
+        future = self._executor.submit(self._write_bundle, captured_at, bundle, files)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _collect(self, driver, bundle):
+        """
+        드라이버에서 URL / 제목 / 스크린샷 / DOM 읽기 (호출한 스레드에서)
+
+        Returns:
+            dict: 파일 이름 → 내용 (bytes / str)
+        """
+        files = {}
+        # 캡처용 명령은 링 버퍼에 기록하지 않음
+        self._local.capturing = True
+        try:
+            for key, collect, name in (
+                ('url', lambda: driver.current_url, None),
+                ('title', lambda: driver.title, None),
+                ('screenshot', driver.get_screenshot_as_png, 'screenshot.png'),
+                ('dom', lambda: driver.page_source, 'dom.html'),
+            ):
+                try:
+                    value = collect()
+                except Exception as e:
+                    value = None
+                    bundle.setdefault('capture_errors', {})[key] = str(e)
+                if name is None:
+                    bundle[key] = value
+                elif value is not None:
+                    files[name] = value
+        finally:
+            self._local.capturing = False
+        return files
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _write_bundle(self, captured_at, bundle, files):
+        safe_reason = re.sub(r'[^\w.-]+', '_', bundle['reason'])[:40]
+        path = os.path.join(self.directory, f"{captured_at.strftime('%Y%m%d_%H%M%S_%f')[:-3]}_{safe_reason}")
+        try:
+            os.makedirs(path, exist_ok=True)
+            for name, content in files.items():
+                if isinstance(content, bytes):
+                    with open(os.path.join(path, name), 'wb') as f:
+                        f.write(content)
+                else:
+                    with open(os.path.join(path, name), 'w', encoding='utf-8') as f:
+                        f.write(content)
+            with open(os.path.join(path, 'bundle.json'), 'w', encoding='utf-8') as f:
+                json.dump(bundle, f, ensure_ascii=False, indent=1, default=str)
+            logger.info(f"🛩️  실패 기록 저장: {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"⚠️  실패 기록 저장 실패: {str(e)}")
+            return None
+
+    def drain(self, timeout=10):
+        """진행 중인 캡처가 끝날 때까지 대기 (드라이버 종료 전 호출)"""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
@@ -22,93 +22,461 @@ import json
 import os
 import sys
 import platform
-from kakao_notification import KakaoNotifier
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('golf_booking.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+import re
+import shutil
+import threading
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from kakao_notification import current_notification_dispatcher, get_kakao_notifier, get_notification_dispatcher
+from booking_trace import CommandProfiler, Tracer, traced
+from booking_logging import lazy, setup_logging
+from run_history import RunHistory
+from flight_recorder import FlightRecorder
+from session_recorder import SessionRecorder
+from network_capture import NetworkCapture, PerformanceLog
+from booking_http import BOOKED, BOOKING_ORIGIN, REJECTED, UNKNOWN, HttpBookingClient, slot_fields
+from browser_backend import FIND_BY_XPATH_JS, BackendElement, create_backend
+from booking_metrics import get_metrics_registry, process_tree_rss_bytes, start_textfile_exporter
+
+# 로깅 설정 (큐 기반: 파일/콘솔 쓰기는 백그라운드 스레드에서 처리)
+setup_logging('golf_booking.log', json_file='golf_booking.jsonl')
 logger = logging.getLogger(__name__)
 
 
+# ==================== 예약 시간 우선순위 (time ladder) ====================
+
+# time_ladder / preferred_time 미설정 시 기본 예약 시간
+DEFAULT_TIME_LADDER = {
+    'weekday': ['12:00'],
+    'weekend': ['13:00'],
+}
+WEEKDAY_KEYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+# 타석 우선순위 / 전체 타석 번호 (priority_seats / booth_numbers 미설정 시)
+DEFAULT_PRIORITY_SEATS = [11, 7, 8, 9, 10]
+DEFAULT_BOOTH_NUMBERS = list(range(1, 12))
+
+# 지점 카탈로그 (config의 branches로 추가/덮어쓰기 가능)
+# booth_numbers / priority_seats / time_ladder를 지정하지 않으면 공통 설정을 따른다
+DEFAULT_BRANCH = '중계점'
+DEFAULT_BRANCHES = {
+    '중계점': {
+        'place_id': '1076834793',
+        'biz_id': '1063794',
+    },
+}
+DEFAULT_SEARCH_KEYWORD = '메이저골프아카데미'
+
+# 여러 계정이 동시에 드라이버를 띄울 때 webdriver-manager 캐시 다운로드가 겹치지 않도록
+_driver_install_lock = threading.Lock()
+
+# 시간 버튼 스냅샷 (버튼마다 get_attribute/is_displayed/text를 호출하지 않고 한 번에 수집)
+TIME_SLOT_SNAPSHOT_JS = """
+return Array.from(document.querySelectorAll('button.btn_time')).map(function (btn) {
+    var list = btn.closest('ul');
+    var title = list ? list.previousElementSibling : null;
+    return {
+        element: btn,
+        text: btn.textContent.trim(),
+        period: (title && title.classList.contains('time_title')) ? title.textContent.trim() : '',
+        disabled: btn.disabled,
+        unselectable: btn.classList.contains('unselectable'),
+        visible: btn.offsetParent !== null
+    };
+});
+"""
+
+# DevTools 백엔드용: 스냅샷 순서(index)로 시간 버튼 찾기 (스크립트 결과에 WebElement가 없음)
+TIME_BUTTON_BY_INDEX_JS = "return document.querySelectorAll('button.btn_time')[arguments[0]] || null;"
+
+# 예약일 버튼: span.num(일) → 부모 button.calendar_date
+CALENDAR_DATE_XPATH = "//span[@class='num' and text()='{day}']/ancestor::button[contains(@class, 'calendar_date')]"
+
+# DevTools 백엔드용: 예약일 버튼 상태를 한 번에 수집 (캘린더가 그려질 때까지 페이지 안에서 대기)
+CALENDAR_DATE_STATE_JS = """
+var xpath = arguments[0], deadline = Date.now() + arguments[1];
+return new Promise(function (resolve) {
+    (function poll() {
+        var button = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (button) return resolve({classes: button.className, visible: button.offsetParent !== null});
+        if (document.querySelector('button.calendar_date') || Date.now() >= deadline) return resolve(null);
+        setTimeout(poll, 20);
+    })();
+});
+"""
+
+
+def normalize_time(time_text):
+    """
+    시간 문자열을 24시간제 HH:MM으로 정규화
+
+    Args:
+        time_text: 예) "9:00", "09:00", "19:00"
+
+    Returns:
+        str: 예) "09:00" (형식이 맞지 않으면 None)
+    """
+    match = re.search(r'(\d{1,2}):(\d{2})', str(time_text))
+    if not match:
+        return None
+    return f"{int(match.group(1)):02d}:{match.group(2)}"
+
+
+def resolve_time_ladder(config, target_date):
+    """
+    예약일 요일에 맞는 희망 시간 목록 (우선순위 순)
+
+    우선순위: time_ladder[요일] > time_ladder['weekday'/'weekend'] > time_ladder['default']
+    > preferred_time (문자열 또는 목록) > DEFAULT_TIME_LADDER
+
+    Args:
+        config: 설정 딕셔너리
+        target_date: 예약일 (datetime)
+
+    Returns:
+        list: 24시간제 HH:MM 목록
+    """
+    weekday = target_date.weekday()
+    day_group = 'weekday' if weekday < 5 else 'weekend'
+    ladder_config = config.get('time_ladder') or {}
+
+    times = None
+    for key in (WEEKDAY_KEYS[weekday], day_group, 'default'):
+        if ladder_config.get(key):
+            times = ladder_config[key]
+            break
+
+    if times is None and config.get('preferred_time'):
+        times = config['preferred_time']
+
+    if times is None:
+        times = DEFAULT_TIME_LADDER[day_group]
+
+    if isinstance(times, str):
+        times = [times]
+
+    ladder = []
+    for time_text in times:
+        normalized = normalize_time(time_text)
+        if normalized and normalized not in ladder:
+            ladder.append(normalized)
+    return ladder
+
+
+def to_24h_slots(raw_slots):
+    """
+    시간 버튼 스냅샷을 24시간제로 변환
+
+    네이버 예약 페이지는 '오전'/'오후' 제목 아래에 12시간제(예: "1:00")로 표시하므로
+    제목(period)으로 변환하고, 제목이 없으면 버튼 순서(시간 역전 시 오후)로 추정한다.
+
+    Args:
+        raw_slots: TIME_SLOT_SNAPSHOT_JS 결과 목록
+
+    Returns:
+        list: 각 항목에 'time'(HH:MM), 'available'(bool)이 추가된 딕셔너리 목록
+    """
+    slots = []
+    is_pm = False
+    prev_hour = None
+    for raw in raw_slots:
+        match = re.search(r'(\d{1,2}):(\d{2})', raw.get('text') or '')
+        if not match:
+            continue
+        hour, minute = int(match.group(1)), match.group(2)
+        label = f"{raw.get('period') or ''} {raw.get('text') or ''}"
+
+        if '오후' in label or 'PM' in label.upper():
+            is_pm = True
+        elif '오전' in label or 'AM' in label.upper():
+            is_pm = False
+        elif prev_hour is not None and (hour < prev_hour or hour == 12):
+            is_pm = True
+        prev_hour = hour
+
+        if is_pm and hour < 12:
+            hour += 12
+        elif not is_pm and hour == 12:
+            hour = 0
+
+        slot = dict(raw)
+        slot['time'] = f"{hour:02d}:{minute}"
+        slot['available'] = bool(raw.get('visible')) and not raw.get('disabled') and not raw.get('unselectable')
+        slots.append(slot)
+    return slots
+
+
+def format_slot_states(slots):
+    """시간 슬롯 상태 요약 문자열 (로그용)"""
+    slot_states = []
+    for slot in slots:
+        if not slot.get('visible'):
+            continue
+        if slot['available']:
+            status = "✅ 가능"
+        else:
+            status = "❌ 불가능"
+            if slot.get('disabled'):
+                status += "(disabled)"
+            if slot.get('unselectable'):
+                status += "(unselectable)"
+        slot_states.append(f"{slot['time']} ({status})")
+    return ', '.join(slot_states)
+
+
+def format_captured_slots(slots):
+    """시간표 응답 슬롯 요약 문자열 (로그용)"""
+    slot_states = []
+    for slot in slots:
+        status = "✅ 가능" if slot['available'] else f"❌ 불가능(재고 {slot['stock']}, 예약 {slot['booked']})"
+        slot_states.append(f"{slot['time']} ({status})")
+    return ', '.join(slot_states)
+
+
+def pick_ladder_match(slots, ladder):
+    """
+    스냅샷에서 희망 시간 목록상 가장 순위가 높은 예약 가능 시간 선택
+
+    Args:
+        slots: to_24h_slots 결과
+        ladder: resolve_time_ladder 결과
+
+    Returns:
+        tuple: (순위, slot) - 없으면 None
+    """
+    available = {}
+    for slot in slots:
+        if slot['available'] and slot['time'] not in available:
+            available[slot['time']] = slot
+    for rank, time_text in enumerate(ladder):
+        if time_text in available:
+            return rank, available[time_text]
+    return None
+
+
+def branch_names(config):
+    """
+    검색할 지점 이름 목록 (첫 번째가 기본 지점)
+
+    config의 branch는 문자열 또는 목록을 받는다.
+    """
+    names = config.get('branch') or DEFAULT_BRANCH
+    if isinstance(names, str):
+        names = [names]
+    return list(names)
+
+
+def resolve_branch(config, name=None):
+    """
+    지점 정보 조회 (지점 설정 > 공통 설정 > 기본값 순으로 병합)
+
+    Args:
+        config: 설정 딕셔너리
+        name: 지점 이름 (None이면 기본 지점)
+
+    Returns:
+        dict: name, place_id, biz_id, map_url, booking_url, booth_numbers,
+              priority_seats, time_ladder
+    """
+    name = name or branch_names(config)[0]
+    catalog = dict(DEFAULT_BRANCHES)
+    catalog.update(config.get('branches') or {})
+    if name not in catalog:
+        raise ValueError(f"알 수 없는 지점: {name} (config의 branches에 place_id/biz_id를 추가하세요)")
+
+    branch = dict(catalog[name])
+    keyword = branch.get('search_keyword', DEFAULT_SEARCH_KEYWORD)
+    branch['name'] = name
+    branch['map_url'] = (
+        f"https://map.naver.com/p/search/{quote(keyword)}/"
+        f"place/{branch['place_id']}?placePath=/ticket"
+    )
+    branch['booking_url'] = f"https://booking.naver.com/booking/13/bizes/{branch['biz_id']}"
+    # 지점에서 booth_numbers를 지정한 경우에만 타석 목록을 걸러낸다
+    branch['booth_filter'] = branch.get('booth_numbers')
+    branch['booth_numbers'] = branch.get('booth_numbers') or config.get('booth_numbers') or DEFAULT_BOOTH_NUMBERS
+    branch['priority_seats'] = branch.get('priority_seats') or config.get('priority_seats') or DEFAULT_PRIORITY_SEATS
+    branch['time_ladder'] = branch.get('time_ladder') or config.get('time_ladder')
+    return branch
+
+
+class CapturedTimeButton:
+    """
+    시간표 응답으로 찾은 슬롯의 시간 버튼
+
+    예약할 슬롯만 클릭할 때 화면에서 찾는다 (버튼이 그려질 때까지 대기).
+    """
+
+    def __init__(self, driver, slot_time, timeout=5):
+        self.driver = driver
+        self.slot_time = slot_time
+        self.timeout = timeout
+
+    def _find(self, driver):
+        slots = to_24h_slots(driver.execute_script(TIME_SLOT_SNAPSHOT_JS) or [])
+        return next((s['element'] for s in slots if s['time'] == self.slot_time and s['available']), False)
+
+    def click(self):
+        WebDriverWait(self.driver, self.timeout).until(self._find).click()
+
+
+class BookingClaim:
+    """
+    여러 지점을 동시에 검색할 때 한 곳에서만 예약하도록 조정
+
+    먼저 슬롯을 찾은 쪽이 예약을 진행하고, 나머지는 결과를 기다린다.
+    예약에 성공하면 모두 중단하고, 실패하면 다음 대기자가 예약을 이어받는다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.owner = None
+        self.settled = False
+
+    def acquire(self, owner):
+        """예약 진행권 획득 (다른 쪽이 이미 예약에 성공했으면 False)"""
+        with self._cond:
+            while self.owner is not None and not self.settled:
+                self._cond.wait()
+            if self.settled:
+                return False
+            self.owner = owner
+            return True
+
+    def release(self, success):
+        """예약 진행권 반환 (success면 전체 종료)"""
+        with self._cond:
+            if success:
+                self.settled = True
+            else:
+                self.owner = None
+            self._cond.notify_all()
+
+
+def assign_booths(booth_numbers, priority_seats, account_count):
+    """
+    타석을 계정별로 겹치지 않게 분배
+
+    우선순위 타석 → 나머지 타석(번호 순) 순서로 줄을 세운 뒤 계정별로 번갈아 배정해
+    각 계정이 선호 타석을 골고루 나눠 갖도록 한다.
+
+    Args:
+        booth_numbers: 전체 타석 번호 목록
+        priority_seats: 우선순위 타석 번호 목록
+        account_count: 계정 수
+
+    Returns:
+        list: 계정별 타석 번호 목록 (각 목록은 확인 순서대로 정렬)
+    """
+    ordered = [num for num in priority_seats if num in booth_numbers]
+    ordered += sorted(num for num in booth_numbers if num not in ordered)
+    return [ordered[i::account_count] for i in range(account_count)]
+
+
 class GolfBookingBot:
-    def __init__(self, config):
+    def __init__(self, config, driver_factory=None):
         self.config = config
         self.driver = None
+        # 드라이버 생성 함수 (None이면 Chrome, 브라우저 없는 벤치마크에서는 fake_driver.FakeDriver)
+        self.driver_factory = driver_factory
         self.wait = None
+        # 타석 확인 루프의 핫 명령(스크립트 / 이동 / 클릭) 백엔드 (config: browser_backend, setup_driver에서 생성)
+        self.browser = None
+        # 저장된 쿠키를 드라이버 시작 직후 일괄 설정했는지 (True면 페이지마다 쿠키 재적용 / 새로고침 안 함)
+        self.cookies_injected = False
         self.kakao_notifier = None
+        # 상주(스케줄러) 모드에서는 작업 간 드라이버/로그인 세션을 재사용
+        self.keep_driver = False
+        self.logged_in = False
+        # 계정별 쿠키 저장소 (다중 계정 실행 시 계정마다 분리)
+        self.cookie_file = config.get('cookie_file', 'naver_cookies.pkl')
+        self.last_booking_info = {}
+        # 예약 지점 (place id / 예약 URL / 타석 카탈로그)
+        self.branch = resolve_branch(config)
+        # 여러 지점 동시 검색 시 공유되는 예약 진행권 (MultiBranchBooker가 설정)
+        self.booking_claim = None
+        # 단계별 지연 시간 추적 (실행마다 start_trace로 새로 시작)
+        self.tracer = Tracer()
+        # 실행 기록 저장소 (config: enable_history, history_db - 첫 기록 때 생성)
+        self.run_history = None
+        # WebDriver 명령 프로파일링 (opt-in, 현재 단계별로 집계)
+        self.profiler = None
+        if config.get('profile_driver'):
+            self.profiler = CommandProfiler(lambda: self.tracer.current_phase())
+        # 실패 시 스크린샷/DOM/URL/최근 단계를 비동기로 저장
+        self.flight_recorder = None
+        self._failure_captured = False
+        if config.get('flight_recorder', True):
+            self.flight_recorder = FlightRecorder(
+                config.get('failure_dir', 'failures'),
+                phase_fn=lambda: self.tracer.current_phase()
+            )
+        # performance 로그는 읽으면 비워지므로 세션 기록 / 시간표 캡처가 나눠 읽는다
+        performance_log = PerformanceLog()
+        # 실제 실행의 명령 / 페이지 스냅샷 / 예약 API 응답을 아카이브로 기록 (opt-in, 오프라인 재현용)
+        self.session_recorder = None
+        if config.get('record_session'):
+            self.session_recorder = SessionRecorder(
+                config.get('record_dir', 'recordings'),
+                phase_fn=lambda: self.tracer.current_phase(),
+                response_pattern=config.get('record_response_pattern'),
+                log=performance_log,
+            )
+        # 예약 가능 시간을 화면 대신 시간표 API 응답(JSON)에서 읽기 (opt-in, 응답이 없으면 화면에서 확인)
+        self.network_capture = None
+        if config.get('network_capture'):
+            self.network_capture = NetworkCapture(config.get('network_capture_pattern'), log=performance_log)
+        # 슬롯을 찾은 뒤 예약 요청을 HTTP로 직접 보내는 확정 경로 (opt-in, 실패 시 Selenium 클릭 체인)
+        self.http_booking = None
+        if config.get('http_commit') and config.get('http_commit_request'):
+            self.http_booking = HttpBookingClient(
+                config['http_commit_request'],
+                origin=config.get('http_commit_origin', BOOKING_ORIGIN),
+                timeout=config.get('http_commit_timeout', 5),
+            )
+        # 지표 (프로세스 공용 레지스트리, metrics_textfile 설정 시 주기적으로 Prometheus textfile 출력)
+        self.metrics = get_metrics_registry()
+        self.metric_labels = {'branch': self.branch['name'], 'account': config.get('name') or 'default'}
+        self.login_path = None
+        if config.get('metrics_textfile'):
+            start_textfile_exporter(config['metrics_textfile'], config.get('metrics_interval_seconds', 15))
+            self.metrics.add_collector(self._collect_runtime_metrics)
 
         # 카카오톡 알림 초기화
         if config.get('enable_notification') and config.get('notification_type') == 'kakao':
             try:
                 api_key = config.get('kakao_rest_api_key')
                 if api_key and api_key != 'YOUR_KAKAO_REST_API_KEY':
-                    self.kakao_notifier = KakaoNotifier(api_key)
+                    self.kakao_notifier = get_kakao_notifier(api_key)
                     logger.info("✅ 카카오톡 알림 활성화")
                 else:
                     logger.warning("⚠️  카카오 API 키가 설정되지 않음")
             except Exception as e:
                 logger.warning(f"⚠️  카카오톡 알림 초기화 실패: {str(e)}")
         
+    @traced('driver_setup')
     def setup_driver(self):
-        """Chrome 드라이버 설정"""
+        """드라이버 설정 (driver_factory가 없으면 Chrome)"""
         try:
-            chrome_options = Options()
-            
-            if self.config.get('headless', False):
-                chrome_options.add_argument('--headless=new')
-            
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument(
-                'user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            is_mac_arm = platform.system() == 'Darwin' and platform.machine() == 'arm64'
-            
-            if is_mac_arm:
-                logger.info("🍎 Mac ARM64 감지됨")
-            
             try:
-                logger.info("ChromeDriver 설치 중...")
-                from webdriver_manager.chrome import ChromeDriverManager
-                
-                if is_mac_arm:
-                    driver_path = ChromeDriverManager().install()
-                    possible_paths = [
-                        os.path.join(os.path.dirname(driver_path), 'chromedriver-mac-arm64', 'chromedriver'),
-                        os.path.join(os.path.dirname(driver_path), 'chromedriver'),
-                        driver_path
-                    ]
-                    
-                    actual_driver_path = None
-                    for path in possible_paths:
-                        if os.path.exists(path) and os.path.isfile(path):
-                            if not os.access(path, os.X_OK):
-                                os.chmod(path, 0o755)
-                            actual_driver_path = path
-                            break
-                    
-                    if actual_driver_path:
-                        service = Service(actual_driver_path)
-                    else:
-                        raise Exception("ChromeDriver not found")
+                if self.driver_factory:
+                    self.driver = self.driver_factory()
                 else:
-                    driver_path = ChromeDriverManager().install()
-                    service = Service(driver_path)
-                
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                    self.driver = self._create_chrome_driver()
+                if self.profiler:
+                    self.profiler.attach(self.driver)
+                if self.flight_recorder:
+                    self.flight_recorder.attach(self.driver)
+                self.metrics.instrument_driver(self.driver, **self.metric_labels)
+                if self.session_recorder:
+                    self.session_recorder.attach(self.driver)
+                if self.network_capture:
+                    self.network_capture.attach(self.driver)
+                self.browser = create_backend(
+                    self.config.get('browser_backend', 'selenium'), self.driver, profiler=self.profiler
+                )
+                # 첫 페이지 이동 전에 쿠키 일괄 설정
+                self.inject_stored_cookies()
                 logger.info("✅ ChromeDriver 초기화 완료")
                 
             except Exception as e:
@@ -123,20 +491,303 @@ class GolfBookingBot:
             logger.error(f"❌ 드라이버 설정 실패: {str(e)}")
             return False
     
+    def _create_chrome_driver(self):
+        """Chrome 옵션 구성 + ChromeDriver 설치 후 webdriver.Chrome 생성"""
+        chrome_options = Options()
+        
+        if self.config.get('headless', False):
+            chrome_options.add_argument('--headless=new')
+        
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument('--window-size=1920,1080')
+        if self.session_recorder or self.network_capture:
+            # 세션 기록 / 시간표 캡처: 네트워크 응답을 performance 로그로 수집
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        chrome_options.add_argument(
+            'user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) '
+            'Chrome/120.0.0.0 Safari/537.36'
+        )
+        
+        is_mac_arm = platform.system() == 'Darwin' and platform.machine() == 'arm64'
+        
+        if is_mac_arm:
+            logger.info("🍎 Mac ARM64 감지됨")
+        
+        logger.info("ChromeDriver 설치 중...")
+        from webdriver_manager.chrome import ChromeDriverManager
+        
+        if is_mac_arm:
+            with _driver_install_lock:
+                driver_path = ChromeDriverManager().install()
+            possible_paths = [
+                os.path.join(os.path.dirname(driver_path), 'chromedriver-mac-arm64', 'chromedriver'),
+                os.path.join(os.path.dirname(driver_path), 'chromedriver'),
+                driver_path
+            ]
+            
+            actual_driver_path = None
+            for path in possible_paths:
+                if os.path.exists(path) and os.path.isfile(path):
+                    if not os.access(path, os.X_OK):
+                        os.chmod(path, 0o755)
+                    actual_driver_path = path
+                    break
+            
+            if actual_driver_path:
+                service = Service(actual_driver_path)
+            else:
+                raise Exception("ChromeDriver not found")
+        else:
+            with _driver_install_lock:
+                driver_path = ChromeDriverManager().install()
+            service = Service(driver_path)
+        
+        return webdriver.Chrome(service=service, options=chrome_options)
+    
+    def _is_driver_alive(self):
+        """드라이버 세션이 살아있는지 확인"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def prepare_session(self, refresh_login=False):
+        """
+        드라이버 + 로그인 준비 (살아있는 드라이버가 있으면 재사용)
+
+        Args:
+            refresh_login: True면 드라이버는 재사용하되 로그인은 다시 확인
+
+        Returns:
+            bool: 성공 여부
+        """
+        if self._is_driver_alive():
+            if self.logged_in and not refresh_login:
+                logger.info("♻️  기존 ChromeDriver/로그인 세션 재사용")
+                self._count_login('session')
+                return True
+            logger.info("♻️  기존 ChromeDriver 재사용")
+        else:
+            # 죽은 드라이버에 붙어 있던 DevTools 연결도 정리 (새 드라이버에서 다시 만듦)
+            if self.browser:
+                try:
+                    self.browser.close()
+                except Exception:
+                    pass
+                self.browser = None
+            self.driver = None
+            self.logged_in = False
+            self.cookies_injected = False
+            if not self.setup_driver():
+                return False
+
+        self.login_path = None
+        self.logged_in = self.naver_login()
+        self._count_login(self.login_path if self.logged_in else 'failed')
+        if self.logged_in:
+            self.refresh_notification_token()
+        return self.logged_in
+
+    def _count_login(self, path):
+        self.metrics.counter(
+            'golf_login_total', '로그인 경로별 횟수 (session/cookie/manual/captcha/failed)'
+        ).inc(path=path or 'unknown', **self.metric_labels)
+
+    def _collect_runtime_metrics(self):
+        """지표 내보내기 직전 게이지 갱신 (Chrome 메모리, 알림 대기열)"""
+        rss = 0
+        if self.driver:
+            try:
+                rss = process_tree_rss_bytes(self.driver.service.process.pid)
+            except Exception:
+                rss = 0
+        self.metrics.gauge(
+            'golf_chrome_rss_bytes', 'chromedriver + Chrome 프로세스 RSS 합계'
+        ).set(rss, **self.metric_labels)
+        # 알림을 한 번도 보내지 않았으면(카카오 비활성 등) 큐 스레드를 띄우지 않고 0
+        dispatcher = current_notification_dispatcher()
+        self.metrics.gauge(
+            'golf_notification_queue_depth', '전송 대기 중인 알림 수'
+        ).set(dispatcher.pending if dispatcher else 0)
+
+    def refresh_notification_token(self, margin=None):
+        """
+        카카오 토큰을 준비 시간에 미리 갱신 (예약 직후 알림이 요청 한 번으로 끝나도록)
+
+        Args:
+            margin: 남은 시간이 이 값(초)보다 적으면 갱신 (None이면 기본값)
+        """
+        if not self.kakao_notifier:
+            return
+        try:
+            if margin is None:
+                self.kakao_notifier.ensure_fresh_token()
+            else:
+                self.kakao_notifier.ensure_fresh_token(margin)
+        except Exception as e:
+            logger.warning(f"⚠️  카카오 토큰 사전 갱신 실패: {str(e)}")
+
+    def release_driver(self):
+        """모드 종료 시 드라이버 정리 (keep_driver면 다음 작업을 위해 유지)"""
+        if not self.driver or self.keep_driver:
+            return
+        time.sleep(3)
+        self.close_driver()
+
+    def start_trace(self, run_name):
+        """실행 단위 타임라인 시작 (단계별 span은 이후 self.tracer에 기록)"""
+        # 다중 계정/지점 동시 실행 시 파일이 겹치지 않도록 계정·지점 이름을 붙인다
+        account = self.config.get('name')
+        label = '_'.join(str(part) for part in (run_name, account, self.branch['name']) if part)
+        self.tracer = Tracer(label, meta={
+            'mode': run_name,
+            'branch': self.branch['name'],
+            'account': account,
+        })
+        if self.profiler:
+            self.profiler.reset()
+        if self.session_recorder:
+            self.session_recorder.reset(self.tracer.origin)
+        self.last_booking_info = {}
+        self._failure_captured = False
+        return self.tracer
+
+    def finish_trace(self, success):
+        """실행 기록 저장 + 타임라인 저장 (config: history_db, trace_dir, trace_chrome_export)"""
+        if self.profiler:
+            commands = self.profiler.summary()
+            self.tracer.meta['driver_commands'] = commands
+            logger.info("📊 WebDriver 명령 프로파일\n" + self.profiler.format_table(commands))
+        self.record_run(success)
+        self.metrics.counter('golf_runs_total', '모드/결과별 실행 수').inc(
+            mode=self.tracer.meta.get('mode', 'unknown'), result='success' if success else 'failure',
+            **self.metric_labels
+        )
+        if not success and not self._failure_captured:
+            self.capture_failure('run_failed', error=self.last_booking_info.get('error'))
+        if self.session_recorder:
+            self.tracer.meta['success'] = bool(success)
+            self.session_recorder.save(self.tracer)
+        if not self.config.get('enable_trace', True):
+            return None
+        self.tracer.meta['success'] = bool(success)
+        return self.tracer.save(
+            self.config.get('trace_dir', 'traces'),
+            chrome_export=self.config.get('trace_chrome_export', False),
+        )
+
+    def record_run(self, success):
+        """실행 기록 저장소에 이번 시도 한 건 기록"""
+        if not self.config.get('enable_history', True):
+            return
+        try:
+            # 스키마 확인은 봇마다 한 번만 (상주 모드에서는 실행마다 기록)
+            if self.run_history is None:
+                self.run_history = RunHistory(self.config.get('history_db', 'booking_history.db'))
+            self.run_history.record(
+                started_at=self.tracer.started_at,
+                mode=self.tracer.meta.get('mode', self.tracer.run_name),
+                success=success,
+                branch=self.branch['name'],
+                account=self.tracer.meta.get('account'),
+                booths_tried=[
+                    span['attrs']['booth'] for span in self.tracer.span_dicts()
+                    if span['name'] == 'booth_scan'
+                ],
+                booking_info=self.last_booking_info,
+                duration_ms=self.tracer.elapsed_ms(),
+                phases=self.tracer.phase_durations(),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  실행 기록 저장 실패: {str(e)}")
+
+    def capture_failure(self, reason, **extra):
+        """
+        실패 번들 캡처 (스크린샷 / DOM은 지금 읽고, 파일 저장은 백그라운드)
+
+        Args:
+            reason: 실패 사유 (예: 'confirm_not_found')
+            extra: 번들에 함께 남길 정보
+        """
+        if not self.flight_recorder:
+            return None
+        self._failure_captured = True
+        return self.flight_recorder.capture(
+            self.driver if self._is_driver_alive() else None,
+            reason,
+            spans=self.tracer.last_spans(self.flight_recorder.span_count),
+            extra=dict(extra, branch=self.branch['name']),
+        )
+
+    def close_driver(self):
+        """드라이버 강제 종료"""
+        if self.flight_recorder:
+            # 아직 저장 중인 실패 기록을 마저 쓰고 종료
+            self.flight_recorder.drain()
+        if self.browser:
+            self.browser.close()
+            self.browser = None
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        self.wait = None
+        self.logged_in = False
+
+    def inject_stored_cookies(self):
+        """
+        저장된 네이버 쿠키를 DevTools 명령(Network.setCookies) 한 번으로 설정
+
+        add_cookie는 현재 페이지 도메인의 쿠키만 받으므로 naver.com / 타석 페이지를 먼저 열고 쿠키를 넣은 뒤
+        새로고침해야 했다. Network.setCookies는 도메인과 상관없이 받으므로 첫 페이지 이동 전에 모든
+        네이버 서브도메인 쿠키를 넣어 두고, 이후 타석마다 페이지를 한 번만 연다.
+
+        Returns:
+            bool: 설정 여부 (쿠키 파일이 없거나 Chrome이 아니면 False → 기존 add_cookie 경로)
+        """
+        self.cookies_injected = False
+        if not os.path.exists(self.cookie_file):
+            return False
+        try:
+            import pickle
+            with open(self.cookie_file, 'rb') as f:
+                cookies = [c for c in pickle.load(f) if 'naver.com' in c.get('domain', '')]
+            if not cookies or not self.browser.set_cookies(cookies):
+                return False
+        except Exception as e:
+            logger.debug("쿠키 일괄 설정 실패: %s", e)
+            return False
+        self.cookies_injected = True
+        logger.info(f"🍪 저장된 쿠키 {len(cookies)}개 일괄 설정")
+        return True
+
     def save_cookies(self):
         """로그인 쿠키 저장 (나중에 재사용 가능)"""
         try:
             import pickle
             cookies = self.driver.get_cookies()
-            with open('naver_cookies.pkl', 'wb') as f:
+            with open(self.cookie_file, 'wb') as f:
                 pickle.dump(cookies, f)
             logger.info("✅ 쿠키 저장 완료")
+            # 방금 저장한 쿠키는 이 브라우저 세션에서 온 것이므로 다시 넣지 않고,
+            # 이후 타석마다 쿠키 재적용 / 새로고침만 생략
+            self.cookies_injected = True
         except Exception as e:
             logger.warning(f"⚠️  쿠키 저장 실패: {str(e)}")
 
     def send_booking_notification(self, booth_text, date, day_name, time_slot):
         """
-        예약 완료 카카오톡 알림 전송
+        예약 완료 카카오톡 알림 전송 (백그라운드 큐에 넣고 즉시 반환)
 
         Args:
             booth_text: 타석 이름
@@ -156,26 +807,34 @@ class GolfBookingBot:
 📅 날짜: {date} ({day_name})
 ⏰ 시간: {time_slot}
 ━━━━━━━━━━━━━━━━━━━━━━
-✅ 메이저골프아카데미 중계점"""
+✅ 메이저골프아카데미 {self.branch['name']}"""
 
             # 예약 내역 페이지 링크
             booking_url = "https://booking.naver.com/my/bookings"
 
-            # 메시지 전송
-            success = self.kakao_notifier.send_message(
-                text=message,
-                link_url=booking_url,
-                link_title="예약 내역 확인"
+            # 메시지 전송 (예약 흐름이 알림 I/O를 기다리지 않도록 큐로 위임)
+            get_notification_dispatcher().submit(
+                self._deliver_booking_notification, message, booking_url
             )
-
-            if success:
-                logger.info("✅ 카카오톡 알림 전송 완료")
-            else:
-                logger.warning("⚠️  카카오톡 알림 전송 실패")
+            logger.info("📨 카카오톡 알림 전송 대기열에 추가")
 
         except Exception as e:
             logger.error(f"❌ 카카오톡 알림 전송 오류: {str(e)}")
 
+    def _deliver_booking_notification(self, message, booking_url):
+        """예약 완료 알림 실제 전송 (알림 큐 스레드에서 실행)"""
+        success = self.kakao_notifier.send_message(
+            text=message,
+            link_url=booking_url,
+            link_title="예약 내역 확인"
+        )
+
+        if success:
+            logger.info("✅ 카카오톡 알림 전송 완료")
+        else:
+            logger.warning("⚠️  카카오톡 알림 전송 실패")
+
+    @traced('login')
     def naver_login(self):
         """네이버 로그인 - 쿠키 우선, 실패시 수동 로그인"""
         try:
@@ -186,42 +845,47 @@ class GolfBookingBot:
             # 1단계: 쿠키로 로그인 시도
             logger.info("🍪 저장된 쿠키로 로그인 시도 중...")
             self.driver.get("https://naver.com")
-            time.sleep(2)
 
             # 쿠키 로드 시도
             import pickle
             import os
-            if os.path.exists('naver_cookies.pkl'):
+            if self.cookies_injected or os.path.exists(self.cookie_file):
                 try:
-                    with open('naver_cookies.pkl', 'rb') as f:
-                        cookies = pickle.load(f)
+                    if self.cookies_injected:
+                        # 드라이버 시작 때 일괄 설정했으므로 첫 페이지부터 쿠키가 적용된 상태
+                        logger.info("✅ 쿠키 적용됨 (일괄 설정)")
+                    else:
+                        time.sleep(2)
+                        with open(self.cookie_file, 'rb') as f:
+                            cookies = pickle.load(f)
 
-                    for cookie in cookies:
-                        try:
-                            self.driver.add_cookie(cookie)
-                        except:
-                            pass
+                        for cookie in cookies:
+                            try:
+                                self.driver.add_cookie(cookie)
+                            except:
+                                pass
 
-                    logger.info("✅ 쿠키 로드 완료")
+                        logger.info("✅ 쿠키 로드 완료")
 
-                    # 쿠키 적용 확인을 위해 새로고침
-                    self.driver.refresh()
-                    time.sleep(2)
+                        # 쿠키 적용 확인을 위해 새로고침
+                        self.driver.refresh()
+                        time.sleep(2)
 
                     # 로그인 상태 확인
                     if self._check_login_status():
                         logger.info("✅ 쿠키 로그인 성공! (캡챠 회피)")
+                        self.login_path = 'cookie'
 
-                        # 바로 메이저골프아카데미 중계점으로 이동
-                        logger.info("🏌️ 메이저골프아카데미 중계점으로 이동 중...")
-                        self.driver.get("https://booking.naver.com/booking/13/bizes/1063794")
+                        # 바로 메이저골프아카데미 지점 예약 페이지로 이동
+                        logger.info(f"🏌️ 메이저골프아카데미 {self.branch['name']}으로 이동 중...")
+                        self.driver.get(self.branch['booking_url'])
 
                         # 페이지 로드 대기
                         try:
                             WebDriverWait(self.driver, 5).until(
                                 EC.presence_of_element_located((By.TAG_NAME, "body"))
                             )
-                            logger.info("✅ 메이저골프아카데미 중계점 페이지 로드 완료")
+                            logger.info(f"✅ 메이저골프아카데미 {self.branch['name']} 페이지 로드 완료")
                         except:
                             time.sleep(1)
 
@@ -306,6 +970,7 @@ class GolfBookingBot:
                 
                 if "nid.naver.com/nidlogin" not in current_url:
                     logger.info("✅ 네이버 로그인 성공!")
+                    self.login_path = 'manual'
                     self.save_cookies()
                     return True
                 
@@ -320,6 +985,7 @@ class GolfBookingBot:
                             current_url = self.driver.current_url
                             if "nid.naver.com/nidlogin" not in current_url:
                                 logger.info("✅ 캡차 통과! 로그인 성공!")
+                                self.login_path = 'captcha'
                                 self.save_cookies()
                                 return True
                         except:
@@ -406,6 +1072,7 @@ class GolfBookingBot:
                 
                 if "nid.naver.com/nidlogin" not in current_url:
                     logger.info("✅ 네이버 로그인 성공!")
+                    self.login_path = 'manual'
                     self.save_cookies()
                     return True
                 
@@ -420,6 +1087,7 @@ class GolfBookingBot:
                             current_url = self.driver.current_url
                             if "nid.naver.com/nidlogin" not in current_url:
                                 logger.info("✅ 캡차 통과! 로그인 성공!")
+                                self.login_path = 'captcha'
                                 self.save_cookies()
                                 return True
                         except:
@@ -447,14 +1115,13 @@ class GolfBookingBot:
             return
         
         try:
-            from kakao_notification import KakaoNotifier
-            
             kakao_api_key = self.config.get('kakao_rest_api_key')
             if not kakao_api_key:
                 logger.warning("⚠️  카카오 REST API 키가 설정되지 않았습니다")
                 return
             
-            notifier = KakaoNotifier(kakao_api_key)
+            # 공용 알림 객체 재사용 (토큰 파일을 매번 다시 읽지 않음)
+            notifier = get_kakao_notifier(kakao_api_key)
             
             if success:
                 text = f"""🎉 골프 예약 성공!
@@ -471,8 +1138,9 @@ class GolfBookingBot:
 
 시도 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             
-            notifier.send_message(text)
-            logger.info("✅ 카카오톡 알림 전송 완료")
+            # 알림 큐에서 전송 (예약 흐름/종료 처리를 막지 않음)
+            get_notification_dispatcher().submit(notifier.send_message, text)
+            logger.info("📨 카카오톡 알림 전송 대기열에 추가")
             
         except Exception as e:
             logger.warning(f"⚠️  카카오톡 알림 전송 실패: {str(e)}")
@@ -687,12 +1355,12 @@ class GolfBookingBot:
         """특정 도메인으로 이동 후 쿠키 재적용"""
         try:
             import pickle
-            if not os.path.exists('naver_cookies.pkl'):
+            if not os.path.exists(self.cookie_file):
                 logger.warning("⚠️  쿠키 파일이 없습니다")
                 return False
             
             # 쿠키 로드
-            with open('naver_cookies.pkl', 'rb') as f:
+            with open(self.cookie_file, 'rb') as f:
                 cookies = pickle.load(f)
             
             # 타겟 도메인으로 먼저 이동
@@ -718,7 +1386,7 @@ class GolfBookingBot:
                             self.driver.add_cookie(cookie)
                             applied += 1
                 except Exception as e:
-                    logger.debug(f"쿠키 적용 실패: {cookie.get('name', 'unknown')} - {str(e)}")
+                    logger.debug("쿠키 적용 실패: %s - %s", cookie.get('name', 'unknown'), e)
 
             if applied > 0:
                 logger.info(f"✅ {applied}개 쿠키 적용 완료")
@@ -776,6 +1444,7 @@ class GolfBookingBot:
 
     # ==================== 공통 예약 함수들 ====================
 
+    @traced('date_select')
     def _select_date(self, target_day):
         """
         날짜 선택 공통 함수
@@ -812,6 +1481,7 @@ class GolfBookingBot:
             logger.error(f"❌ 날짜 선택 오류: {str(e)}")
             return False
 
+    @traced('time_select')
     def _select_time(self, time_text):
         """
         시간 선택 공통 함수
@@ -848,6 +1518,7 @@ class GolfBookingBot:
             logger.error(f"❌ 시간 선택 오류: {str(e)}")
             return False
 
+    @traced('next')
     def _click_next_button(self):
         """
         '다음' 버튼 클릭 공통 함수
@@ -875,6 +1546,7 @@ class GolfBookingBot:
             logger.error(f"❌ '다음' 버튼 클릭 실패: {str(e)}")
             return False
 
+    @traced('agree')
     def _click_agree_and_book(self):
         """
         '동의하고 예약하기' 버튼 클릭 공통 함수
@@ -911,12 +1583,14 @@ class GolfBookingBot:
                     continue
 
             logger.error("❌ '동의하고 예약하기' 버튼을 찾지 못함")
+            self.capture_failure('agree_button_not_found')
             return False
 
         except Exception as e:
             logger.error(f"❌ '동의하고 예약하기' 버튼 처리 실패: {str(e)}")
             return False
 
+    @traced('confirm')
     def _confirm_booking(self):
         """
         예약 완료 확인 공통 함수 (URL 패턴으로)
@@ -968,6 +1642,7 @@ class GolfBookingBot:
             if not confirmed:
                 logger.error("❌ 예약 실패: 예약 완료를 확인할 수 없음")
                 logger.info(f"현재 URL: {self.driver.current_url}")
+                self.capture_failure('confirm_not_found')
                 return False
 
             return True
@@ -1004,11 +1679,7 @@ class GolfBookingBot:
     def book_earliest_slot(self):
         """0번 모드: 여러 타석을 순회하며 가장 빠른 예약 가능 타석 찾기"""
         try:
-            booking_url = (
-                "https://map.naver.com/p/search/%EB%A9%94%EC%9D%B4%EC%A0%80"
-                "%EA%B3%A8%ED%94%84%EC%95%84%EC%B9%B4%EB%8D%B0%EB%AF%B8/"
-                "place/1076834793?placePath=/ticket"
-            )
+            booking_url = self.branch['map_url']
 
             logger.info(f"🔗 예약 페이지 접속...")
             self.driver.get(booking_url)
@@ -1094,175 +1765,179 @@ class GolfBookingBot:
                 logger.info(f"🎯 {booth_info['text']} 확인 중... ({booth_idx + 1}/{len(booth_infos)})")
                 logger.info(f"{'=' * 60}")
                 
-                try:
-                    # 타석 링크로 이동 (쿠키 적용 건너뛰고 세션 유지)
-                    logger.info(f"🔗 {booth_info['text']} 페이지로 이동...")
-                    self.driver.get(booth_info['href'])
-
-                    # 페이지 로드 완료 대기 (body 요소가 나타날 때까지)
+                booth_match = re.search(r'(\d+)번타석', booth_info['text'])
+                booth_num = int(booth_match.group(1)) if booth_match else booth_info['text']
+                with self.tracer.span('booth_scan', booth=booth_num):
                     try:
-                        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    except:
-                        pass
+                        # 타석 링크로 이동 (쿠키 적용 건너뛰고 세션 유지)
+                        logger.info(f"🔗 {booth_info['text']} 페이지로 이동...")
+                        self.driver.get(booth_info['href'])
+
+                        # 페이지 로드 완료 대기 (body 요소가 나타날 때까지)
+                        try:
+                            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                        except:
+                            pass
 
-                    # 로그인 페이지로 리다이렉트 되었는지 확인
-                    current_url = self.driver.current_url
-                    if 'nid.naver.com/nidlogin' in current_url or 'login' in current_url.lower():
-                        logger.error("❌ 로그인 페이지로 리다이렉트됨 - 로그인 필요")
-                        logger.error("프로그램을 재시작하고 다시 로그인해주세요")
-                        return False, {'error': '로그인 필요'}
+                        # 로그인 페이지로 리다이렉트 되었는지 확인
+                        current_url = self.driver.current_url
+                        if 'nid.naver.com/nidlogin' in current_url or 'login' in current_url.lower():
+                            logger.error("❌ 로그인 페이지로 리다이렉트됨 - 로그인 필요")
+                            logger.error("프로그램을 재시작하고 다시 로그인해주세요")
+                            return False, {'error': '로그인 필요'}
                     
-                    # 3일간 확인
-                    for day_offset in range(3):
-                        if found_slot:
-                            break
+                        # 3일간 확인
+                        for day_offset in range(3):
+                            if found_slot:
+                                break
                         
-                        target_date = today + timedelta(days=day_offset)
-                        target_day = target_date.day
-                        day_label = ["오늘", "내일", "모레"][day_offset]
-                        weekday_name = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일'][target_date.weekday()]
-                        day_name = f"{weekday_name}, {day_label}"
+                            target_date = today + timedelta(days=day_offset)
+                            target_day = target_date.day
+                            day_label = ["오늘", "내일", "모레"][day_offset]
+                            weekday_name = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일'][target_date.weekday()]
+                            day_name = f"{weekday_name}, {day_label}"
 
-                        logger.info(f"\n  📅 {day_label} ({target_date.strftime('%Y-%m-%d')} {weekday_name})")
+                            logger.info(f"\n  📅 {day_label} ({target_date.strftime('%Y-%m-%d')} {weekday_name})")
                         
-                        # 날짜 선택
-                        if day_offset > 0:
-                            try:
-                                # 여러 패턴의 날짜 버튼 시도
-                                date_selectors = [
-                                    f"//button[text()='{target_day}']",
-                                    f"//button[contains(text(), '{target_day}')]",
-                                    f"//*[contains(@class, 'date')]//*[text()='{target_day}']",
-                                ]
+                            # 날짜 선택
+                            if day_offset > 0:
+                                try:
+                                    # 여러 패턴의 날짜 버튼 시도
+                                    date_selectors = [
+                                        f"//button[text()='{target_day}']",
+                                        f"//button[contains(text(), '{target_day}')]",
+                                        f"//*[contains(@class, 'date')]//*[text()='{target_day}']",
+                                    ]
                                 
-                                date_selected = False
-                                for selector in date_selectors:
-                                    try:
-                                        date_elements = self.driver.find_elements(By.XPATH, selector)
-                                        for elem in date_elements:
-                                            try:
-                                                if elem.is_displayed():
-                                                    elem_text = elem.text.strip()
-                                                    if elem_text == str(target_day):
-                                                        elem.click()
-                                                        date_selected = True
-                                                        logger.info(f"    ✅ {target_day}일 선택")
-                                                        # 날짜 변경 후 시간대 버튼이 로드될 때까지 대기
-                                                        try:
-                                                            WebDriverWait(self.driver, 3).until(
-                                                                EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'btn_time')]"))
-                                                            )
-                                                        except:
-                                                            time.sleep(0.5)  # 최소 대기
-                                                        break
-                                            except:
-                                                continue
-                                        if date_selected:
-                                            break
-                                    except:
-                                        continue
+                                    date_selected = False
+                                    for selector in date_selectors:
+                                        try:
+                                            date_elements = self.driver.find_elements(By.XPATH, selector)
+                                            for elem in date_elements:
+                                                try:
+                                                    if elem.is_displayed():
+                                                        elem_text = elem.text.strip()
+                                                        if elem_text == str(target_day):
+                                                            elem.click()
+                                                            date_selected = True
+                                                            logger.info(f"    ✅ {target_day}일 선택")
+                                                            # 날짜 변경 후 시간대 버튼이 로드될 때까지 대기
+                                                            try:
+                                                                WebDriverWait(self.driver, 3).until(
+                                                                    EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'btn_time')]"))
+                                                                )
+                                                            except:
+                                                                time.sleep(0.5)  # 최소 대기
+                                                            break
+                                                except:
+                                                    continue
+                                            if date_selected:
+                                                break
+                                        except:
+                                            continue
                                 
-                                if not date_selected:
-                                    logger.info(f"    ℹ️  {target_day}일 선택 안됨 (기본값일 수 있음)")
+                                    if not date_selected:
+                                        logger.info(f"    ℹ️  {target_day}일 선택 안됨 (기본값일 수 있음)")
                                     
-                            except Exception as e:
-                                logger.debug(f"    날짜 선택 오류: {str(e)}")
+                                except Exception as e:
+                                    logger.debug("    날짜 선택 오류: %s", e)
                         
-                        # 시간대 확인 (시간 버튼이 로드될 때까지 대기)
-                        try:
-                            # 시간 버튼이 로드될 때까지 대기
-                            self.wait.until(
-                                EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'btn_time')]"))
-                            )
+                            # 시간대 확인 (시간 버튼이 로드될 때까지 대기)
+                            try:
+                                # 시간 버튼이 로드될 때까지 대기
+                                self.wait.until(
+                                    EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'btn_time')]"))
+                                )
 
-                            # btn_time 클래스 버튼들 찾기
-                            time_buttons = self.driver.find_elements(
-                                By.XPATH,
-                                "//button[contains(@class, 'btn_time')]"
-                            )
+                                # btn_time 클래스 버튼들 찾기
+                                time_buttons = self.driver.find_elements(
+                                    By.XPATH,
+                                    "//button[contains(@class, 'btn_time')]"
+                                )
                             
-                            logger.info(f"    시간 버튼: {len(time_buttons)}개 발견")
+                                logger.info(f"    시간 버튼: {len(time_buttons)}개 발견")
                             
-                            available_times = []
-                            for btn in time_buttons:
-                                try:
-                                    is_disabled = btn.get_attribute('disabled')
-                                    class_attr = btn.get_attribute('class') or ''
-                                    has_unselectable = 'unselectable' in class_attr
-                                    is_visible = btn.is_displayed()
-                                    time_text = btn.text.strip()
+                                available_times = []
+                                for btn in time_buttons:
+                                    try:
+                                        is_disabled = btn.get_attribute('disabled')
+                                        class_attr = btn.get_attribute('class') or ''
+                                        has_unselectable = 'unselectable' in class_attr
+                                        is_visible = btn.is_displayed()
+                                        time_text = btn.text.strip()
                                     
-                                    logger.debug(f"      {time_text}: disabled={is_disabled}, unselectable={has_unselectable}, visible={is_visible}")
+                                        logger.debug("      %s: disabled=%s, unselectable=%s, visible=%s",
+                                                     time_text, is_disabled, has_unselectable, is_visible)
                                     
-                                    # 예약 가능 조건: disabled가 없고, unselectable 클래스가 없고, 보이는 상태
-                                    if not is_disabled and not has_unselectable and is_visible and ':' in time_text:
-                                        available_times.append((time_text, btn))
-                                        logger.info(f"      ✅ {time_text}")
-                                    else:
-                                        reason = []
-                                        if is_disabled:
-                                            reason.append("disabled")
-                                        if has_unselectable:
-                                            reason.append("unselectable")
-                                        if reason:
-                                            logger.debug(f"      ❌ {time_text} 예약 불가능 ({', '.join(reason)})")
-                                except Exception as e:
-                                    logger.debug(f"      버튼 처리 실패: {str(e)}")
-                                    continue
+                                        # 예약 가능 조건: disabled가 없고, unselectable 클래스가 없고, 보이는 상태
+                                        if not is_disabled and not has_unselectable and is_visible and ':' in time_text:
+                                            available_times.append((time_text, btn))
+                                            logger.info(f"      ✅ {time_text}")
+                                        else:
+                                            reason = []
+                                            if is_disabled:
+                                                reason.append("disabled")
+                                            if has_unselectable:
+                                                reason.append("unselectable")
+                                            if reason:
+                                                logger.debug("      ❌ %s 예약 불가능 (%s)", time_text, lazy(', '.join, reason))
+                                    except Exception as e:
+                                        logger.debug("      버튼 처리 실패: %s", e)
+                                        continue
                             
-                            logger.info(f"    예약 가능: {[t[0] for t in available_times]}")
+                                logger.info(f"    예약 가능: {[t[0] for t in available_times]}")
                             
-                            if available_times:
-                                # 가장 빠른 시간 선택
-                                first_time_text, first_time_btn = available_times[0]
+                                if available_times:
+                                    # 가장 빠른 시간 선택
+                                    first_time_text, first_time_btn = available_times[0]
                                 
-                                found_slot = {
-                                    'booth_text': booth_info['text'],
-                                    'booth_idx': booth_idx + 1,
-                                    'booth_href': booth_info['href'],
-                                    'date': target_date.strftime('%Y-%m-%d'),
-                                    'day_name': day_name,
-                                    'time': first_time_text,
-                                    'time_btn': first_time_btn
-                                }
+                                    found_slot = {
+                                        'booth_text': booth_info['text'],
+                                        'booth_idx': booth_idx + 1,
+                                        'booth_href': booth_info['href'],
+                                        'date': target_date.strftime('%Y-%m-%d'),
+                                        'day_name': day_name,
+                                        'time': first_time_text,
+                                        'time_btn': first_time_btn
+                                    }
                                 
-                                logger.info(f"\n{'=' * 60}")
-                                logger.info(f"🎉 예약 가능 타석 발견!")
-                                logger.info(f"{'=' * 60}")
-                                logger.info(f"타석: {booth_info['text']}")
-                                logger.info(f"날짜: {target_date.strftime('%Y-%m-%d')} ({day_name})")
-                                logger.info(f"시간: {first_time_text}")
-                                logger.info(f"{'=' * 60}")
-                                break
+                                    logger.info(f"\n{'=' * 60}")
+                                    logger.info(f"🎉 예약 가능 타석 발견!")
+                                    logger.info(f"{'=' * 60}")
+                                    logger.info(f"타석: {booth_info['text']}")
+                                    logger.info(f"날짜: {target_date.strftime('%Y-%m-%d')} ({day_name})")
+                                    logger.info(f"시간: {first_time_text}")
+                                    logger.info(f"{'=' * 60}")
+                                    break
                                 
-                        except Exception as e:
-                            logger.warning(f"    시간대 확인 실패: {str(e)}")
-                            import traceback
-                            logger.debug(traceback.format_exc())
+                            except Exception as e:
+                                logger.warning(f"    시간대 확인 실패: {str(e)}")
+                                import traceback
+                                logger.debug(traceback.format_exc())
                     
-                    # 다음 타석 확인을 위해 메인 페이지로 돌아가기
-                    if not found_slot and booth_idx < len(booth_infos) - 1:
-                        logger.info(f"\n  ⬅️  메인 페이지로 복귀...")
-                        self.driver.get(booking_url)
-
-                        # iframe 다시 전환
-                        try:
-                            self.wait.until(EC.frame_to_be_available_and_switch_to_it("entryIframe"))
+                        # 다음 타석 확인을 위해 메인 페이지로 돌아가기
+                        if not found_slot and booth_idx < len(booth_infos) - 1:
+                            logger.info(f"\n  ⬅️  메인 페이지로 복귀...")
+                            self.driver.get(booking_url)
 
-                            # 예약 탭 클릭
+                            # iframe 다시 전환
                             try:
-                                booking_tab = self.wait.until(
-                                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '예약')]"))
-                                )
-                                booking_tab.click()
+                                self.wait.until(EC.frame_to_be_available_and_switch_to_it("entryIframe"))
+
+                                # 예약 탭 클릭
+                                try:
+                                    booking_tab = self.wait.until(
+                                        EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '예약')]"))
+                                    )
+                                    booking_tab.click()
+                                except:
+                                    pass
                             except:
-                                pass
-                        except:
-                            logger.warning("    iframe 재전환 실패")
+                                logger.warning("    iframe 재전환 실패")
                     
-                except Exception as e:
-                    logger.warning(f"  {booth_info['text']} 확인 실패: {str(e)}")
-                    continue
+                    except Exception as e:
+                        logger.warning(f"  {booth_info['text']} 확인 실패: {str(e)}")
+                        continue
             
             if not found_slot:
                 logger.error("=" * 60)
@@ -1448,11 +2123,7 @@ class GolfBookingBot:
             return False, {'error': str(e)}
         """0번 모드: 여러 타석을 순회하며 가장 빠른 예약 가능 타석 찾기"""
         try:
-            booking_url = (
-                "https://map.naver.com/p/search/%EB%A9%94%EC%9D%B4%EC%A0%80"
-                "%EA%B3%A8%ED%94%84%EC%95%84%EC%B9%B4%EB%8D%B0%EB%AF%B8/"
-                "place/1076834793?placePath=/ticket"
-            )
+            booking_url = self.branch['map_url']
             
             logger.info(f"🔗 예약 페이지 접속...")
             self.driver.get(booking_url)
@@ -1784,11 +2455,7 @@ class GolfBookingBot:
             return False, {'error': str(e)}
         """0번 모드: 여러 타석을 순회하며 가장 빠른 예약 가능 타석 찾기"""
         try:
-            booking_url = (
-                "https://map.naver.com/p/search/%EB%A9%94%EC%9D%B4%EC%A0%80"
-                "%EA%B3%A8%ED%94%84%EC%95%84%EC%B9%B4%EB%8D%B0%EB%AF%B8/"
-                "place/1076834793?placePath=/ticket"
-            )
+            booking_url = self.branch['map_url']
             
             logger.info(f"🔗 예약 페이지 접속...")
             self.driver.get(booking_url)
@@ -2069,11 +2736,7 @@ class GolfBookingBot:
             return False, {'error': str(e)}
         """0번 모드: 가장 빠른 타석 찾아서 예약"""
         try:
-            booking_url = (
-                "https://map.naver.com/p/search/%EB%A9%94%EC%9D%B4%EC%A0%80"
-                "%EA%B3%A8%ED%94%84%EC%95%84%EC%B9%B4%EB%8D%B0%EB%AF%B8/"
-                "place/1076834793?placePath=/ticket"
-            )
+            booking_url = self.branch['map_url']
             
             logger.info(f"🔗 예약 페이지 접속...")
             self.driver.get(booking_url)
@@ -2356,220 +3019,115 @@ class GolfBookingBot:
     def book_tomorrow_slot(self):
         """1번, 2번 모드: 내일(N+1일) 타석 예약 - 우선순위 후 전체 타석 확인"""
         try:
-            booking_url = (
-                "https://map.naver.com/p/search/%EB%A9%94%EC%9D%B4%EC%A0%80"
-                "%EA%B3%A8%ED%94%84%EC%95%84%EC%B9%B4%EB%8D%B0%EB%AF%B8/"
-                "place/1076834793?placePath=/ticket"
-            )
-            
             logger.info(f"🔗 예약 페이지 접속...")
-            start_time = time.time()
-            
-            self.driver.get(booking_url)
-            # 페이지 로드 대기 (iframe이 나타날 때까지)
-            try:
-                short_wait = WebDriverWait(self.driver, 5)  # 5초 타임아웃
-                short_wait.until(EC.frame_to_be_available_and_switch_to_it("entryIframe"))
-                logger.info(f"✅ iframe 전환 완료 ({time.time() - start_time:.2f}초)")
-            except TimeoutException:
-                logger.error("❌ iframe 찾기 실패")
-                return False, {}
+            booking_start = time.perf_counter()
+            booth_infos, error_info = self._load_booth_links()
+            if booth_infos is None:
+                return False, error_info
             
-            # 예약 탭 클릭 (짧은 타임아웃으로 빠르게 처리)
-            tab_start = time.time()
-            try:
-                short_wait = WebDriverWait(self.driver, 3)  # 3초 타임아웃
-                booking_tab = short_wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '예약')]"))
-                )
-                booking_tab.click()
-                logger.info(f"✅ 예약 탭 클릭 ({time.time() - tab_start:.2f}초)")
-            except TimeoutException:
-                logger.info(f"ℹ️  예약 탭이 이미 선택됨 또는 클릭 불필요 ({time.time() - tab_start:.2f}초)")
-            except Exception as e:
-                logger.debug(f"예약 탭 클릭 오류: {str(e)}")
+            # 내일 날짜 및 희망 시간 목록 계산
+            today = datetime.now()
+            tomorrow = today + timedelta(days=1)
+            weekday = tomorrow.weekday()
+            day_type = "평일" if weekday < 5 else "주말"
+            time_ladder = self._time_ladder(tomorrow)
             
             logger.info("=" * 60)
-            logger.info("🔍 타석 링크 검색")
+            logger.info(f"📅 오늘: {today.strftime('%Y-%m-%d')} ({['월','화','수','목','금','토','일'][today.weekday()]}요일)")
+            logger.info(f"📅 예약일: {tomorrow.strftime('%Y-%m-%d')} ({['월','화','수','목','금','토','일'][weekday]}요일)")
+            logger.info(f"🎯 희망 시간: {' > '.join(time_ladder)} - {day_type}")
             logger.info("=" * 60)
             
-            # 타석 링크가 나타날 때까지 대기 (짧은 타임아웃)
-            link_start = time.time()
-            try:
-                short_wait = WebDriverWait(self.driver, 5)  # 5초 타임아웃
-                short_wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'booking.naver.com')][contains(., '번타석')] | //a[contains(., '번타석예약')]"))
-                )
-                logger.info(f"✅ 타석 링크 로드 완료 ({time.time() - link_start:.2f}초)")
-            except TimeoutException:
-                # 타임아웃이어도 계속 진행 (타석 링크가 이미 있을 수 있음)
-                logger.info(f"ℹ️  타석 링크 대기 타임아웃 (계속 진행) ({time.time() - link_start:.2f}초)")
-            
-            # 타석 예약 링크 찾기
-            try:
-                booth_links = self.driver.find_elements(
-                    By.XPATH,
-                    "//a[contains(@href, 'booking.naver.com')][contains(., '번타석')]"
-                )
-                
-                if not booth_links:
-                    booth_links = self.driver.find_elements(
-                        By.XPATH,
-                        "//a[contains(., '번타석예약')]"
-                    )
-                
-                logger.info(f"발견된 타석 링크: {len(booth_links)}개")
-                
-                booth_infos = []
-                for link in booth_links:
-                    try:
-                        booth_text = link.text.strip()
-                        booth_href = link.get_attribute('href')
-                        
-                        if booth_text and '번타석' in booth_text:
-                            # 타석 번호 추출
-                            import re
-                            match = re.search(r'(\d+)번타석', booth_text)
-                            booth_num = int(match.group(1)) if match else 999
-                            
-                            booth_infos.append({
-                                'num': booth_num,
-                                'text': booth_text,
-                                'href': booth_href,
-                                'element': link
-                            })
-                            logger.info(f"  - {booth_text}")
-                    except:
-                        continue
-                
-                if not booth_infos:
-                    logger.error("❌ 타석 링크를 찾을 수 없습니다")
-                    return False, {'error': '타석 링크 없음'}
-                
-            except Exception as e:
-                logger.error(f"❌ 타석 링크 검색 실패: {str(e)}")
-                return False, {'error': str(e)}
-            
-            # 내일 날짜 및 시간 계산
-            today = datetime.now()
-            tomorrow = today + timedelta(days=1)
-            weekday = tomorrow.weekday()
-            
-            if weekday < 5:  # 월~금
-                target_time_24 = "12:00"
-                target_time_12 = "12:00"
-                day_type = "평일"
-            else:  # 토~일
-                target_time_24 = "13:00"
-                target_time_12 = "1:00"
-                day_type = "주말"
-            
-            logger.info("=" * 60)
-            logger.info(f"📅 오늘: {today.strftime('%Y-%m-%d')} ({['월','화','수','목','금','토','일'][today.weekday()]}요일)")
-            logger.info(f"📅 예약일: {tomorrow.strftime('%Y-%m-%d')} ({['월','화','수','목','금','토','일'][weekday]}요일)")
-            logger.info(f"🎯 예약 시간: {target_time_24} - {day_type}")
-            logger.info("=" * 60)
-            
-            # 1단계: 우선순위 타석 확인
-            priority_seats = [11, 7, 8, 9, 10]
-            logger.info(f"🎯 우선순위 타석: {' > '.join(map(str, priority_seats))}")
+            # 우선순위 타석 → 나머지 타석(번호 순) 순서로 한 번씩만 확인
+            scan_order, booth_by_num = self._order_booths(booth_infos)
             
             found_slot = None
             tomorrow_day = tomorrow.day
-            
-            # 우선순위 타석 확인
-            for priority_num in priority_seats:
-                if found_slot:
-                    break
-                
+            candidates = []  # (시간 순위, 확인 순서, 결과)
+            current_page_idx = None  # 현재 브라우저에 열려 있는 타석
+            
+            for scan_idx, booth_info in enumerate(scan_order):
+                if self.booking_claim and self.booking_claim.settled:
+                    logger.info("ℹ️  다른 지점에서 예약이 완료되어 검색을 중단합니다")
+                    return False, {'error': '다른 지점에서 예약 완료'}
+                current_page_idx = scan_idx
                 logger.info(f"\n{'=' * 60}")
-                logger.info(f"🎯 {priority_num}번 타석 확인 중...")
+                logger.info(f"🎯 {booth_info['text']} 확인 중... ({scan_idx + 1}/{len(scan_order)})")
                 logger.info(f"{'=' * 60}")
                 
-                # 해당 번호의 타석 링크 찾기
-                target_booth = None
-                for booth_info in booth_infos:
-                    if booth_info['num'] == priority_num:
-                        target_booth = booth_info
-                        break
-                
-                if not target_booth:
-                    logger.info(f"  ⚠️  {priority_num}번 타석 링크 없음")
+                with self.tracer.span('booth_scan', booth=booth_info['num']) as span:
+                    result = self._check_booth_availability(booth_info, tomorrow_day, time_ladder)
+                    span.attrs['ok'] = bool(result)
+                self.metrics.counter('golf_booths_scanned_total', '확인한 타석 수').inc(**self.metric_labels)
+                if not result:
                     continue
                 
-                # 타석 확인
-                result = self._check_booth_availability(
-                    target_booth, tomorrow_day, target_time_24, target_time_12
-                )
+                if not candidates:
+                    self.metrics.histogram(
+                        'golf_time_to_first_slot_seconds', '예약 페이지 접속부터 첫 예약 가능 슬롯 발견까지'
+                    ).observe(time.perf_counter() - booking_start, **self.metric_labels)
+                candidates.append((result['time_rank'], scan_idx, result))
+                logger.info(f"🎉 {booth_info['text']}에서 {result['time']} 예약 가능! (희망 {result['time_rank'] + 1}순위)")
                 
-                if result:
-                    found_slot = result
-                    logger.info(f"\n{'=' * 60}")
-                    logger.info(f"🎉 {priority_num}번 타석에서 {target_time_24} 예약 가능!")
-                    logger.info(f"{'=' * 60}")
+                # 1순위 시간이면 더 좋은 조합이 없으므로 바로 예약
+                if result['time_rank'] == 0:
                     break
             
-            # 2단계: 우선순위 타석에서 못 찾으면 모든 타석 확인
-            if not found_slot:
-                logger.info(f"\n{'=' * 60}")
-                logger.info(f"⚠️  우선순위 타석에서 {target_time_24} 예약 불가")
-                logger.info(f"🔍 다른 타석 확인 시작...")
-                logger.info(f"{'=' * 60}")
-                
-                # 우선순위가 아닌 타석들만 확인
-                other_booths = [b for b in booth_infos if b['num'] not in priority_seats]
-                other_booths.sort(key=lambda x: x['num'])  # 번호 순으로 정렬
-                
-                for booth_info in other_booths:
-                    if found_slot:
-                        break
-                    
-                    logger.info(f"\n🔍 {booth_info['text']} 확인 중...")
-                    
-                    result = self._check_booth_availability(
-                        booth_info, tomorrow_day, target_time_24, target_time_12
+            # 가장 좋은 (시간 순위, 타석 순서) 조합부터 예약 시도
+            candidates.sort(key=lambda c: (c[0], c[1]))
+            for _, scan_idx, result in candidates:
+                if scan_idx == current_page_idx:
+                    found_slot = result
+                    break
+                # 다른 타석 페이지로 이동했으므로 해당 시간만 다시 확인
+                logger.info(f"\n🔁 {result['booth_text']} {result['time']} 재확인...")
+                with self.tracer.span('booth_recheck', booth=result['booth_num']) as span:
+                    retry = self._check_booth_availability(
+                        booth_by_num[result['booth_num']], tomorrow_day, [result['time']]
                     )
-                    
-                    if result:
-                        found_slot = result
-                        logger.info(f"\n{'=' * 60}")
-                        logger.info(f"🎉 {booth_info['text']}에서 {target_time_24} 예약 가능!")
-                        logger.info(f"{'=' * 60}")
-                        break
+                    span.attrs['ok'] = bool(retry)
+                current_page_idx = scan_idx
+                if retry:
+                    found_slot = retry
+                    break
             
-            # 3단계: 예약 가능 타석이 없음
+            # 예약 가능 타석이 없음
             if not found_slot:
                 logger.error("=" * 60)
-                logger.error(f"❌ {tomorrow.strftime('%Y-%m-%d')} ({day_type}) {target_time_24}에")
+                logger.error(f"❌ {tomorrow.strftime('%Y-%m-%d')} ({day_type}) {', '.join(time_ladder)}에")
                 logger.error(f"   예약 가능한 타석이 없습니다")
                 logger.error("=" * 60)
                 return False, {
-                    'error': f'{tomorrow.strftime("%Y-%m-%d")} {target_time_24} 예약 불가',
+                    'error': f'{tomorrow.strftime("%Y-%m-%d")} {", ".join(time_ladder)} 예약 불가',
                     'date': tomorrow.strftime('%Y-%m-%d'),
-                    'time': target_time_24,
+                    'time': time_ladder[0] if time_ladder else None,
                     'day_type': day_type
                 }
             
-            # 예약 진행
-            logger.info(f"\n🎯 예약을 시작합니다...")
+            # 여러 지점을 동시에 검색 중이면 먼저 찾은 한 곳만 예약 진행
+            if self.booking_claim and not self.booking_claim.acquire(self.branch['name']):
+                logger.info("ℹ️  다른 지점에서 예약이 완료되어 예약을 진행하지 않습니다")
+                return False, {'error': '다른 지점에서 예약 완료'}
             
+            found_slot['branch'] = self.branch['name']
+            booked = False
             try:
-                found_slot['time_btn'].click()
-                logger.info(f"✅ {found_slot['time']} 선택")
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"❌ 시간 선택 실패: {str(e)}")
-                return False, found_slot
-            
-            # "다음" 버튼 및 로그인 처리
-            success = self._process_booking_steps()
-            if not success:
-                return False, found_slot
+                # 예약 진행
+                logger.info(f"\n🎯 예약을 시작합니다...")
+                
+                if not self._commit_slot(found_slot):
+                    return False, found_slot
+                booked = True
+            finally:
+                if self.booking_claim:
+                    # 결과를 모르는 HTTP 요청도 예약된 것으로 보고 다른 지점은 진행하지 않음 (중복 예약 방지)
+                    self.booking_claim.release(booked or found_slot.get('commit_outcome') == UNKNOWN)
             
             # 결과
             logger.info("\n" + "=" * 60)
             logger.info("🎉 예약 완료!")
             logger.info("=" * 60)
+            logger.info(f"🏌️ 지점: {self.branch['name']}")
             logger.info(f"📍 타석: {found_slot['booth_text']}")
             logger.info(f"📅 예약일: {found_slot['date']} ({found_slot['day_type']})")
             logger.info(f"⏰ 예약 시간: {found_slot['time']}")
@@ -2582,150 +3140,270 @@ class GolfBookingBot:
             logger.error(f"❌ 예약 실패: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
+            self.capture_failure('booking_exception', error=str(e))
             return False, {'error': str(e)}
     
-    def _check_booth_availability(self, booth_info, tomorrow_day, target_time_24, target_time_12):
-        """타석의 예약 가능 여부 확인"""
-        try:
-            # 타석 페이지로 이동
-            logger.info(f"  🔗 {booth_info['text']} 페이지로 이동...")
-            
-            cookie_success = self.apply_cookies_to_domain(booth_info['href'])
-            
-            if not cookie_success:
-                logger.debug("  쿠키 로그인 실패 - 현재 세션으로 진행")
-                self.driver.get(booth_info['href'])
-                # 페이지 로드 대기 (캘린더가 나타날 때까지)
+    def _commit_slot(self, found_slot):
+        """
+        찾은 슬롯 예약 확정 (HTTP 확정 → 확실히 거절되면 시간 클릭 / 다음 / 동의 브라우저 경로)
+
+        Returns:
+            bool: 예약 확정 여부 (HTTP 요청 결과를 모르면 다시 클릭하지 않고 False)
+        """
+        click_start = time.perf_counter()
+        outcome = self._http_commit(found_slot)
+        found_slot['commit_outcome'] = outcome
+        if outcome == UNKNOWN:
+            found_slot['error'] = 'HTTP 예약 요청 결과 확인 불가 (예약 내역 확인 필요)'
+            logger.error(f"❌ {found_slot['error']} - 중복 예약을 막기 위해 브라우저로 다시 예약하지 않습니다")
+            self.capture_failure('http_commit_unknown', time=found_slot['time'], booth=found_slot['booth_num'])
+            return False
+        commit_path = 'selenium' if outcome == REJECTED else 'http'
+        if commit_path == 'selenium':
+            try:
+                with self.tracer.span('time_select', booth=found_slot['booth_num'], time=found_slot['time']):
+                    found_slot['time_btn'].click()
+                    logger.info(f"✅ {found_slot['time']} 선택")
+                    time.sleep(2)
+            except Exception as e:
+                logger.error(f"❌ 시간 선택 실패: {str(e)}")
+                self.capture_failure('time_select_failed', time=found_slot['time'], booth=found_slot['booth_num'])
+                return False
+
+            # "다음" 버튼 및 로그인 처리
+            success = self._process_booking_steps()
+            if not success:
+                return False
+        confirm_seconds = time.perf_counter() - click_start
+        found_slot['commit_path'] = commit_path
+        found_slot['commit_ms'] = round(confirm_seconds * 1000, 1)
+        logger.info(f"⏱️  슬롯 선택 → 예약 확정: {found_slot['commit_ms']:.0f}ms ({commit_path})")
+        self.metrics.histogram(
+            'golf_time_to_confirm_seconds', '슬롯 선택부터 예약 확정까지 (path: http / selenium)'
+        ).observe(confirm_seconds, path=commit_path, **self.metric_labels)
+        return True
+    
+    def _http_commit(self, found_slot):
+        """
+        HTTP 예약 확정 시도 (config: http_commit, http_commit_request)
+
+        브라우저의 로그인 쿠키를 옮겨 예약 요청을 직접 보내고 예약 완료 리소스로 확인한다.
+
+        Returns:
+            str: booking_http 결과 (booked / unconfirmed / unknown / rejected) - rejected면 Selenium 클릭 체인으로 진행
+        """
+        if not self.http_booking:
+            return REJECTED
+        with self.tracer.span('http_commit', booth=found_slot['booth_num'], time=found_slot['time']) as span:
+            try:
+                # 쿠키와 같은 브라우저로 보이도록 User-Agent도 함께 옮김
+                self.http_booking.load_cookies(
+                    self.driver.get_cookies(),
+                    user_agent=self.driver.execute_script('return navigator.userAgent'),
+                )
+            except Exception as e:
+                # 쿠키를 못 옮기면 요청을 보내지 않은 것
+                result = {'outcome': REJECTED, 'error': str(e)}
+            else:
                 try:
-                    self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'calendar_date')] | //button[contains(@class, 'btn_time')]"))
+                    result = self.http_booking.commit(
+                        slot_fields(found_slot, self.branch['biz_id'], self.http_booking.origin)
                     )
-                except TimeoutException:
-                    time.sleep(0.5)  # 최소 대기
-            
-            # 로그인 페이지 체크
-            current_url = self.driver.current_url
-            if 'nid.naver.com/nidlogin' in current_url or 'login' in current_url.lower():
-                logger.warning("  ⚠️  로그인 페이지로 리다이렉트됨")
-                return None
-            
-            # 내일 날짜 선택: span.num 안에 N+1 값을 가진 요소 찾기
-            logger.info(f"  📅 {tomorrow_day}일 버튼 찾는 중...")
-            
+                except Exception as e:
+                    # 요청이 나갔는지 알 수 없으므로 다시 클릭하지 않음
+                    result = {'outcome': UNKNOWN, 'error': str(e)}
+            outcome = result['outcome']
+            span.attrs.update(ok=outcome == BOOKED, outcome=outcome, status=result.get('status'),
+                              booking_id=result.get('booking_id'))
+        if outcome == REJECTED:
+            logger.warning(f"⚠️  HTTP 예약 거절 → 브라우저로 진행: {result['error']}")
+            return outcome
+        if outcome == UNKNOWN:
+            logger.error(f"❌ HTTP 예약 요청 결과 불명: {result['error']}")
+            return outcome
+        found_slot['booking_id'] = result['booking_id']
+        found_slot['booking_url'] = result['url']
+        if outcome != BOOKED:
+            logger.warning(
+                f"⚠️  HTTP 예약번호 {result['booking_id']} 받음 - 완료 확인 실패 ({result['error']}), "
+                "예약 내역에서 확인 필요"
+            )
+            return outcome
+        logger.info(
+            f"✅ HTTP 예약 확정 (예약번호 {result['booking_id']}, 요청 {result['submit_ms']:.0f}ms"
+            + (f" + 완료 확인 {result['confirm_ms']:.0f}ms)" if result['confirm_ms'] is not None else ")")
+        )
+        return outcome
+
+    def _load_booth_links(self):
+        """
+        지도 페이지 → entryIframe → 예약 탭 → 타석 링크 목록
+
+        Returns:
+            tuple: (타석 정보 목록, None) - 실패하면 (None, 오류 정보)
+        """
+        booking_url = self.branch['map_url']
+
+        with self.tracer.span('iframe_switch') as span:
+            self.driver.get(booking_url)
+            # 페이지 로드 대기 (iframe이 나타날 때까지)
             try:
-                # span class="num" 안에 값이 N+1인 요소 찾기
-                num_span_selector = f"//span[@class='num' and text()='{tomorrow_day}']"
-                num_span = self.driver.find_element(By.XPATH, num_span_selector)
-                
-                # 부모 button class="calendar_date" 찾기
-                parent_button = num_span.find_element(By.XPATH, "./ancestor::button[contains(@class, 'calendar_date')]")
-                
-                # 예약 불가능한 클래스 확인: unselectable, dayoff, closed
-                class_attr = parent_button.get_attribute('class') or ''
-                has_unselectable = 'unselectable' in class_attr
-                has_dayoff = 'dayoff' in class_attr
-                has_closed = 'closed' in class_attr
-                
-                if has_unselectable or has_dayoff or has_closed:
-                    # 예약 불가능한 날짜이면 바로 다른 타석으로 넘어가기
-                    reason = []
-                    if has_unselectable:
-                        reason.append("unselectable")
-                    if has_dayoff:
-                        reason.append("dayoff")
-                    if has_closed:
-                        reason.append("closed")
-                    logger.info(f"  ❌ {tomorrow_day}일은 예약 불가능 ({', '.join(reason)}) - 다음 타석으로 이동")
-                    return None
-                
-                # 예약 가능한 날짜이면 클릭
-                if parent_button.is_displayed():
-                    parent_button.click()
-                    # 날짜 선택 후 시간 버튼이 나타날 때까지 대기 (최대 2초)
-                    try:
-                        self.wait.until(
-                            EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'btn_time')]"))
-                        )
-                    except TimeoutException:
-                        time.sleep(0.3)  # 최소 대기
-                    logger.info(f"  ✅ {tomorrow_day}일 선택 성공!")
-                else:
-                    logger.info(f"  ⚠️  {tomorrow_day}일 버튼이 표시되지 않음")
-                    return None
-                    
-            except NoSuchElementException:
-                # N+1일이 페이지에 없으면 (아직 오픈 안됨)
-                logger.info(f"  ⚠️  {tomorrow_day}일 버튼이 페이지에 없음 (아직 오픈 안됨)")
-                return None
+                short_wait = WebDriverWait(self.driver, 5)  # 5초 타임아웃
+                short_wait.until(EC.frame_to_be_available_and_switch_to_it("entryIframe"))
+                logger.info(f"✅ iframe 전환 완료 ({span.elapsed():.2f}초)")
+            except TimeoutException:
+                span.attrs['ok'] = False
+                logger.error("❌ iframe 찾기 실패")
+                self.capture_failure('iframe_not_found')
+                return None, {}
+
+        # 예약 탭 클릭 (짧은 타임아웃으로 빠르게 처리)
+        with self.tracer.span('booking_tab') as span:
+            try:
+                short_wait = WebDriverWait(self.driver, 3)  # 3초 타임아웃
+                booking_tab = short_wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '예약')]"))
+                )
+                booking_tab.click()
+                logger.info(f"✅ 예약 탭 클릭 ({span.elapsed():.2f}초)")
+            except TimeoutException:
+                logger.info(f"ℹ️  예약 탭이 이미 선택됨 또는 클릭 불필요 ({span.elapsed():.2f}초)")
             except Exception as e:
-                logger.debug(f"  날짜 찾기 오류: {str(e)}")
-                return None
-            
-            # 시간대 확인 (날짜 선택 시 이미 시간 버튼이 나타날 때까지 대기했음)
-            logger.info(f"  ⏰ 시간 버튼 찾는 중... (목표: {target_time_24})")
-            
-            time_buttons = self.driver.find_elements(
+                logger.debug(f"예약 탭 클릭 오류: {str(e)}")
+
+        logger.info("=" * 60)
+        logger.info("🔍 타석 링크 검색")
+        logger.info("=" * 60)
+
+        # 타석 링크가 나타날 때까지 대기 (짧은 타임아웃)
+        with self.tracer.span('booth_links') as span:
+            try:
+                short_wait = WebDriverWait(self.driver, 5)  # 5초 타임아웃
+                short_wait.until(
+                    EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'booking.naver.com')][contains(., '번타석')] | //a[contains(., '번타석예약')]"))
+                )
+                logger.info(f"✅ 타석 링크 로드 완료 ({span.elapsed():.2f}초)")
+            except TimeoutException:
+                # 타임아웃이어도 계속 진행 (타석 링크가 이미 있을 수 있음)
+                logger.info(f"ℹ️  타석 링크 대기 타임아웃 (계속 진행) ({span.elapsed():.2f}초)")
+
+        # 타석 예약 링크 찾기
+        try:
+            booth_links = self.driver.find_elements(
                 By.XPATH,
-                "//button[contains(@class, 'btn_time')]"
+                "//a[contains(@href, 'booking.naver.com')][contains(., '번타석')]"
             )
-            
-            logger.info(f"  🔍 시간 버튼: {len(time_buttons)}개 발견")
-            
-            # 발견된 시간 버튼들의 텍스트 로그 출력
-            if time_buttons:
-                available_times = []
-                for btn in time_buttons[:10]:  # 처음 10개만
-                    try:
-                        is_disabled = btn.get_attribute('disabled')
-                        class_attr = btn.get_attribute('class') or ''
-                        has_unselectable = 'unselectable' in class_attr
-                        is_visible = btn.is_displayed()
-                        time_text = btn.text.strip()
-                        if is_visible:
-                            if is_disabled or has_unselectable:
-                                status = "❌ 불가능"
-                                if is_disabled:
-                                    status += "(disabled)"
-                                if has_unselectable:
-                                    status += "(unselectable)"
-                            else:
-                                status = "✅ 가능"
-                            available_times.append(f"{time_text} ({status})")
-                    except:
-                        continue
-                if available_times:
-                    logger.info(f"  📋 발견된 시간: {', '.join(available_times)}")
-            
-            # 목표 시간 찾기
-            target_time_patterns = [target_time_24, target_time_12, f"오후 {target_time_12}"]
-            target_time_btn = None
-            
-            for btn in time_buttons:
+
+            if not booth_links:
+                booth_links = self.driver.find_elements(
+                    By.XPATH,
+                    "//a[contains(., '번타석예약')]"
+                )
+
+            logger.info(f"발견된 타석 링크: {len(booth_links)}개")
+
+            booth_infos = []
+            for link in booth_links:
                 try:
-                    is_disabled = btn.get_attribute('disabled')
-                    class_attr = btn.get_attribute('class') or ''
-                    has_unselectable = 'unselectable' in class_attr
-                    is_visible = btn.is_displayed()
-                    time_text = btn.text.strip()
-                    
-                    # 예약 가능 조건: disabled가 없고, unselectable 클래스가 없고, 보이는 상태
-                    if not is_disabled and not has_unselectable and is_visible:
-                        for pattern in target_time_patterns:
-                            if pattern in time_text:
-                                target_time_btn = btn
-                                logger.info(f"  ✅ {time_text} 예약 가능!")
-                                break
-                    
-                    if target_time_btn:
-                        break
+                    booth_text = link.text.strip()
+                    booth_href = link.get_attribute('href')
+
+                    if booth_text and '번타석' in booth_text:
+                        # 타석 번호 추출
+                        import re
+                        match = re.search(r'(\d+)번타석', booth_text)
+                        booth_num = int(match.group(1)) if match else 999
+
+                        booth_infos.append({
+                            'num': booth_num,
+                            'text': booth_text,
+                            'href': booth_href,
+                            'element': link
+                        })
+                        logger.info(f"  - {booth_text}")
                 except:
                     continue
+
+            if not booth_infos:
+                logger.error("❌ 타석 링크를 찾을 수 없습니다")
+                return None, {'error': '타석 링크 없음'}
+
+        except Exception as e:
+            logger.error(f"❌ 타석 링크 검색 실패: {str(e)}")
+            return None, {'error': str(e)}
+        
+        return booth_infos, None
+    
+    def _time_ladder(self, target_date):
+        """예약일의 희망 시간 목록 (지점 설정 > 공통 설정)"""
+        return resolve_time_ladder(dict(self.config, time_ladder=self.branch['time_ladder']), target_date)
+
+    def _order_booths(self, booth_infos):
+        """
+        타석 확인 순서: 우선순위 타석 → 나머지 타석(번호 순), 지점 카탈로그 / 배정 타석만
+
+        Returns:
+            tuple: (확인 순서 목록, 타석 번호 → 타석 정보)
+        """
+        priority_seats = self.branch['priority_seats']
+        logger.info(f"🎯 [{self.branch['name']}] 우선순위 타석: {' > '.join(map(str, priority_seats))}")
+
+        # 지점 타석 카탈로그 / 다중 계정 배정 타석만 확인 (계정 간 같은 슬롯 경쟁 방지)
+        if self.branch['booth_filter']:
+            booth_infos = [b for b in booth_infos if b['num'] in self.branch['booth_filter']]
+        allowed_booths = self.config.get('allowed_booths')
+        if allowed_booths:
+            booth_infos = [b for b in booth_infos if b['num'] in allowed_booths]
+            logger.info(f"🎯 배정 타석: {', '.join(map(str, allowed_booths))}")
+
+        booth_by_num = {b['num']: b for b in booth_infos}
+        scan_order = [booth_by_num[num] for num in priority_seats if num in booth_by_num]
+        scan_order += sorted(
+            (b for b in booth_infos if b['num'] not in priority_seats),
+            key=lambda x: x['num']
+        )
+        for num in priority_seats:
+            if num not in booth_by_num:
+                logger.info(f"  ⚠️  {num}번 타석 링크 없음")
+        return scan_order, booth_by_num
+    
+    def _check_booth_availability(self, booth_info, tomorrow_day, time_ladder):
+        """
+        타석의 예약 가능 여부 확인
+
+        시간 버튼 스냅샷을 한 번 수집해 희망 시간 목록 전체와 비교한다.
+
+        Args:
+            booth_info: 타석 정보 (num, text, href)
+            tomorrow_day: 예약일 (일)
+            time_ladder: 희망 시간 목록 (24시간제, 우선순위 순)
+
+        Returns:
+            dict: 가장 순위가 높은 예약 가능 시간 정보 (없으면 None)
+        """
+        try:
+            # 시간표 캡처를 쓰면 이 타석 페이지의 API 응답만 보도록 이전 이벤트를 비움
+            capture = self.network_capture if self.network_capture and self.network_capture.enabled else None
+            if capture:
+                capture.begin()
             
-            if target_time_btn:
+            if not self._open_booth_page(booth_info):
+                return None
+            
+            # 캡처 중이면 시간 버튼이 그려지기를 기다리지 않음 (응답 JSON으로 확인)
+            if not self._select_calendar_date(tomorrow_day, wait_for_times=capture is None):
+                return None
+            
+            # 시간대 확인 (시간표 응답 → 없으면 화면의 시간 버튼)
+            match = self._find_ladder_slot(time_ladder)
+            
+            if match:
+                time_rank, slot = match
                 tomorrow = datetime.now() + timedelta(days=1)
                 weekday = tomorrow.weekday()
                 day_type = "평일" if weekday < 5 else "주말"
                 
+                logger.info(f"  ✅ {slot['time']} ({slot['text']}) 예약 가능!")
                 logger.info(f"  ✅ 타석 예약 가능 확인 완료!")
                 return {
                     'booth_text': booth_info['text'],
@@ -2733,46 +3411,219 @@ class GolfBookingBot:
                     'booth_href': booth_info['href'],
                     'date': tomorrow.strftime('%Y-%m-%d'),
                     'day_type': day_type,
-                    'time': target_time_24,
-                    'time_btn': target_time_btn
+                    'time': slot['time'],
+                    'time_rank': time_rank,
+                    'time_btn': slot['element']
                 }
             else:
-                logger.info(f"  ❌ {target_time_24} 시간 버튼을 찾을 수 없음")
+                logger.info(f"  ❌ {', '.join(time_ladder)} 시간 버튼을 찾을 수 없음")
                 logger.info(f"  ℹ️  해당 시간대가 예약 불가능하거나 아직 오픈되지 않았을 수 있습니다")
                 return None
             
         except Exception as e:
-            logger.debug(f"  ⚠️  {booth_info['text']} 확인 실패: {str(e)}")
+            logger.debug("  ⚠️  %s 확인 실패: %s", booth_info['text'], e)
             return None
     
+    @traced('booth_page')
+    def _open_booth_page(self, booth_info):
+        """
+        타석 예약 페이지로 이동
+
+        Returns:
+            bool: 예약 페이지 로드 여부 (로그인 페이지로 리다이렉트되면 False)
+        """
+        logger.info(f"  🔗 {booth_info['text']} 페이지로 이동...")
+        
+        # 쿠키를 드라이버 시작 때 일괄 설정했으면 쿠키 재적용 / 새로고침 없이 페이지를 한 번만 연다
+        cookie_success = False
+        if not self.cookies_injected:
+            cookie_success = self.apply_cookies_to_domain(booth_info['href'])
+            if not cookie_success:
+                logger.debug("  쿠키 로그인 실패 - 현재 세션으로 진행")
+        
+        if not cookie_success:
+            self.browser.navigate(booth_info['href'])
+            # 페이지 로드 대기 (캘린더가 나타날 때까지)
+            if not self.browser.wait_for(
+                "//button[contains(@class, 'calendar_date')] | //button[contains(@class, 'btn_time')]", 20
+            ):
+                time.sleep(0.5)  # 최소 대기
+        
+        # 로그인 페이지 체크
+        current_url = self.browser.current_url()
+        if 'nid.naver.com/nidlogin' in current_url or 'login' in current_url.lower():
+            logger.warning("  ⚠️  로그인 페이지로 리다이렉트됨")
+            return False
+        return True
     
+    @traced('date_select')
+    def _select_calendar_date(self, tomorrow_day, wait_for_times=True):
+        """
+        캘린더에서 예약일 선택: span.num 안에 N+1 값을 가진 요소 찾기
+
+        Args:
+            tomorrow_day: 예약일 (일)
+            wait_for_times: 클릭 후 시간 버튼이 나타날 때까지 대기 (시간표 캡처 중이면 False)
+
+        Returns:
+            bool: 선택 성공 여부 (예약 불가 / 미오픈이면 False)
+        """
+        logger.info(f"  📅 {tomorrow_day}일 버튼 찾는 중...")
+        
+        try:
+            if self.browser.direct:
+                # 버튼 찾기 + 클래스 / 표시 여부를 명령 한 번으로
+                xpath = CALENDAR_DATE_XPATH.format(day=tomorrow_day)
+                state = self.browser.run_script(CALENDAR_DATE_STATE_JS, xpath, 5000, await_promise=True)
+                if not state:
+                    raise NoSuchElementException(xpath)
+                class_attr = state['classes'] or ''
+                is_displayed = lambda: state['visible']
+                click = BackendElement(self.browser, FIND_BY_XPATH_JS, xpath).click
+            else:
+                # span class="num" 안에 값이 N+1인 요소 찾기
+                num_span_selector = f"//span[@class='num' and text()='{tomorrow_day}']"
+                num_span = self.driver.find_element(By.XPATH, num_span_selector)
+                
+                # 부모 button class="calendar_date" 찾기
+                parent_button = num_span.find_element(By.XPATH, "./ancestor::button[contains(@class, 'calendar_date')]")
+                class_attr = parent_button.get_attribute('class') or ''
+                is_displayed = parent_button.is_displayed
+                click = parent_button.click
+            
+            # 예약 불가능한 클래스 확인: unselectable, dayoff, closed
+            has_unselectable = 'unselectable' in class_attr
+            has_dayoff = 'dayoff' in class_attr
+            has_closed = 'closed' in class_attr
+            
+            if has_unselectable or has_dayoff or has_closed:
+                # 예약 불가능한 날짜이면 바로 다른 타석으로 넘어가기
+                reason = []
+                if has_unselectable:
+                    reason.append("unselectable")
+                if has_dayoff:
+                    reason.append("dayoff")
+                if has_closed:
+                    reason.append("closed")
+                logger.info(f"  ❌ {tomorrow_day}일은 예약 불가능 ({', '.join(reason)}) - 다음 타석으로 이동")
+                return False
+            
+            # 예약 가능한 날짜이면 클릭
+            if is_displayed():
+                click()
+                if wait_for_times:
+                    self._wait_for_time_buttons()
+                logger.info(f"  ✅ {tomorrow_day}일 선택 성공!")
+                return True
+            else:
+                logger.info(f"  ⚠️  {tomorrow_day}일 버튼이 표시되지 않음")
+                return False
+                
+        except NoSuchElementException:
+            # N+1일이 페이지에 없으면 (아직 오픈 안됨)
+            logger.info(f"  ⚠️  {tomorrow_day}일 버튼이 페이지에 없음 (아직 오픈 안됨)")
+            return False
+        except Exception as e:
+            logger.debug("  날짜 찾기 오류: %s", e)
+            return False
+    
+    def _wait_for_time_buttons(self):
+        """날짜 선택 후 시간 버튼이 나타날 때까지 대기"""
+        if not self.browser.wait_for("//button[contains(@class, 'btn_time')]", 20):
+            time.sleep(0.3)  # 최소 대기
+    
+    @traced('time_snapshot')
+    def _find_ladder_slot(self, time_ladder):
+        """
+        시간 버튼 스냅샷을 수집해 희망 시간 목록과 비교 (시간표 캡처 중이면 API 응답 먼저)
+
+        Returns:
+            tuple: (희망 순위, 시간 슬롯) (예약 가능한 희망 시간이 없으면 None)
+        """
+        if self.network_capture and self.network_capture.enabled:
+            match = self._find_captured_slot(time_ladder)
+            if match is not False:
+                return match
+            # 시간표 응답을 못 받음 → 화면의 시간 버튼으로 확인
+            self._wait_for_time_buttons()
+        
+        logger.info(f"  ⏰ 시간 버튼 찾는 중... (목표: {' > '.join(time_ladder)})")
+        
+        raw_slots = self.browser.run_script(TIME_SLOT_SNAPSHOT_JS) or []
+        if self.browser.direct:
+            # DevTools 결과에는 WebElement가 없으므로 버튼 순서로 클릭
+            raw_slots = [dict(raw, index=i) for i, raw in enumerate(raw_slots)]
+        slots = to_24h_slots(raw_slots)
+        if self.browser.direct:
+            for slot in slots:
+                slot['element'] = BackendElement(self.browser, TIME_BUTTON_BY_INDEX_JS, slot['index'])
+        
+        logger.info("  🔍 시간 버튼: %d개 발견", len(slots),
+                    extra={'fields': {'event': 'time_slots', 'count': len(slots)}})
+        
+        # 발견된 시간 버튼들의 상태 로그 출력 (문자열은 기록 스레드에서 생성)
+        if any(slot.get('visible') for slot in slots):
+            logger.info("  📋 발견된 시간: %s", lazy(format_slot_states, slots))
+        
+        # 희망 시간 목록 전체와 한 번에 비교
+        return pick_ladder_match(slots, time_ladder)
+    
+    def _find_captured_slot(self, time_ladder):
+        """
+        시간표 API 응답으로 희망 시간 확인 (DOM 조회 없음)
+
+        Returns:
+            tuple: (희망 순위, 시간 슬롯) / 예약 가능한 희망 시간이 없으면 None / 응답을 못 받으면 False
+        """
+        tomorrow = datetime.now() + timedelta(days=1)
+        slots = self.network_capture.wait_for_schedule(
+            tomorrow, timeout=self.config.get('network_capture_timeout', 3)
+        )
+        if slots is None:
+            logger.info("  ℹ️  시간표 응답 없음 - 화면에서 확인")
+            return False
+        logger.info("  📡 시간표 응답: %d개 (%s)", len(slots),
+                    lazy(format_captured_slots, slots),
+                    extra={'fields': {'event': 'time_slots', 'count': len(slots), 'source': 'network'}})
+        match = pick_ladder_match(slots, time_ladder)
+        if not match:
+            return None
+        time_rank, slot = match
+        return time_rank, dict(slot, text=slot['time'], element=CapturedTimeButton(self.driver, slot['time']))
+    
+    
+    @traced('booking_steps')
     def _process_booking_steps(self):
         """예약 단계 처리: 다음 버튼 → 로그인 → 동의 → 확정"""
         try:
             # "다음" 버튼 클릭
-            logger.info("🔍 '다음' 버튼 찾는 중...")
-            
-            next_button_selectors = [
-                "//button[contains(@class, 'NextButton__btn_next')]",
-                "//button[contains(text(), '다음')]",
-                "//button[@data-click-code='nextbuttonview.request']",
-            ]
-            
-            next_clicked = False
-            for selector in next_button_selectors:
-                try:
-                    next_btn = self.driver.find_element(By.XPATH, selector)
-                    if next_btn.is_displayed() and next_btn.is_enabled():
-                        next_btn.click()
-                        logger.info("✅ '다음' 버튼 클릭")
-                        time.sleep(3)
-                        next_clicked = True
-                        break
-                except:
-                    continue
-            
-            if not next_clicked:
-                logger.warning("⚠️  '다음' 버튼을 찾지 못함")
+            with self.tracer.span('next') as span:
+                logger.info("🔍 '다음' 버튼 찾는 중...")
+                
+                next_button_selectors = [
+                    "//button[contains(@class, 'NextButton__btn_next')]",
+                    "//button[contains(text(), '다음')]",
+                    "//button[@data-click-code='nextbuttonview.request']",
+                ]
+                
+                next_clicked = False
+                for selector in next_button_selectors:
+                    try:
+                        next_btn = self.driver.find_element(By.XPATH, selector)
+                        if next_btn.is_displayed() and next_btn.is_enabled():
+                            next_btn.click()
+                            logger.info("✅ '다음' 버튼 클릭")
+                            time.sleep(3)
+                            next_clicked = True
+                            break
+                    except:
+                        continue
+                
+                if not next_clicked:
+                    logger.warning("⚠️  '다음' 버튼을 찾지 못함")
+                    self.capture_failure('next_button_not_found')
+                
+                span.attrs['ok'] = next_clicked
             
             # 로그인 페이지 확인 및 처리
             time.sleep(2)
@@ -2887,16 +3738,16 @@ class GolfBookingBot:
         """특정 도메인으로 이동 후 쿠키 재적용"""
         try:
             import pickle
-            if not os.path.exists('naver_cookies.pkl'):
+            if not os.path.exists(self.cookie_file):
                 logger.warning("⚠️  쿠키 파일이 없습니다")
                 return False
             
             # 쿠키 로드
-            with open('naver_cookies.pkl', 'rb') as f:
+            with open(self.cookie_file, 'rb') as f:
                 cookies = pickle.load(f)
             
             # 타겟 도메인으로 먼저 이동
-            logger.debug(f"🔗 {target_url[:60]}... 로 이동 중...")
+            logger.debug("🔗 %.60s... 로 이동 중...", target_url)
             self.driver.get(target_url)
             time.sleep(2)
             
@@ -2911,10 +3762,10 @@ class GolfBookingBot:
                             self.driver.add_cookie(cookie)
                             applied += 1
                 except Exception as e:
-                    logger.debug(f"쿠키 적용 실패: {cookie.get('name', 'unknown')} - {str(e)}")
+                    logger.debug("쿠키 적용 실패: %s - %s", cookie.get('name', 'unknown'), e)
             
             if applied > 0:
-                logger.debug(f"✅ {applied}개 쿠키 적용 완료")
+                logger.debug("✅ %d개 쿠키 적용 완료", applied)
                 
                 # 페이지 새로고침으로 쿠키 적용
                 self.driver.refresh()
@@ -2932,7 +3783,7 @@ class GolfBookingBot:
                 return False
             
         except Exception as e:
-            logger.debug(f"⚠️  쿠키 재적용 실패: {str(e)}")
+            logger.debug("⚠️  쿠키 재적용 실패: %s", e)
             return False
     
     def _check_login_status(self):
@@ -3006,14 +3857,21 @@ class GolfBookingBot:
             logger.warning("⚠️  이미 시작 시각이 지났습니다. 즉시 시작합니다.")
     
     def wait_for_exact_midnight(self):
-        """정확히 자정까지 대기 (준비 완료 후)"""
+        """
+        정확히 자정까지 대기 (준비 완료 후)
+
+        Returns:
+            datetime: 목표 자정 시각 (발사 오차 측정용)
+        """
         now = datetime.now()
-        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if now.hour != 0:
+            midnight += timedelta(days=1)
         
-        # 이미 자정이 지났으면 리턴
+        # 이미 자정이 지났으면 리턴 (준비가 자정을 넘겨 끝난 경우)
         if now >= midnight:
             logger.info("✅ 자정 도달!")
-            return
+            return midnight
         
         wait_seconds = (midnight - now).total_seconds()
         
@@ -3028,61 +3886,76 @@ class GolfBookingBot:
         logger.info("\n" + "=" * 60)
         logger.info("🎯 자정! 예약 시작!")
         logger.info("=" * 60)
+        return midnight
 
     def run_mode_1(self):
         """1번 모드 실행 (즉시 내일 예약)"""
+        self.start_trace('mode1')
+        success = False
         try:
             logger.info("=" * 60)
             logger.info("🎯 내일 타석 즉시 예약 (1번 모드)")
             logger.info("=" * 60)
             
-            if not self.setup_driver():
-                return False
-            
-            if not self.naver_login():
+            if not self.prepare_session():
                 return False
             
-            success, booking_info = self.book_tomorrow_slot()
+            with self.tracer.span('booking'):
+                success, booking_info = self.book_tomorrow_slot()
+            self.last_booking_info = booking_info
             
             self.send_kakao_notification(success, booking_info)
             
             return success
             
         finally:
-            if self.driver:
-                time.sleep(3)
-                self.driver.quit()
+            self.finish_trace(success)
+            self.release_driver()
+
+    def run_mode_2(self, reuse_session=False):
+        """
+        2번 모드 실행 (자정 대기)
 
-    def run_mode_2(self):
-        """2번 모드 실행 (자정 대기)"""
+        Args:
+            reuse_session: True면 미리 준비한 로그인 세션을 그대로 사용 (상주 모드의 사전 준비)
+        """
+        self.start_trace('mode2')
+        success = False
         try:
             logger.info("=" * 60)
             logger.info("⏰ 매일 자정 자동 예약 (2번 모드)")
             logger.info("=" * 60)
             
             # 자정 30초 전까지 대기
-            self.wait_until_midnight()
+            with self.tracer.span('wait_prep'):
+                self.wait_until_midnight()
             
             # 준비 작업 시작 (자정 30초 전부터)
             logger.info("\n📋 준비 작업 시작...")
-            prep_start = datetime.now()
             
-            if not self.setup_driver():
-                return False
-            logger.info(f"✅ ChromeDriver 준비 완료 ({(datetime.now() - prep_start).total_seconds():.1f}초)")
-            
-            if not self.naver_login():
-                return False
-            logger.info(f"✅ 로그인 완료 ({(datetime.now() - prep_start).total_seconds():.1f}초)")
+            # 상주 모드에서 미리 띄워둔 드라이버가 있으면 재사용하고 로그인만 다시 확인
+            with self.tracer.span('prep') as prep:
+                if not self.prepare_session(refresh_login=not reuse_session):
+                    prep.attrs['ok'] = False
+                    return False
+                logger.info(f"✅ ChromeDriver/로그인 준비 완료 ({prep.elapsed():.1f}초)")
             
-            prep_time = (datetime.now() - prep_start).total_seconds()
-            logger.info(f"\n✅ 준비 완료! (총 소요: {prep_time:.1f}초)")
+            logger.info(f"\n✅ 준비 완료! (총 소요: {prep.elapsed():.1f}초)")
             
             # 정확히 자정까지 대기
-            self.wait_for_exact_midnight()
+            with self.tracer.span('wait_midnight'):
+                midnight = self.wait_for_exact_midnight()
+            fire_error = (datetime.now() - midnight).total_seconds()
+            self.tracer.mark('midnight', fire_error_ms=round(fire_error * 1000, 3))
+            self.metrics.histogram(
+                'golf_midnight_fire_error_seconds', '자정 대비 예약 시작 시각 오차',
+                buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+            ).observe(fire_error, **self.metric_labels)
             
             # 자정! 예약 실행
-            success, booking_info = self.book_tomorrow_slot()
+            with self.tracer.span('booking'):
+                success, booking_info = self.book_tomorrow_slot()
+            self.last_booking_info = booking_info
             
             # 카카오톡 알림
             self.send_kakao_notification(success, booking_info)
@@ -3090,33 +3963,283 @@ class GolfBookingBot:
             return success
             
         finally:
-            if self.driver:
-                time.sleep(3)
-                self.driver.quit()
+            self.finish_trace(success)
+            self.release_driver()
 
     def run_mode_0(self):
         """0번 모드 실행 (가장 빠른 타석)"""
+        self.start_trace('mode0')
+        success = False
         try:
             logger.info("=" * 60)
             logger.info("🚀 가장 빠른 타석 예약 (0번 모드)")
             logger.info("=" * 60)
             
-            if not self.setup_driver():
-                return False
-            
-            if not self.naver_login():
+            if not self.prepare_session():
                 return False
             
-            success, booking_info = self.book_earliest_slot()
+            with self.tracer.span('booking'):
+                success, booking_info = self.book_earliest_slot()
+            self.last_booking_info = booking_info
             
             self.send_kakao_notification(success, booking_info)
             
             return success
             
         finally:
-            if self.driver:
-                time.sleep(3)
-                self.driver.quit()
+            self.finish_trace(success)
+            self.release_driver()
+
+
+class BookingScheduler:
+    """
+    3번 모드: schedule 모듈 기반 상주 스케줄러
+
+    한 프로세스 안에서 자정 예약(2번 모드), 주기적 빠른 타석 검색(0번 모드),
+    카카오 토큰 갱신 작업을 등록해 실행한다. 드라이버와 로그인 세션은
+    작업 사이에 재사용되고, 자정 작업은 준비 시간만큼 미리 시작한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.scheduler_config = config.get('scheduler', {})
+        self.bot = GolfBookingBot(config)
+        self.bot.keep_driver = True
+        self.jobs = schedule.Scheduler()
+
+    def register_jobs(self):
+        """설정에 따라 작업 등록"""
+        # 자정 예약: 자정 N초 전에 드라이버를 미리 띄우고 run_mode_2가 나머지를 처리
+        if self.scheduler_config.get('nightly_booking', True):
+            lead_seconds = self.scheduler_config.get('nightly_prep_lead_seconds', 300)
+            if not 0 < lead_seconds < 24 * 3600:
+                raise ValueError(f"nightly_prep_lead_seconds는 0보다 크고 하루보다 작아야 합니다: {lead_seconds}")
+            start_at = (datetime(2000, 1, 2) - timedelta(seconds=lead_seconds)).strftime('%H:%M:%S')
+            self.jobs.every().day.at(start_at).do(self._run_nightly_booking)
+            logger.info(f"📌 자정 예약 작업 등록: 매일 {start_at} 준비 시작")
+
+        sweep_minutes = self.scheduler_config.get('sweep_interval_minutes', 0)
+        if sweep_minutes:
+            self.jobs.every(sweep_minutes).minutes.do(self._run_earliest_sweep)
+            logger.info(f"📌 빠른 타석 검색 작업 등록: {sweep_minutes}분마다")
+
+        refresh_hours = self.scheduler_config.get('token_refresh_hours', 6)
+        if self.bot.kakao_notifier and refresh_hours:
+            self.jobs.every(refresh_hours).hours.do(self._refresh_kakao_token)
+            logger.info(f"📌 카카오 토큰 점검 작업 등록: {refresh_hours}시간마다")
+
+    def _run_nightly_booking(self):
+        """자정 예약 작업 (준비 → 자정 대기 → 예약)"""
+        logger.info("🌙 자정 예약 작업 시작 - 드라이버 미리 준비")
+        prepared = self.bot.prepare_session()
+        if not prepared:
+            logger.warning("⚠️  사전 준비 실패 - 자정 직전에 다시 시도합니다")
+        try:
+            # 미리 준비한 세션이 있으면 자정 직전에 로그인을 다시 확인하지 않음
+            self.bot.run_mode_2(reuse_session=prepared)
+        except Exception as e:
+            logger.error(f"❌ 자정 예약 작업 오류: {str(e)}")
+
+    def _run_earliest_sweep(self):
+        """빠른 타석 검색 작업 (예약 성공 시 작업 해제)"""
+        try:
+            if self.bot.run_mode_0():
+                logger.info("✅ 빠른 타석 예약 성공 - 주기 검색 작업 해제")
+                return schedule.CancelJob
+        except Exception as e:
+            logger.error(f"❌ 빠른 타석 검색 작업 오류: {str(e)}")
+
+    def _refresh_kakao_token(self):
+        """카카오 토큰 점검 작업 (다음 점검 전에 만료될 토큰이면 유휴 시간에 미리 갱신)"""
+        refresh_hours = self.scheduler_config.get('token_refresh_hours', 6)
+        self.bot.refresh_notification_token(margin=refresh_hours * 3600 + 60)
+
+    def run(self):
+        """등록된 작업을 실행하며 상주"""
+        self.register_jobs()
+        if not self.jobs.jobs:
+            logger.error("❌ 등록된 작업이 없습니다 - scheduler 설정을 확인하세요")
+            return
+
+        logger.info("=" * 60)
+        logger.info("🗓️  상주 스케줄러 시작 (3번 모드)")
+        logger.info("=" * 60)
+
+        try:
+            while True:
+                self.jobs.run_pending()
+                idle_seconds = self.jobs.idle_seconds
+                if idle_seconds is None:
+                    logger.info("ℹ️  남은 작업이 없어 스케줄러를 종료합니다")
+                    break
+                logger.debug(f"다음 작업: {self.jobs.next_run} ({idle_seconds:.0f}초 후)")
+                # 다음 작업까지 잠들되, 시계 보정을 위해 최대 60초씩 끊어서 대기
+                time.sleep(min(max(idle_seconds, 0), 60))
+        finally:
+            self.bot.close_driver()
+
+
+class MultiAccountOrchestrator:
+    """
+    여러 계정을 한 프로세스에서 동시에 예약 (1번/2번 모드)
+
+    계정마다 별도 드라이버와 쿠키 파일을 쓰는 GolfBookingBot을 스레드로 실행하고,
+    타석을 계정별로 나눠 배정해 같은 슬롯을 두고 서로 경쟁하지 않게 한다.
+    """
+
+    report_title = "다중 계정 예약"
+
+    def __init__(self, config):
+        self.config = config
+        self.accounts = config.get('accounts', [])
+
+    def build_account_configs(self):
+        """계정별 설정 생성 (공통 설정 + 계정 설정 + 배정 타석)"""
+        base_config = {k: v for k, v in self.config.items() if k != 'accounts'}
+        # 다중 계정은 기본 지점 타석 카탈로그를 나눠 갖는다
+        home_branch = resolve_branch(self.config)
+        base_config['branch'] = home_branch['name']
+        booth_numbers = home_branch['booth_numbers']
+        priority_seats = home_branch['priority_seats']
+
+        # 타석을 직접 지정한 계정은 그대로 두고, 나머지 계정끼리 남은 타석을 분배
+        fixed = {}
+        for account in self.accounts:
+            for num in account.get('booths') or []:
+                if num in fixed:
+                    raise ValueError(
+                        f"{num}번 타석이 {fixed[num]}, {account['user_id']} 계정에 중복 지정되어 있습니다"
+                    )
+                fixed[num] = account['user_id']
+        auto_indexes = [i for i, a in enumerate(self.accounts) if not a.get('booths')]
+        shares = assign_booths(
+            [num for num in booth_numbers if num not in fixed],
+            priority_seats,
+            max(len(auto_indexes), 1)
+        )
+        share_by_index = dict(zip(auto_indexes, shares))
+
+        account_configs = []
+        for index, account in enumerate(self.accounts):
+            booths = account.get('booths') or share_by_index[index]
+            # 빈 목록은 "제한 없음"(전체 타석)으로 처리되므로 배정할 타석이 없는 계정은 실행하지 않음
+            if not booths:
+                logger.warning(f"⚠️  {account['user_id']}: 배정할 타석이 남지 않아 이 계정은 실행하지 않습니다")
+                continue
+
+            account_config = dict(base_config)
+            account_config.update({k: v for k, v in account.items() if k != 'booths'})
+            account_config.setdefault('name', account['user_id'])
+            account_config.setdefault('cookie_file', f"naver_cookies_{account['user_id']}.pkl")
+            account_config['allowed_booths'] = booths
+            account_configs.append(account_config)
+        return account_configs
+
+    def _create_bot(self, account_config):
+        """실행 단위별 봇 생성"""
+        return GolfBookingBot(account_config)
+
+    def _run_account(self, account_config, mode):
+        """계정 하나 실행 (스레드)"""
+        started = time.time()
+        bot = self._create_bot(account_config)
+        try:
+            if mode == '2':
+                success = bot.run_mode_2()
+            else:
+                success = bot.run_mode_1()
+        except Exception as e:
+            logger.error(f"❌ [{account_config['name']}] 실행 오류: {str(e)}")
+            success = False
+        return {
+            'name': account_config['name'],
+            'booths': account_config.get('allowed_booths'),
+            'success': bool(success),
+            'booking_info': bot.last_booking_info or {},
+            'elapsed': time.time() - started,
+        }
+
+    def run(self, mode):
+        """
+        모든 계정 동시 실행 후 결과 리포트 출력
+
+        Args:
+            mode: '1' (즉시 내일 예약) 또는 '2' (자정 대기)
+
+        Returns:
+            list: 계정별 결과 딕셔너리
+        """
+        account_configs = self.build_account_configs()
+        if not account_configs:
+            logger.error("❌ accounts 설정이 비어 있습니다")
+            return []
+
+        logger.info("=" * 60)
+        logger.info(f"👥 {self.report_title} 시작 ({len(account_configs)}개, {mode}번 모드)")
+        for account_config in account_configs:
+            booths = account_config.get('allowed_booths')
+            logger.info(f"  - {account_config['name']}: 타석 {', '.join(map(str, booths)) if booths else '전체'}")
+        logger.info("=" * 60)
+
+        with ThreadPoolExecutor(max_workers=len(account_configs), thread_name_prefix='account') as executor:
+            futures = [executor.submit(self._run_account, c, mode) for c in account_configs]
+            results = [f.result() for f in futures]
+
+        self._log_report(results)
+        return results
+
+    def _log_report(self, results):
+        """계정별 결과 리포트"""
+        logger.info("\n" + "=" * 60)
+        logger.info(f"📊 {self.report_title} 결과")
+        logger.info("=" * 60)
+        for result in results:
+            info = result['booking_info']
+            if result['success']:
+                detail = f"{info.get('branch', '')} {info.get('booth_text')} {info.get('date')} {info.get('time')}".strip()
+                logger.info(f"✅ {result['name']}: {detail} ({result['elapsed']:.1f}초)")
+            else:
+                logger.info(f"❌ {result['name']}: {info.get('error', '예약 실패')} ({result['elapsed']:.1f}초)")
+        succeeded = sum(1 for r in results if r['success'])
+        logger.info(f"총 {len(results)}개 중 {succeeded}개 성공")
+        logger.info("=" * 60)
+
+
+class MultiBranchBooker(MultiAccountOrchestrator):
+    """
+    여러 지점을 한 번에 동시 검색 (1번/2번 모드, config의 branch가 목록일 때)
+
+    지점마다 별도 드라이버로 같은 계정을 로그인해 동시에 타석을 검색하고,
+    BookingClaim으로 먼저 슬롯을 찾은 지점 한 곳만 예약을 진행한다.
+    """
+
+    report_title = "다중 지점 예약"
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.claim = BookingClaim()
+
+    def build_account_configs(self):
+        """지점별 설정 생성 (쿠키 파일은 지점마다 분리 - 동시에 저장/읽기 하지 않도록)"""
+        shared_cookie_file = self.config.get('cookie_file', 'naver_cookies.pkl')
+        stem, ext = os.path.splitext(shared_cookie_file)
+        branch_configs = []
+        for name in branch_names(self.config):
+            resolve_branch(self.config, name)  # 알 수 없는 지점이면 실행 전에 오류
+            branch_config = dict(self.config)
+            branch_config['branch'] = name
+            branch_config['name'] = name
+            branch_config['cookie_file'] = f"{stem}_{name}{ext}"
+            # 처음 검색하는 지점은 공용 쿠키로 시작 (스레드 시작 전에 복사)
+            if not os.path.exists(branch_config['cookie_file']) and os.path.exists(shared_cookie_file):
+                shutil.copyfile(shared_cookie_file, branch_config['cookie_file'])
+            branch_configs.append(branch_config)
+        return branch_configs
+
+    def _create_bot(self, account_config):
+        bot = GolfBookingBot(account_config)
+        bot.booking_claim = self.claim
+        return bot
 
 
 def main():
@@ -3129,6 +4252,7 @@ def main():
     print("0️⃣  가장 빠른 타석 즉시 예약 (오늘/내일/모레)")
     print("1️⃣  내일 타석 즉시 예약 (우선순위: 11→7→8→9→10번)")
     print("2️⃣  매일 자정에 내일 타석 자동 예약")
+    print("3️⃣  상주 스케줄러 (자정 예약 + 주기 검색 + 토큰 갱신)")
     print()
     
     try:
@@ -3149,17 +4273,46 @@ def main():
         with open('config.json', 'r', encoding='utf-8') as f:
             config = json.load(f)
         
-        # 필수 값 확인
-        if not config.get('user_id') or not config.get('user_pw'):
+        # 필수 값 확인 (다중 계정 설정이 있으면 계정별로 확인)
+        accounts = config.get('accounts')
+        if accounts:
+            if not all(a.get('user_id') and a.get('user_pw') for a in accounts):
+                logger.error("❌ accounts의 각 계정에 user_id와 user_pw를 입력하세요!")
+                return
+        elif not config.get('user_id') or not config.get('user_pw'):
             logger.error("❌ config.json에 user_id와 user_pw를 입력하세요!")
             return
         
-        mode = input("모드 선택 (0/1/2): ").strip()
+        mode = input("모드 선택 (0/1/2/3): ").strip()
+        
+        if mode not in ['0', '1', '2', '3']:
+            print("❌ 잘못된 입력입니다. 0, 1, 2, 3 중 하나를 선택하세요.")
+            return
+        
+        if accounts:
+            if mode in ['1', '2']:
+                MultiAccountOrchestrator(config).run(mode)
+                return
+            # 0번/3번 모드는 첫 번째 계정으로 실행
+            logger.info(f"ℹ️  {mode}번 모드는 첫 번째 계정으로 실행합니다")
+            config = MultiAccountOrchestrator(config).build_account_configs()[0]
+            config.pop('allowed_booths', None)
         
-        if mode not in ['0', '1', '2']:
-            print("❌ 잘못된 입력입니다. 0, 1, 2 중 하나를 선택하세요.")
+        if mode == '3':
+            BookingScheduler(config).run()
             return
         
+        if len(branch_names(config)) > 1 and mode in ['1', '2']:
+            MultiBranchBooker(config).run(mode)
+            return
+
+        # 드라이버 여러 개로 타석 동시 확인 (asyncio 오케스트레이션)
+        if config.get('async_lanes', 1) > 1 and mode in ['1', '2']:
+            from async_orchestrator import AsyncBookingOrchestrator
+            # 이 스크립트가 __main__으로 실행되므로 봇 클래스를 넘겨 모듈이 두 번 로드되지 않게 함
+            AsyncBookingOrchestrator(config, bot_class=GolfBookingBot).run(mode)
+            return
+
         booking_bot = GolfBookingBot(config)
         
         if mode == '0':
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 요청 공통 판별 (booking_http / kakao_notification)
+
+재시도해도 안전한지는 "요청이 서버로 나갔는가"로 결정한다. 나가기 전에 난 예외만
+다시 보내도 되고, 나간 뒤의 타임아웃/끊김은 서버가 처리했을 수 있으므로 재시도하지 않는다.
+"""
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+def request_not_sent(error):
+    """요청 본문이 서버로 나가기 전에 난 예외인지 (연결 실패 / 연결 타임아웃 / 잘못된 요청)"""
+    if isinstance(error, (requests.ConnectTimeout, requests.exceptions.InvalidURL,
+                          requests.exceptions.MissingSchema, requests.exceptions.InvalidSchema,
+                          requests.exceptions.InvalidHeader)):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        # 연결 자체를 못 맺은 경우만 (연결 후 끊긴 경우는 요청이 이미 나갔을 수 있음)
+        return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    return False
@@ -5,31 +5,259 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from http_util import request_not_sent
 import json
 import logging
+import queue
+import threading
+import time
+import atexit
+import os
+import tempfile
 
 logger = logging.getLogger(__name__)
 
+# 카카오 API 요청 타임아웃 (연결, 응답) / 재시도 설정
+REQUEST_TIMEOUT = (3, 10)
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5
+# 429 응답의 Retry-After가 이보다 길면 기다리지 않고 응답을 그대로 반환
+MAX_RETRY_AFTER = 10
+
+# 액세스 토큰 만료까지 이 시간(초)보다 적게 남으면 미리 갱신
+TOKEN_REFRESH_MARGIN = 1800
+
+
+def _retry_after_seconds(response):
+    """429 응답의 Retry-After (초) - 재시도할 수 없으면 None"""
+    if response.status_code != 429:
+        return None
+    try:
+        seconds = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+    return seconds if 0 <= seconds <= MAX_RETRY_AFTER else None
+
+
+def post_with_retry(session, url, **kwargs):
+    """
+    타임아웃과 제한된 재시도가 있는 POST 요청
+    
+    요청이 서버에 닿지 않은 연결 실패와 Retry-After가 있는 429 응답만 재시도한다.
+    요청을 보낸 뒤의 오류(응답 타임아웃, 5xx)는 다시 보내면 메시지가 두 번 갈 수 있으므로
+    재시도하지 않고 그대로 반환/전파한다.
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = session.post(url, **kwargs)
+        except requests.RequestException as e:
+            if attempt == MAX_RETRIES or not request_not_sent(e):
+                raise
+            logger.warning(f"⚠️  카카오 API 연결 실패, 재시도 {attempt + 1}/{MAX_RETRIES}: {str(e)}")
+            time.sleep(RETRY_BACKOFF * (2 ** attempt))
+            continue
+        retry_after = _retry_after_seconds(response)
+        if retry_after is None or attempt == MAX_RETRIES:
+            return response
+        logger.warning(f"⚠️  카카오 API 429 응답, {retry_after:g}초 후 재시도 {attempt + 1}/{MAX_RETRIES}")
+        time.sleep(retry_after)
+
+
+def create_session():
+    """커넥션을 재사용하는 세션 (매 요청마다 TCP/TLS 핸드셰이크 방지)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount("https://", adapter)
+    return session
+
+
+class KakaoTokenManager:
+    """
+    카카오 토큰 수명 관리
+    
+    토큰 파일은 처음 한 번만 읽고 이후에는 메모리에서 제공한다.
+    expires_in으로 만료 시각을 추적해 유휴/준비 시간에 미리 갱신하고,
+    파일은 임시 파일에 쓴 뒤 교체하는 방식으로 원자적으로 저장한다.
+    """
+    
+    def __init__(self, rest_api_key, token_file="kakao_token.json", session=None):
+        """
+        Args:
+            rest_api_key: 카카오 REST API 키
+            token_file: 토큰 저장 파일 경로
+            session: 공유할 requests 세션 (없으면 새로 생성)
+        """
+        self.rest_api_key = rest_api_key
+        self.token_file = token_file
+        self.session = session or create_session()
+        self.access_token = None
+        self.refresh_token = None
+        self.expires_at = None  # 액세스 토큰 만료 시각 (epoch 초, 모르면 None)
+        self.refresh_token_expires_at = None
+        self._lock = threading.RLock()
+        
+        self.load()
+    
+    def load(self):
+        """파일에서 토큰 로드"""
+        try:
+            with open(self.token_file, "r") as f:
+                tokens = json.load(f)
+            with self._lock:
+                self.access_token = tokens.get("access_token")
+                self.refresh_token = tokens.get("refresh_token")
+                self.expires_at = tokens.get("expires_at")
+                self.refresh_token_expires_at = tokens.get("refresh_token_expires_at")
+            logger.info("✅ 토큰 로드 완료")
+            return True
+        except FileNotFoundError:
+            logger.info("ℹ️  저장된 토큰이 없습니다")
+            return False
+        except Exception as e:
+            logger.error(f"❌ 토큰 로드 실패: {str(e)}")
+            return False
+    
+    def save(self):
+        """토큰을 파일에 원자적으로 저장 (쓰는 도중 종료돼도 기존 파일 유지)"""
+        try:
+            with self._lock:
+                tokens = {
+                    "access_token": self.access_token,
+                    "refresh_token": self.refresh_token,
+                    "expires_at": self.expires_at,
+                    "refresh_token_expires_at": self.refresh_token_expires_at,
+                }
+            token_dir = os.path.dirname(os.path.abspath(self.token_file))
+            fd, tmp_path = tempfile.mkstemp(dir=token_dir, prefix=".kakao_token.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(tokens, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.token_file)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            logger.info("✅ 토큰 저장 완료")
+        except Exception as e:
+            logger.error(f"❌ 토큰 저장 실패: {str(e)}")
+    
+    def update(self, tokens):
+        """OAuth 토큰 응답 반영 (만료 시각 계산 포함)"""
+        now = time.time()
+        with self._lock:
+            self.access_token = tokens["access_token"]
+            self.expires_at = now + tokens["expires_in"] if "expires_in" in tokens else None
+            if "refresh_token" in tokens:
+                self.refresh_token = tokens["refresh_token"]
+            if "refresh_token_expires_in" in tokens:
+                self.refresh_token_expires_at = now + tokens["refresh_token_expires_in"]
+        self.save()
+    
+    def seconds_left(self):
+        """액세스 토큰 남은 시간 (초, 모르면 None)"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.time()
+    
+    def refresh(self):
+        """액세스 토큰 갱신"""
+        with self._lock:
+            if not self.refresh_token:
+                logger.error("❌ 리프레시 토큰이 없습니다")
+                return False
+            
+            url = "https://kauth.kakao.com/oauth/token"
+            data = {
+                "grant_type": "refresh_token",
+                "client_id": self.rest_api_key,
+                "refresh_token": self.refresh_token,
+            }
+            
+            try:
+                response = post_with_retry(self.session, url, data=data)
+                tokens = response.json()
+                
+                if "access_token" in tokens:
+                    self.update(tokens)
+                    logger.info("✅ 토큰 갱신 성공")
+                    return True
+                else:
+                    logger.error(f"❌ 토큰 갱신 실패: {tokens}")
+                    return False
+                    
+            except Exception as e:
+                logger.error(f"❌ 토큰 갱신 오류: {str(e)}")
+                return False
+    
+    def ensure_fresh(self, margin=TOKEN_REFRESH_MARGIN):
+        """
+        만료가 가까우면 미리 갱신 (유휴/준비 시간에 호출)
+        
+        Args:
+            margin: 남은 시간이 이 값(초)보다 적으면 갱신. 만료 시각을 모르는 토큰도 갱신한다.
+        
+        Returns:
+            bool: 사용 가능한 토큰이 있으면 True
+        """
+        with self._lock:
+            seconds_left = self.seconds_left()
+            if self.access_token and seconds_left is not None and seconds_left > margin:
+                return True
+            if seconds_left is None:
+                logger.info("🔑 카카오 토큰 만료 시각 미확인 - 미리 갱신")
+            else:
+                logger.info(f"🔑 카카오 토큰 만료 임박 ({max(seconds_left, 0) / 60:.0f}분 남음) - 미리 갱신")
+            return self.refresh()
+
+
+_token_managers = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(rest_api_key, token_file="kakao_token.json", session=None):
+    """토큰 파일별 공용 토큰 관리자 (파일은 프로세스당 한 번만 읽음)"""
+    key = os.path.abspath(token_file)
+    with _token_managers_lock:
+        if key not in _token_managers:
+            _token_managers[key] = KakaoTokenManager(rest_api_key, token_file, session)
+        return _token_managers[key]
+
 
 class KakaoNotifier:
     """카카오톡 메시지 알림 클래스"""
     
-    def __init__(self, rest_api_key, redirect_uri="https://localhost"):
+    def __init__(self, rest_api_key, redirect_uri="https://localhost", token_file="kakao_token.json"):
         """
         카카오톡 알림 초기화
         
         Args:
             rest_api_key: 카카오 REST API 키
             redirect_uri: 리다이렉트 URI (기본값: https://localhost)
+            token_file: 토큰 저장 파일 경로
         """
         self.rest_api_key = rest_api_key
         self.redirect_uri = redirect_uri
-        self.token_file = "kakao_token.json"
-        self.access_token = None
-        self.refresh_token = None
+        self.token_file = token_file
+        self.session = create_session()
         
-        # 저장된 토큰 로드
-        self.load_tokens()
+        # 공용 토큰 관리자 (저장된 토큰은 여기서 한 번만 로드)
+        self.tokens = get_token_manager(rest_api_key, token_file, self.session)
+    
+    @property
+    def access_token(self):
+        return self.tokens.access_token
+    
+    @property
+    def refresh_token(self):
+        return self.tokens.refresh_token
+    
+    def _post(self, url, **kwargs):
+        """타임아웃과 제한된 재시도가 있는 POST 요청"""
+        return post_with_retry(self.session, url, **kwargs)
     
     def get_authorization_url(self):
         """인증 URL 생성"""
@@ -57,15 +285,12 @@ class KakaoNotifier:
         }
         
         try:
-            response = requests.post(url, data=data)
+            response = self._post(url, data=data)
             tokens = response.json()
             
             if "access_token" in tokens:
-                self.access_token = tokens["access_token"]
-                self.refresh_token = tokens.get("refresh_token")
-                
-                # 토큰 저장
-                self.save_tokens()
+                # 토큰 저장 (만료 시각 포함)
+                self.tokens.update(tokens)
                 logger.info("✅ 카카오 토큰 발급 성공")
                 return True
             else:
@@ -78,67 +303,21 @@ class KakaoNotifier:
     
     def refresh_access_token(self):
         """액세스 토큰 갱신"""
-        if not self.refresh_token:
-            logger.error("❌ 리프레시 토큰이 없습니다")
-            return False
-        
-        url = "https://kauth.kakao.com/oauth/token"
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self.rest_api_key,
-            "refresh_token": self.refresh_token,
-        }
-        
-        try:
-            response = requests.post(url, data=data)
-            tokens = response.json()
-            
-            if "access_token" in tokens:
-                self.access_token = tokens["access_token"]
-                if "refresh_token" in tokens:
-                    self.refresh_token = tokens["refresh_token"]
-                
-                self.save_tokens()
-                logger.info("✅ 토큰 갱신 성공")
-                return True
-            else:
-                logger.error(f"❌ 토큰 갱신 실패: {tokens}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ 토큰 갱신 오류: {str(e)}")
-            return False
+        return self.tokens.refresh()
+    
+    def ensure_fresh_token(self, margin=TOKEN_REFRESH_MARGIN):
+        """만료가 가까운 토큰을 미리 갱신 (예약 직후 401 → 갱신 → 재전송 방지)"""
+        return self.tokens.ensure_fresh(margin)
     
     def save_tokens(self):
         """토큰을 파일에 저장"""
-        try:
-            tokens = {
-                "access_token": self.access_token,
-                "refresh_token": self.refresh_token,
-            }
-            with open(self.token_file, "w") as f:
-                json.dump(tokens, f)
-            logger.info("✅ 토큰 저장 완료")
-        except Exception as e:
-            logger.error(f"❌ 토큰 저장 실패: {str(e)}")
+        self.tokens.save()
     
     def load_tokens(self):
-        """파일에서 토큰 로드"""
-        try:
-            with open(self.token_file, "r") as f:
-                tokens = json.load(f)
-                self.access_token = tokens.get("access_token")
-                self.refresh_token = tokens.get("refresh_token")
-                logger.info("✅ 토큰 로드 완료")
-                return True
-        except FileNotFoundError:
-            logger.info("ℹ️  저장된 토큰이 없습니다")
-            return False
-        except Exception as e:
-            logger.error(f"❌ 토큰 로드 실패: {str(e)}")
-            return False
+        """파일에서 토큰 다시 로드"""
+        return self.tokens.load()
     
-    def send_message(self, text, link_url=None, link_title=None):
+    def send_message(self, text, link_url=None, link_title=None, _retry_on_expired=True):
         """
         나에게 메시지 보내기
         
@@ -184,18 +363,17 @@ class KakaoNotifier:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = self._post(url, headers=headers, data=data)
             result = response.json()
             
             if response.status_code == 200:
                 logger.info("✅ 카카오톡 메시지 전송 성공")
                 return True
-            elif response.status_code == 401:
-                # 토큰 만료 - 갱신 시도
+            elif response.status_code == 401 and _retry_on_expired:
+                # 토큰 만료 - 갱신 후 한 번만 재시도
                 logger.warning("⚠️  토큰 만료, 갱신 시도...")
                 if self.refresh_access_token():
-                    # 재시도
-                    return self.send_message(text, link_url, link_title)
+                    return self.send_message(text, link_url, link_title, _retry_on_expired=False)
                 else:
                     logger.error("❌ 토큰 갱신 실패")
                     return False
@@ -208,6 +386,103 @@ class KakaoNotifier:
             return False
 
 
+class NotificationDispatcher:
+    """
+    알림 전송 백그라운드 큐
+    
+    예약 흐름은 작업을 큐에 넣고 바로 돌아가고, 전용 스레드가 순서대로 전송한다.
+    프로세스 종료 시(atexit) 남은 알림을 모두 보낸 뒤 종료한다.
+    """
+    
+    def __init__(self, drain_timeout=15):
+        self.queue = queue.Queue()
+        self.drain_timeout = drain_timeout
+        self._worker = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+    
+    def submit(self, func, *args, **kwargs):
+        """
+        알림 작업 등록 (즉시 반환)
+        
+        Args:
+            func: 백그라운드에서 실행할 함수 (예: notifier.send_message)
+        """
+        self.queue.put((func, args, kwargs))
+    
+    @property
+    def pending(self):
+        """대기 중인 알림 수"""
+        return self.queue.qsize()
+    
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                func, args, kwargs = job
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"❌ 알림 전송 작업 오류: {str(e)}")
+            finally:
+                self.queue.task_done()
+    
+    def drain(self, timeout=None):
+        """
+        큐가 빌 때까지 대기
+        
+        Returns:
+            bool: 시간 안에 모두 전송했으면 True
+        """
+        timeout = self.drain_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                logger.warning(f"⚠️  미전송 알림 {self.pending}건 (대기 시간 초과)")
+                return False
+            time.sleep(0.05)
+        return True
+    
+    def close(self):
+        """남은 알림을 보내고 작업 스레드 종료"""
+        if not self._worker.is_alive():
+            return
+        if self.queue.unfinished_tasks:
+            logger.info(f"📨 남은 알림 {self.pending}건 전송 중...")
+        self.drain()
+        self.queue.put(None)
+        self._worker.join(timeout=1)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+_notifiers = {}
+_notifiers_lock = threading.Lock()
+
+
+def get_notification_dispatcher():
+    """프로세스 공용 알림 큐 (여러 봇/계정이 스레드 하나를 공유)"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher()
+        return _dispatcher
+
+
+def current_notification_dispatcher():
+    """이미 만들어진 알림 큐 (없으면 None, 스레드를 새로 띄우지 않음)"""
+    return _dispatcher
+
+
+def get_kakao_notifier(rest_api_key):
+    """API 키별 공용 알림 객체 (세션/토큰을 호출마다 새로 만들지 않음)"""
+    with _notifiers_lock:
+        if rest_api_key not in _notifiers:
+            _notifiers[rest_api_key] = KakaoNotifier(rest_api_key)
+        return _notifiers[rest_api_key]
+
+
 def setup_kakao_notifier(rest_api_key):
     """
     카카오 알림 초기 설정 (최초 1회만 실행)
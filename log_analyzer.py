@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예약 로그 분석기 (지연 시간 회귀 확인용)
+
+golf_booking.log(와 로테이션된 golf_booking.log.N.gz)를 한 줄씩 읽어 실행(run) 단위로
+나누고, 단계별 소요 시간을 복원해 모드별 백분위수와 최근 추세를 출력한다.
+
+- 여러 줄 레코드(예: "1번타석예약\\n예약", 스택트레이스)는 이전 레코드에 이어 붙임
+- 단계별 통계는 고정 크기 표본(reservoir)으로 유지 → 로그 크기와 무관하게 일정한 메모리
+
+사용법:
+    python log_analyzer.py                       # golf_booking.log + 로테이션 로그
+    python log_analyzer.py golf_booking.log --mode mode2 --json
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import random
+import re
+import sys
+from collections import deque
+from datetime import datetime
+
+RECORD_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\w+) - (.*)$')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S,%f'
+# 스택트레이스 등 긴 여러 줄 레코드는 이 길이까지만 보관
+MAX_MESSAGE_CHARS = 4000
+
+# 실행 시작 배너 → 모드
+RUN_START_PATTERNS = [
+    (re.compile(r'\((\d)번 모드\)'), None),
+    (re.compile(r'즉시 실행 모드|테스트 실행 모드|예약 가능 타석 (찾기|검색) 모드'), 'legacy'),
+]
+
+# 단계 완료 지점 (실행 안에서 처음 나타난 시각 기준, 순서대로)
+# 단계 소요 시간 = 이 지점 - 직전에 도달한 지점
+MILESTONES = [
+    ('driver_setup', re.compile(r'ChromeDriver 초기화 완료|기존 ChromeDriver')),
+    ('login', re.compile(r'로그인 성공|로그인 세션 재사용')),
+    ('iframe_switch', re.compile(r'iframe 전환 완료')),
+    ('search', re.compile(r'예약 가능 타석 발견|에서 \S+ 예약 가능!')),
+    ('time_select', re.compile(r'^✅ \d{1,2}:\d{2} 선택$')),
+    ('next', re.compile(r"'다음' 버튼 클릭")),
+    ('agree', re.compile(r"'동의하고 예약하기' 버튼 클릭")),
+    ('confirm', re.compile(r'예약 완료 URL 확인|예약이 확정|예약 완료!')),
+]
+PHASES = [name for name, _ in MILESTONES] + ['total']
+
+SUCCESS_RE = re.compile(r'예약 완료!')
+# 실행 종료 지점 (이후 레코드는 다음 실행 배너까지 무시)
+END_RE = re.compile(r'브라우저 종료|프로그램 종료')
+FAILURE_RE = re.compile(r'예약 실패|예약 가능한 (타석|시간)이 없습니다|예약 가능한 타석이 없습니다')
+
+
+def rotated_files(path):
+    """
+    로그 파일과 로테이션 파일을 오래된 순서로 (log.N.gz ... log.1.gz, log)
+
+    booking_logging은 크기 기준 로테이션만 하므로 숫자 접미사(log.N, log.N.gz)만 찾는다.
+    """
+    rotated = []
+    suffix_re = re.compile(re.escape(path) + r'\.(\d+)(\.gz)?')
+    for candidate in glob.glob(glob.escape(path) + '.*'):
+        match = suffix_re.fullmatch(candidate)
+        if match:
+            rotated.append((int(match.group(1)), candidate))
+    files = [name for _, name in sorted(rotated, reverse=True)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _open(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_records(paths):
+    """
+    (시각, 레벨, 메시지) 레코드를 스트리밍으로 생성
+
+    타임스탬프로 시작하지 않는 줄은 직전 레코드 메시지에 이어 붙인다.
+    """
+    current = None
+    for path in paths:
+        with _open(path) as f:
+            for line in f:
+                line = line.rstrip('\n')
+                match = RECORD_RE.match(line)
+                if match:
+                    if current:
+                        yield current
+                    timestamp = datetime.strptime(match.group(1), TIMESTAMP_FORMAT)
+                    current = [timestamp, match.group(2), match.group(3)]
+                elif current and len(current[2]) < MAX_MESSAGE_CHARS:
+                    current[2] = (current[2] + '\n' + line)[:MAX_MESSAGE_CHARS]
+    if current:
+        yield current
+
+
+def _run_mode(message):
+    for pattern, mode in RUN_START_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return mode or f"mode{match.group(1)}"
+    return None
+
+
+def iter_runs(records):
+    """
+    레코드를 실행 단위로 묶어 단계별 소요 시간 계산
+
+    Yields:
+        dict: {'mode', 'started_at', 'success', 'phases': {단계: ms}}
+    """
+    run = None
+    for timestamp, level, message in records:
+        mode = _run_mode(message)
+        if mode:
+            if run:
+                yield _finish_run(run)
+            run = {'mode': mode, 'started_at': timestamp, 'last': timestamp,
+                   'reached': {}, 'success': None, 'ended': False}
+            continue
+        if not run or run['ended']:
+            continue
+        first_line = message.split('\n', 1)[0].strip()
+        # 구분선/빈 줄은 다음 실행 배너의 일부일 수 있으므로 시각에 반영하지 않음
+        if not first_line.strip('='):
+            continue
+        run['last'] = timestamp
+        if END_RE.search(first_line):
+            run['ended'] = True
+            continue
+        for name, pattern in MILESTONES:
+            if name not in run['reached'] and pattern.search(first_line):
+                run['reached'][name] = timestamp
+                break
+        if run['success'] is None:
+            if SUCCESS_RE.search(first_line):
+                run['success'] = True
+            elif FAILURE_RE.search(first_line):
+                run['success'] = False
+    if run:
+        yield _finish_run(run)
+
+
+def _finish_run(run):
+    phases = {}
+    previous = run['started_at']
+    for name, _ in MILESTONES:
+        reached = run['reached'].get(name)
+        if reached is None:
+            continue
+        phases[name] = round((reached - previous).total_seconds() * 1000, 1)
+        previous = reached
+    phases['total'] = round((run['last'] - run['started_at']).total_seconds() * 1000, 1)
+    return {
+        'mode': run['mode'],
+        'started_at': run['started_at'].isoformat(timespec='seconds'),
+        'success': bool(run['success']),
+        'phases': phases,
+    }
+
+
+class PhaseStats:
+    """단계 하나의 통계 (고정 크기 표본 + 최근 값)"""
+
+    def __init__(self, reservoir_size=1024, recent_size=10, seed=0):
+        self.count = 0
+        self.total = 0.0
+        self.reservoir = []
+        self.reservoir_size = reservoir_size
+        self.recent = deque(maxlen=recent_size)
+        self._random = random.Random(seed)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.recent.append(value)
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(value)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.reservoir_size:
+                self.reservoir[index] = value
+
+    def percentile(self, pct):
+        if not self.reservoir:
+            return 0.0
+        ordered = sorted(self.reservoir)
+        rank = max(int(-(-pct * len(ordered) // 100)), 1)
+        return ordered[rank - 1]
+
+    def summary(self):
+        mean = self.total / self.count if self.count else 0.0
+        recent = sum(self.recent) / len(self.recent) if self.recent else 0.0
+        return {
+            'count': self.count,
+            'mean_ms': round(mean, 1),
+            'p50_ms': round(self.percentile(50), 1),
+            'p90_ms': round(self.percentile(90), 1),
+            'p99_ms': round(self.percentile(99), 1),
+            'recent_mean_ms': round(recent, 1),
+            # 최근 N회 평균이 전체 평균보다 몇 % 느린지 (양수 = 느려짐)
+            'trend_pct': round((recent - mean) / mean * 100, 1) if mean else 0.0,
+        }
+
+
+def analyze(paths, mode=None):
+    """
+    로그 분석
+
+    Returns:
+        dict: {모드: {'runs', 'success', 'first', 'last', 'phases': {단계: 통계}}}
+    """
+    report = {}
+    for run in iter_runs(iter_records(paths)):
+        if mode and run['mode'] != mode:
+            continue
+        entry = report.get(run['mode'])
+        if entry is None:
+            entry = report[run['mode']] = {
+                'runs': 0, 'success': 0, 'first': run['started_at'], 'last': None,
+                'stats': {name: PhaseStats() for name in PHASES},
+            }
+        entry['runs'] += 1
+        entry['success'] += 1 if run['success'] else 0
+        entry['last'] = run['started_at']
+        for name, value in run['phases'].items():
+            entry['stats'][name].add(value)
+    return {
+        name: {
+            'runs': entry['runs'],
+            'success': entry['success'],
+            'first': entry['first'],
+            'last': entry['last'],
+            'phases': {
+                phase: stats.summary() for phase, stats in entry['stats'].items() if stats.count
+            },
+        }
+        for name, entry in report.items()
+    }
+
+
+def format_report(report):
+    lines = []
+    for mode, entry in sorted(report.items()):
+        lines.append("=" * 84)
+        lines.append(f"{mode}: {entry['runs']}회 실행 / 성공 {entry['success']}회 ({entry['first']} ~ {entry['last']})")
+        lines.append("=" * 84)
+        lines.append(f"{'단계':<14} {'횟수':>5} {'평균ms':>10} {'p50ms':>10} {'p90ms':>10} {'p99ms':>10} {'최근ms':>10} {'추세':>8}")
+        for phase in PHASES:
+            stats = entry['phases'].get(phase)
+            if not stats:
+                continue
+            lines.append(
+                f"{phase:<14} {stats['count']:>5} {stats['mean_ms']:>10.0f} {stats['p50_ms']:>10.0f} "
+                f"{stats['p90_ms']:>10.0f} {stats['p99_ms']:>10.0f} {stats['recent_mean_ms']:>10.0f} "
+                f"{stats['trend_pct']:>+7.0f}%"
+            )
+    return '\n'.join(lines) if lines else "분석할 실행 기록이 없습니다"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='예약 로그 단계별 지연 시간 분석')
+    parser.add_argument('log_file', nargs='?', default='golf_booking.log',
+                        help='로그 파일 (로테이션된 .N.gz 파일도 함께 읽음)')
+    parser.add_argument('--mode', help='모드 필터 (예: mode0, mode1, mode2)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    paths = rotated_files(args.log_file)
+    if not paths:
+        print(f"로그 파일을 찾을 수 없습니다: {args.log_file}")
+        sys.exit(1)
+
+    report = analyze(paths, mode=args.mode)
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
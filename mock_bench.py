@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자정 예약(2번 모드) 경쟁 벤치마크
+
+mock_booking_server.py의 모의 서버를 상대로 run_mode_2()를 반복 실행하고
+승률(예약 확정 비율)과 지연 시간 분포를 출력한다.
+
+- 매 라운드 서버 오픈 시각을 "지금 + --lead초"로 잡고, 봇은 그 시각을 자정으로 여긴다
+  (wait_until_midnight는 건너뛰고 wait_for_exact_midnight가 오픈 시각까지 대기)
+- 네이버 로그인 대신 드라이버만 준비하고, 라운드 간 드라이버를 재사용한다
+- commit_ms: 서버가 실제로 열린 시각 → 봇의 예약 확정 요청 도착 (서버 기준)
+- confirm_ms: 봇이 슬롯을 고른 시각 → 예약 확정 확인 (봇 기준, --http-commit이면 HTTP 확정 경로)
+
+사용법:
+    python mock_bench.py --rounds 10 --competitors 3 --competitor-rate 0.5
+    python mock_bench.py --release-lag 0.8 --latency 0.05 --jitter 0.02 --json
+    python mock_bench.py --rounds 10 --http-commit
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 벤치마크 로그가 golf_booking.log에 섞이지 않음
+setup_logging('mock_bench.log', json_file=None)
+
+from booking_trace import percentile  # noqa: E402
+from golf_auto_booking import GolfBookingBot, normalize_time  # noqa: E402
+from mock_booking_server import MockBookingServer  # noqa: E402
+
+
+class MockBenchBot(GolfBookingBot):
+    """모의 서버를 자정 예약 대상으로 쓰는 봇 (로그인 / 자정 대기만 대체)"""
+
+    def __init__(self, config, server):
+        super().__init__(config)
+        self.server = server
+        self.release_at = None
+        self.keep_driver = True
+        self.branch['map_url'] = server.rewrite(self.branch['map_url'])
+
+    def prepare_session(self, refresh_login=False):
+        # 모의 서버는 로그인이 필요 없으므로 드라이버만 준비
+        if not self._is_driver_alive() and not self.setup_driver():
+            return False
+        self.logged_in = True
+        return True
+
+    def wait_until_midnight(self):
+        return None
+
+    def wait_for_exact_midnight(self):
+        # 봇의 로컬 시계 기준 오픈 시각 = 자정
+        remaining = self.release_at - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        return datetime.fromtimestamp(self.release_at)
+
+
+def bench_config(time_ladder, headless=True, server=None):
+    """server를 주면 그 서버의 /commit으로 HTTP 예약 확정"""
+    config = {
+        'headless': headless,
+        'cookie_file': '.mock_bench_no_cookies.pkl',
+        'time_ladder': {'default': time_ladder},
+        'enable_history': False,
+        'enable_trace': False,
+        'flight_recorder': False,
+    }
+    if server:
+        config.update(http_commit=True, http_commit_request=server.http_commit_request,
+                      http_commit_origin=server.base_url)
+    return config
+
+
+def run_round(bot, server, lead):
+    """
+    한 라운드 실행
+
+    Returns:
+        dict: 서버 측 결과(round_result) + 봇 성공 여부 / 자정 발사 오차 / 단계별 소요 시간
+    """
+    release_at = time.time() + lead
+    # 봇은 로컬 시계로 release_at을 자정으로 보고, 서버는 자기 시계로 같은 순간을 오픈으로 본다
+    server.arm(release_at + server.clock_offset)
+    bot.release_at = release_at
+    success = bot.run_mode_2()
+    result = server.round_result()
+    timeline = bot.tracer.to_dict()
+    midnight = next((m for m in timeline['marks'] if m['name'] == 'midnight'), None)
+    result.update({
+        'bot_success': bool(success),
+        'commit_path': bot.last_booking_info.get('commit_path'),
+        'confirm_ms': bot.last_booking_info.get('commit_ms'),
+        'fire_error_ms': midnight['attrs'].get('fire_error_ms') if midnight else None,
+        'phases': bot.tracer.phase_durations(),
+    })
+    return result
+
+
+def distribution(values):
+    """평균 / p50 / p90 / p99 / 최대"""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    return {
+        'count': len(values),
+        'mean': round(sum(values) / len(values), 1),
+        'p50': round(percentile(values, 50), 1),
+        'p90': round(percentile(values, 90), 1),
+        'p99': round(percentile(values, 99), 1),
+        'max': round(values[-1], 1),
+    }
+
+
+def summarize(results):
+    wins = sum(1 for r in results if r['won'])
+    phases = sorted({name for r in results for name in r['phases']})
+    return {
+        'rounds': len(results),
+        'wins': wins,
+        'win_rate': round(wins / len(results), 3) if results else 0.0,
+        'commit_ms': distribution(r['commit_ms'] for r in results),
+        'win_commit_ms': distribution(r['commit_ms'] for r in results if r['won']),
+        'confirm_ms': distribution(r['confirm_ms'] for r in results),
+        'http_commits': sum(1 for r in results if r['commit_path'] == 'http'),
+        'fire_error_ms': distribution(r['fire_error_ms'] for r in results),
+        'grabs_before_commit': distribution(r['grabs_before_commit'] for r in results if r['commit_ms'] is not None),
+        'phases': {name: distribution(r['phases'].get(name) for r in results) for name in phases},
+    }
+
+
+def format_summary(summary):
+    lines = [
+        "=" * 72,
+        f"자정 예약 벤치마크: {summary['rounds']}라운드 / 승리 {summary['wins']}회 "
+        f"(승률 {summary['win_rate'] * 100:.0f}%, HTTP 확정 {summary['http_commits']}회)",
+        "=" * 72,
+        f"{'항목':<22} {'횟수':>5} {'평균':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'최대':>9}",
+    ]
+    rows = [
+        ('commit_ms (전체)', summary['commit_ms']),
+        ('commit_ms (승리)', summary['win_commit_ms']),
+        ('confirm_ms (봇)', summary['confirm_ms']),
+        ('fire_error_ms', summary['fire_error_ms']),
+        ('경쟁자 선점 수', summary['grabs_before_commit']),
+    ] + [(f"  {name} (ms)", stats) for name, stats in summary['phases'].items()]
+    for label, stats in rows:
+        if not stats:
+            continue
+        lines.append(
+            f"{label:<22} {stats['count']:>5} {stats['mean']:>9.1f} {stats['p50']:>9.1f} "
+            f"{stats['p90']:>9.1f} {stats['p99']:>9.1f} {stats['max']:>9.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모의 서버 상대 자정 예약(2번 모드) 벤치마크')
+    parser.add_argument('--rounds', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--lead', type=float, default=5.0, help='라운드 시작 후 오픈까지 (초, 준비 시간 포함)')
+    parser.add_argument('--release-lag', type=float, default=0.0, help='서버 오픈 지연 (초)')
+    parser.add_argument('--clock-offset', type=float, default=0.0, help='서버 시계 - 로컬 시계 (초)')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='요청 지연 흔들림 (표준편차, 초)')
+    parser.add_argument('--competitors', type=int, default=3, help='모의 경쟁자 수')
+    parser.add_argument('--competitor-rate', type=float, default=0.5, help='경쟁자 한 명의 초당 선점 수')
+    parser.add_argument('--competitor-reaction', type=float, default=1.0, help='경쟁자 평균 반응 시간 (초)')
+    parser.add_argument('--hot-bias', type=float, default=0.7, help='경쟁자가 희망 시간을 노릴 확률')
+    parser.add_argument('--time', action='append', help='희망 시간 (여러 번 지정 가능, 기본값: 12:00)')
+    parser.add_argument('--seed', type=int, help='난수 시드')
+    parser.add_argument('--http-commit', action='store_true', help='HTTP 예약 확정 경로 사용 (실패 시 브라우저)')
+    parser.add_argument('--no-headless', action='store_true', help='브라우저 창 표시')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    ladder = [normalize_time(t) for t in (args.time or ['12:00'])]
+    server = MockBookingServer(
+        release_lag=args.release_lag, latency=args.latency, jitter=args.jitter,
+        competitors=args.competitors, competitor_rate=args.competitor_rate,
+        competitor_reaction=args.competitor_reaction, hot_times=ladder, hot_bias=args.hot_bias,
+        clock_offset=args.clock_offset, seed=args.seed,
+    )
+    results = []
+    with server:
+        config = bench_config(ladder, headless=not args.no_headless, server=server if args.http_commit else None)
+        bot = MockBenchBot(config, server)
+        try:
+            for _ in range(args.rounds):
+                results.append(run_round(bot, server, args.lead))
+        finally:
+            bot.close_driver()
+
+    summary = summarize(results)
+    if args.json:
+        json.dump({'summary': summary, 'rounds': results}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
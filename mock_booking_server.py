@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자정 오픈 + 경쟁 상황을 흉내 내는 모의 네이버 예약 서버
+
+fixture_server.FixtureServer를 확장해 타석 예약 페이지(캘린더 + 시간 버튼)를 직접 만든다.
+
+- 오픈 시각(release_at, 서버 시계 기준) + 오픈 지연(release_lag) 이전에는 N+1일이 unselectable
+- 모든 요청에 지연(latency) + 흔들림(jitter, 정규분포 표준편차) 추가
+- 오픈 후 모의 경쟁자들이 각자 반응 시간 뒤 일정 비율(초당 횟수)로 슬롯을 선점
+  (hot_times의 시간을 hot_bias 확률로 우선 선점)
+- 동의하고 예약하기 → /commit 에서 슬롯을 원자적으로 확정 (이미 선점됐으면 실패 페이지)
+  HTTP 예약 확정 경로(booking_http.py)도 같은 /commit을 쓴다 (http_commit_request)
+
+라운드마다 arm()으로 슬롯을 초기화하고 경쟁자를 다시 출발시킨다.
+
+사용법:
+    python mock_booking_server.py [포트] [오픈까지 초]
+"""
+
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import parse_qs
+
+from fixture_server import FixtureServer
+
+# 모의 서버용 상태 전환 스크립트 (선택한 타석/시간을 예약 확정 요청까지 전달)
+MOCK_STATE_SCRIPT = """
+<script>
+document.addEventListener('click', function (event) {
+  var target = event.target.closest('button');
+  if (!target) { return; }
+  var code = target.getAttribute('data-click-code');
+  if (target.classList.contains('calendar_date')) {
+    document.querySelectorAll('.calendar_date.selected').forEach(function (b) { b.classList.remove('selected'); });
+    target.classList.add('selected');
+  } else if (target.classList.contains('btn_time')) {
+    document.querySelectorAll('.btn_time.selected').forEach(function (b) { b.classList.remove('selected'); });
+    target.classList.add('selected');
+    var item = (window.location.pathname.match(/items\\/(\\d+)/) || [])[1];
+    window.__slot = '?item=' + item + '&time=' + target.getAttribute('data-time');
+    document.querySelectorAll('[data-click-code="nextbuttonview.request"]').forEach(function (b) {
+      b.className = b.className.replace(/\\S*disabled\\S*/g, '').trim();
+    });
+  } else if (code === 'nextbuttonview.request' && window.__slot) {
+    window.location.href = '%(order_path)s' + window.__slot;
+  } else if (code === 'submitbutton.submit') {
+    window.location.href = '%(commit_path)s' + window.location.search;
+  }
+});
+</script>
+"""
+
+DEFAULT_TIMES = [f"{hour:02d}:00" for hour in range(6, 23)]
+
+
+def _display_time(time_text):
+    """24시간제 → 네이버 표시 형식 (오전/오후 제목 아래 12시간제)"""
+    hour, minute = (int(part) for part in time_text.split(':'))
+    return ('오전' if hour < 12 else '오후'), f"{hour % 12 or 12}:{minute:02d}"
+
+
+class MockBookingServer(FixtureServer):
+    """자정 오픈 / 지연 / 경쟁자 시뮬레이션 서버"""
+
+    state_script = MOCK_STATE_SCRIPT
+
+    def __init__(self, host='127.0.0.1', port=0, times=DEFAULT_TIMES, release_lag=0.0,
+                 latency=0.0, jitter=0.0, competitors=0, competitor_rate=1.0,
+                 competitor_reaction=0.5, hot_times=(), hot_bias=0.7, clock_offset=0.0,
+                 target_date=None, seed=None, **kwargs):
+        """
+        Args:
+            times: 하루 예약 시간 목록 (24시간제)
+            release_lag: 오픈 시각 이후 실제로 N+1일이 열리기까지 지연 (초)
+            latency / jitter: 요청당 추가 지연 / 흔들림 (초)
+            competitors: 모의 경쟁자 수
+            competitor_rate: 경쟁자 한 명이 초당 선점하는 슬롯 수
+            competitor_reaction: 경쟁자의 오픈 후 평균 반응 시간 (초, 지수분포)
+            hot_times: 경쟁자가 우선 노리는 시간 목록
+            hot_bias: hot_times를 고를 확률
+            clock_offset: 서버 시계 - 로컬 시계 (초, 양수면 서버가 빠름)
+            target_date: 오픈되는 날짜 (기본값: 내일)
+            seed: 난수 시드 (재현용)
+        """
+        super().__init__(host, port, **kwargs)
+        self.times = list(times)
+        self.release_lag = release_lag
+        self.latency = latency
+        self.jitter = jitter
+        self.competitors = competitors
+        self.competitor_rate = competitor_rate
+        self.competitor_reaction = competitor_reaction
+        self.hot_times = set(hot_times)
+        self.hot_bias = hot_bias
+        self.clock_offset = clock_offset
+        self.target_date = target_date or (date.today() + timedelta(days=1))
+        self._random = random.Random(seed)
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._round = None
+        self.arm(float('inf'))
+
+    @property
+    def commit_path(self):
+        return f"/booking/6/bizes/{self.biz_id}/commit"
+
+    @property
+    def http_commit_request(self):
+        """booking_http.HttpBookingClient용 예약 요청 템플릿 (브라우저 경로와 같은 /commit)"""
+        return {
+            'method': 'GET',
+            'url': '{origin}' + self.commit_path,
+            'params': {'item': '{item_id}', 'time': '{time}'},
+        }
+
+    def script_params(self):
+        return dict(super().script_params(), commit_path=self.commit_path)
+
+    def server_time(self):
+        """서버 시계 (time.time() + clock_offset)"""
+        return time.time() + self.clock_offset
+
+    # ---------------- 라운드 ----------------
+
+    def arm(self, release_at):
+        """
+        새 라운드 시작: 슬롯 초기화 + 경쟁자 출발 예약
+
+        Args:
+            release_at: 오픈 시각 (서버 시계 기준 epoch 초)
+        """
+        if self._round:
+            self._round['stop'].set()
+        current = {
+            'release_at': release_at,
+            'opens_at': release_at + self.release_lag,
+            'slots': {(num, t): None for num in self.booth_numbers for t in self.times},
+            'grabs': [],
+            'commits': [],
+            'stop': threading.Event(),
+        }
+        with self._lock:
+            self._round = current
+        if release_at != float('inf'):
+            for index in range(self.competitors):
+                seed = None if self._seed is None else self._seed * 1000 + index
+                threading.Thread(
+                    target=self._compete, args=(current, random.Random(seed), f"competitor{index + 1}"),
+                    name=f'mock-competitor-{index + 1}', daemon=True
+                ).start()
+        return current
+
+    def is_open(self, current=None):
+        current = current or self._round
+        return self.server_time() >= current['opens_at']
+
+    def _compete(self, current, rng, name):
+        """모의 경쟁자: 오픈 후 반응 시간을 두고 초당 competitor_rate 비율로 슬롯 선점"""
+        delay = current['opens_at'] - self.server_time()
+        if self.competitor_reaction > 0:
+            delay += rng.expovariate(1.0 / self.competitor_reaction)
+        if current['stop'].wait(max(delay, 0)):
+            return
+        while True:
+            with self._lock:
+                free = [key for key, owner in current['slots'].items() if owner is None]
+                if not free:
+                    return
+                hot = [key for key in free if key[1] in self.hot_times]
+                key = rng.choice(hot) if hot and rng.random() < self.hot_bias else rng.choice(free)
+                current['slots'][key] = name
+                current['grabs'].append({
+                    'by': name, 'booth': key[0], 'time': key[1],
+                    'ms': round((self.server_time() - current['opens_at']) * 1000, 1),
+                })
+            if current['stop'].wait(rng.expovariate(self.competitor_rate)):
+                return
+
+    def round_result(self):
+        """
+        현재 라운드 결과
+
+        Returns:
+            dict: won(봇 확정 여부), commit_ms(오픈 → 봇 확정 요청 도착), slot,
+                  grabs_before_commit(봇 요청 전 경쟁자 선점 수), grabs, commits
+        """
+        with self._lock:
+            current = self._round
+            commits = list(current['commits'])
+            grabs = list(current['grabs'])
+        first = commits[0] if commits else None
+        won = next((c for c in commits if c['accepted']), None)
+        decisive = won or first
+        return {
+            'won': won is not None,
+            'commit_ms': decisive['ms'] if decisive else None,
+            'slot': f"{decisive['booth']}번 {decisive['time']}" if decisive else None,
+            'grabs_before_commit': sum(1 for g in grabs if decisive and g['ms'] <= decisive['ms']),
+            'grabs': len(grabs),
+            'commits': commits,
+        }
+
+    def stop(self):
+        if self._round:
+            self._round['stop'].set()
+        super().stop()
+
+    # ---------------- 페이지 ----------------
+
+    def booth_page(self, booth_num):
+        """타석 예약 페이지 (캘린더 7일 + 오전/오후 시간 버튼 + 다음 버튼)"""
+        current = self._round
+        opened = self.is_open(current)
+        days = []
+        for offset in range(-1, 6):
+            day = self.target_date + timedelta(days=offset)
+            classes = ['calendar_date']
+            if day == self.target_date:
+                if not opened:
+                    classes.append('unselectable')
+            elif offset > 0:
+                classes.append('unselectable')
+            days.append(f'<button type="button" class="{" ".join(classes)}"><span class="num">{day.day}</span></button>')
+
+        periods = {}
+        with self._lock:
+            for time_text in self.times:
+                period, label = _display_time(time_text)
+                taken = not opened or current['slots'].get((booth_num, time_text)) is not None
+                css = 'btn_time unselectable' if taken else 'btn_time'
+                periods.setdefault(period, []).append(
+                    f'<li><button type="button" class="{css}" data-time="{time_text}">{label}</button></li>'
+                )
+        time_html = ''.join(
+            f'<strong class="time_title">{period}</strong><ul class="time_list">{"".join(items)}</ul>'
+            for period, items in periods.items()
+        )
+        script = self.state_script % self.script_params()
+        return (
+            '<html><head><meta charset="utf-8"></head><body>'
+            f'<div class="calendar">{"".join(days)}</div>'
+            f'<div class="time_area">{time_html}</div>'
+            '<button type="button" class="NextButton__btn_next__kfLFW NextButton__disabled__a3P-t" '
+            'data-click-code="nextbuttonview.request">다음</button>'
+            f'{script}</body></html>'
+        )
+
+    def commit(self, query):
+        """예약 확정 요청: 비어 있는 슬롯이면 봇에게 배정"""
+        params = parse_qs(query)
+        booth = int((params.get('item') or ['0'])[0])
+        time_text = (params.get('time') or [''])[0]
+        with self._lock:
+            current = self._round
+            key = (booth, time_text)
+            accepted = self.is_open(current) and current['slots'].get(key, 'missing') is None
+            if accepted:
+                current['slots'][key] = 'bot'
+            current['commits'].append({
+                'booth': booth, 'time': time_text, 'accepted': accepted,
+                'ms': round((self.server_time() - current['opens_at']) * 1000, 1),
+            })
+        if accepted:
+            return 303, '', {'Location': self.complete_path}
+        # 거절은 4xx (HTTP 확정 경로가 "확실히 예약 안 됨"으로 보고 브라우저 경로로 넘어가도록)
+        return 409, (
+            '<html><head><meta charset="utf-8"></head><body>'
+            '<strong class="popup_tit">이미 마감된 시간입니다</strong></body></html>'
+        )
+
+    def page_for(self, path, query):
+        if path == self.commit_path:
+            return self.commit(query)
+        booth = self._booth_number(path)
+        if booth is not None:
+            return 200, self.booth_page(booth)
+        return super().page_for(path, query)
+
+    def _booth_number(self, path):
+        prefix = f"/booking/6/bizes/{self.biz_id}/items/"
+        if path.startswith(prefix) and path[len(prefix):].isdigit():
+            return int(path[len(prefix):])
+        return None
+
+    def _handle(self, request):
+        # 네트워크 지연 + 흔들림 (요청을 처리하기 전에 적용 → 확정 요청 도착 시각에도 반영)
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.gauss(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        super()._handle(request)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8801
+    lead = float(sys.argv[2]) if len(sys.argv) > 2 else 30
+    with MockBookingServer(port=port, competitors=3, hot_times=['12:00', '13:00']) as mock_server:
+        mock_server.arm(mock_server.server_time() + lead)
+        print(f"모의 예약 서버: {mock_server.base_url} ({lead:.0f}초 뒤 {mock_server.target_date} 오픈)")
+        print(f"  타석:   {mock_server.booth_url(11)}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+예약 API 응답 캡처 (DevTools 네트워크 이벤트 → 예약 가능 시간)
+
+타석 예약 페이지는 캘린더/시간표 데이터를 XHR(GraphQL)로 받아 React로 그린다.
+화면에 btn_time 버튼이 그려지기를 기다렸다가 요소를 하나씩 읽는 대신, Chrome performance 로그의
+Network.responseReceived / Network.loadingFinished 이벤트로 시간표 API 응답을 잡아
+Network.getResponseBody로 받은 JSON에서 바로 예약 가능 시간을 읽는다.
+
+- 응답의 슬롯 항목: 시작 시각 키(unitStartDateTime / unitStartTime / startDateTime / startTime)가 있는 객체
+  재고(unitStock / stock / remainStock) - 예약 수(unitBookingCount / bookingCount) > 0 이고
+  판매/영업일 플래그(isUnitSaleDay, isUnitBusinessDay, isSaleDay, isBusinessDay)가 False가 아니면 예약 가능
+  (재고 키가 없는 항목은 플래그 중 하나가 명시적으로 True일 때만 예약 가능, 아니면 불가능으로 봄)
+- 시간 클릭은 그대로 화면에서 한다 (찾은 슬롯의 버튼만 DOM에서 찾음)
+- performance 로그는 읽으면 비워지므로 세션 기록(session_recorder)과 함께 쓸 때는 PerformanceLog로 나눠 읽는다
+- get_log / execute_cdp_cmd가 없는 드라이버(가짜 드라이버 등)에서는 스스로 꺼지고 DOM 경로를 쓴다
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 시간표 데이터를 싣는 예약 API (GraphQL / schedule)
+DEFAULT_SCHEDULE_PATTERN = r'booking\.naver\.com/.*(graphql|schedule)'
+START_KEYS = ('unitStartDateTime', 'unitStartTime', 'startDateTime', 'startTime')
+STOCK_KEYS = ('unitStock', 'stock', 'remainStock')
+BOOKED_KEYS = ('unitBookingCount', 'bookingCount')
+OPEN_FLAGS = ('isUnitSaleDay', 'isUnitBusinessDay', 'isSaleDay', 'isBusinessDay')
+START_RE = re.compile(r'(\d{4}-\d{2}-\d{2})[T ](\d{2}):(\d{2})')
+
+
+def _first(data, keys):
+    return next((data[key] for key in keys if data.get(key) is not None), None)
+
+
+def parse_schedule(payload):
+    """
+    시간표 API 응답(JSON)에서 슬롯 목록 추출
+
+    Returns:
+        list: {'date': 'YYYY-MM-DD', 'time': 'HH:MM', 'available': bool, 'stock', 'booked'}
+    """
+    slots = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        start = _first(node, START_KEYS)
+        match = START_RE.search(start) if isinstance(start, str) else None
+        if match:
+            stock = _first(node, STOCK_KEYS)
+            booked = _first(node, BOOKED_KEYS) or 0
+            flags = [node.get(flag) for flag in OPEN_FLAGS]
+            if stock is None:
+                # 재고를 모르면 판매/영업일 플래그가 명시적으로 True일 때만 예약 가능
+                has_room = any(flag is True for flag in flags)
+            else:
+                has_room = stock - booked > 0
+            slots.append({
+                'date': match.group(1),
+                'time': f"{match.group(2)}:{match.group(3)}",
+                'available': has_room and all(flag is not False for flag in flags),
+                'stock': stock,
+                'booked': booked,
+            })
+            continue
+        stack.extend(reversed(list(node.values())))
+    return slots
+
+
+class PerformanceLog:
+    """
+    performance 로그를 여러 소비자가 나눠 읽기 (getLog는 한 번 읽으면 비워짐)
+
+    소비자마다 읽은 위치를 기억하고, 모두 읽은 항목은 버린다.
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._offset = 0
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    def register(self, consumer):
+        with self._lock:
+            self._cursors.setdefault(consumer, self._offset + len(self._entries))
+
+    def read(self, call, consumer):
+        """
+        consumer가 아직 읽지 않은 항목
+
+        Args:
+            call: 드라이버 명령 함수 (call('getLog', {'type': 'performance'}))
+        """
+        entries = call('getLog', {'type': 'performance'}) or []
+        with self._lock:
+            self._entries.extend(entries)
+            start = self._cursors.get(consumer, self._offset) - self._offset
+            unread = self._entries[max(start, 0):]
+            self._cursors[consumer] = self._offset + len(self._entries)
+            drop = min(self._cursors.values()) - self._offset
+            if drop > 0:
+                del self._entries[:drop]
+                self._offset += drop
+        return unread
+
+
+class NetworkCapture:
+    """시간표 API 응답 캡처기 (타석 페이지마다 begin → wait_for_schedule)"""
+
+    def __init__(self, url_pattern=None, log=None):
+        """
+        Args:
+            url_pattern: 캡처할 응답 URL 정규식 (None이면 예약 GraphQL / schedule)
+            log: 공유 PerformanceLog (None이면 혼자 읽음)
+        """
+        self.url_re = re.compile(url_pattern or DEFAULT_SCHEDULE_PATTERN)
+        self.log = log or PerformanceLog()
+        self.log.register(self)
+        self.driver = None
+        self.enabled = True
+        self.slots = []
+        self._pending = {}
+
+    def attach(self, driver):
+        self.driver = driver
+        self.enabled = hasattr(driver, 'get_log') and hasattr(driver, 'execute_cdp_cmd')
+        return driver
+
+    def _call(self, command, params=None):
+        if command == 'getLog':
+            return self.driver.get_log(params['type'])
+        return self.driver.execute_cdp_cmd(params['cmd'], params['params'])
+
+    def begin(self):
+        """새 페이지 시작: 이전 페이지의 이벤트 / 슬롯 버리기"""
+        if not self.enabled:
+            return
+        self.poll()
+        self.slots = []
+        self._pending.clear()
+
+    def poll(self):
+        """쌓인 네트워크 이벤트 처리 (완료된 시간표 응답의 본문을 파싱해 slots에 추가)"""
+        try:
+            entries = self.log.read(self._call, self)
+        except Exception as e:
+            logger.info(f"ℹ️  네트워크 캡처 사용 불가 - 화면에서 시간 확인: {type(e).__name__}")
+            self.enabled = False
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if self.url_re.search(url):
+                    self._pending[params.get('requestId')] = url
+            elif method == 'Network.loadingFinished' and params.get('requestId') in self._pending:
+                self._read_body(params['requestId'])
+
+    def _read_body(self, request_id):
+        url = self._pending.pop(request_id)
+        try:
+            body = self._call('executeCdpCommand', {
+                'cmd': 'Network.getResponseBody', 'params': {'requestId': request_id},
+            })
+            slots = parse_schedule(json.loads(body.get('body') or 'null'))
+        except Exception as e:
+            logger.debug("시간표 응답 읽기 실패 %s: %s", url, e)
+            return
+        if slots:
+            logger.debug("시간표 응답 %s: 슬롯 %d개", url, len(slots))
+            self.slots.extend(slots)
+
+    def wait_for_schedule(self, target_date, timeout=3.0, interval=0.05):
+        """
+        target_date의 슬롯이 담긴 응답이 올 때까지 대기
+
+        Args:
+            target_date: 예약일 (datetime 또는 'YYYY-MM-DD')
+
+        Returns:
+            list: 그 날짜의 슬롯 (같은 시간은 마지막 응답 기준) - 시간 안에 못 받으면 None
+        """
+        if not self.enabled:
+            return None
+        day = target_date.strftime('%Y-%m-%d') if isinstance(target_date, datetime) else str(target_date)
+        deadline = time.perf_counter() + timeout
+        while True:
+            self.poll()
+            by_time = {slot['time']: slot for slot in self.slots if slot['date'] == day}
+            if by_time:
+                return [by_time[key] for key in sorted(by_time)]
+            if not self.enabled or time.perf_counter() >= deadline:
+                return None
+            time.sleep(interval)
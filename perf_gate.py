@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예약 경로 성능 회귀 검사
+
+예약 경로를 몇 차례 실행하고, 주요 구간의 중앙값이 예산(budget) + 여유를 넘으면
+실패(종료 코드 1)한다. 자정 경로에 time.sleep()이나 불필요한 WebDriver 호출이
+추가되면 여기서 드러난다.
+
+백엔드:
+    mock  mock_booking_server.py의 모의 서버(이미 오픈된 상태, 경쟁자 없음) + Chrome으로 2번 모드
+    fake  fake_driver.FakeDriver로 book_tomorrow_slot() (브라우저 없이, 고정 대기는 실제로 대기)
+
+검사 항목:
+    first_slot_ms     예약 페이지 접속(iframe_switch 시작) → 첫 예약 가능 타석 확인 완료
+    click_to_confirm_ms  시간 클릭 → 예약 완료 확인
+    booking_ms        book_tomorrow_slot 전체 (성공 후 대기 포함)
+    rpcs_per_booth    타석 하나 확인에 쓰인 WebDriver 명령 수
+
+시간 항목의 여유는 예산 × 허용 오차를 MIN_SLACK_MS ~ MAX_SLACK_MS로 자른 값이라
+어느 구간이든 time.sleep(2) 하나가 추가되면 실패한다. 예산은 perf_budgets.json의
+백엔드별 측정값(--write-budgets)을 쓰고, 없는 항목은 derive_budgets()의 기본 예산을 쓴다.
+
+사용법:
+    python perf_gate.py                    # 모의 서버 + Chrome으로 검사
+    python perf_gate.py --backend fake     # 브라우저 없이 검사
+    python perf_gate.py --backend fake --write-budgets    # 이번 측정값을 perf_budgets.json에 저장
+    python -m pytest tests/test_perf_gate.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import datetime, timedelta
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 검사 로그가 golf_booking.log에 섞이지 않음
+setup_logging('perf_gate.log', json_file=None)
+
+from fake_bench import fake_config  # noqa: E402
+from fake_driver import FakeDriver, FakeSite  # noqa: E402
+from fixture_server import FIXTURE_TIME  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+from mock_bench import MockBenchBot, bench_config, run_round  # noqa: E402
+from mock_booking_server import MockBookingServer  # noqa: E402
+
+BUDGET_FILE = 'perf_budgets.json'
+BACKENDS = ('mock', 'fake')
+DEFAULT_TOLERANCE = 0.1
+MIN_SLACK_MS = 200
+MAX_SLACK_MS = 1500
+# 현재 코드의 고정 대기 (fake_bench --mode booking의 skipped_sleep_s로 확인)
+CLICK_TO_CONFIRM_WAIT_MS = 10500   # 시간 클릭 후 2초, 다음 3+2초, 동의 1+0.5+2초
+SUCCESS_WAIT_MS = 5000             # 예약 성공 후 5초
+BOOKING_WAIT_MS = CLICK_TO_CONFIRM_WAIT_MS + SUCCESS_WAIT_MS
+
+
+def derive_budgets(first_slot_ms, click_round_trips_ms, navigation_ms, rpcs_per_booth):
+    """
+    구간 예산에서 전체 예산 계산
+
+    booking = 이동(지도 페이지, 슬롯 선택 후 클릭 전) + 첫 슬롯 + 클릭→확정 + 성공 후 대기
+    click_to_confirm = 고정 대기 + 페이지 왕복
+    """
+    click_to_confirm_ms = CLICK_TO_CONFIRM_WAIT_MS + click_round_trips_ms
+    return {
+        'first_slot_ms': first_slot_ms,
+        'click_to_confirm_ms': click_to_confirm_ms,
+        'booking_ms': navigation_ms + first_slot_ms + click_to_confirm_ms + SUCCESS_WAIT_MS,
+        'rpcs_per_booth': rpcs_per_booth,
+    }
+
+
+# 기본 예산 (perf_budgets.json에 측정값이 없는 백엔드/항목)
+DEFAULT_BUDGETS = {
+    'mock': derive_budgets(first_slot_ms=3000, click_round_trips_ms=1000, navigation_ms=1000, rpcs_per_booth=15),
+    'fake': derive_budgets(first_slot_ms=200, click_round_trips_ms=200, navigation_ms=200, rpcs_per_booth=15),
+}
+# 타석 확인 중 명령이 기록되는 단계
+BOOTH_PHASES = ('booth_scan', 'booth_page', 'date_select', 'time_snapshot')
+
+
+def measure(bot):
+    """
+    마지막 실행의 타임라인/명령 프로파일에서 검사 항목 계산
+
+    Returns:
+        dict: 항목 → 값 (해당 구간이 없으면 None)
+    """
+    spans = bot.tracer.span_dicts()
+
+    def first(name, **attrs):
+        return next((s for s in spans if s['name'] == name
+                     and all(s['attrs'].get(k) == v for k, v in attrs.items())), None)
+
+    def last(name):
+        return next((s for s in reversed(spans) if s['name'] == name), None)
+
+    start = first('iframe_switch')
+    found = first('booth_scan', ok=True)
+    click = last('time_select')
+    confirm = last('confirm')
+    booking = first('booking')
+    scans = [s for s in spans if s['name'] == 'booth_scan']
+    commands = sum(row['count'] for row in bot.profiler.summary() if row['phase'] in BOOTH_PHASES)
+    return {
+        'first_slot_ms': found['end_ms'] - start['start_ms'] if start and found else None,
+        'click_to_confirm_ms': confirm['end_ms'] - click['start_ms'] if click and confirm else None,
+        'booking_ms': booking['duration_ms'] if booking else None,
+        'rpcs_per_booth': commands / len(scans) if scans else None,
+    }
+
+
+def limit_for(name, budget, tolerance):
+    """항목 한도 (시간 항목의 여유는 MIN_SLACK_MS ~ MAX_SLACK_MS로 제한)"""
+    if name.endswith('_ms'):
+        return budget + min(max(budget * tolerance, MIN_SLACK_MS), MAX_SLACK_MS)
+    return budget * (1 + tolerance)
+
+
+def check(measurements, budgets, tolerance):
+    """
+    항목별 중앙값을 예산과 비교
+
+    Returns:
+        tuple: (통과 여부, 항목별 결과 목록)
+    """
+    rows = []
+    passed = True
+    for name, budget in budgets.items():
+        values = [m[name] for m in measurements if m.get(name) is not None]
+        value = statistics.median(values) if values else None
+        limit = limit_for(name, budget, tolerance)
+        ok = value is not None and value <= limit
+        passed = passed and ok
+        rows.append({'name': name, 'value': value, 'budget': budget, 'limit': limit, 'ok': ok})
+    return passed, rows
+
+
+def format_rows(rows):
+    lines = [f"{'항목':<22} {'중앙값':>10} {'예산':>10} {'한도':>10}  결과"]
+    for row in rows:
+        value = '-' if row['value'] is None else f"{row['value']:.1f}"
+        lines.append(
+            f"{row['name']:<22} {value:>10} {row['budget']:>10.1f} {row['limit']:>10.1f}  "
+            f"{'✅' if row['ok'] else '❌'}"
+        )
+    return '\n'.join(lines)
+
+
+def _read_budget_file(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_budgets(path, backend='mock'):
+    """백엔드 기본 예산 + 예산 파일의 백엔드별 측정값"""
+    budgets = dict(DEFAULT_BUDGETS[backend])
+    budgets.update(_read_budget_file(path).get(backend, {}))
+    return budgets
+
+
+def write_budgets(path, backend, rows):
+    """이번 측정 중앙값을 예산 파일의 백엔드 항목에 저장 (다른 백엔드 값은 유지)"""
+    stored = _read_budget_file(path)
+    stored[backend] = {row['name']: round(row['value'], 1) for row in rows if row['value'] is not None}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(stored, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def _run_mock(rounds):
+    config = dict(bench_config(['12:00']), profile_driver=True)
+    measurements = []
+    booked = 0
+    with MockBookingServer() as server:
+        bot = MockBenchBot(config, server)
+        try:
+            for _ in range(rounds):
+                result = run_round(bot, server, lead=0.5)
+                booked += 1 if result['won'] else 0
+                measurements.append(measure(bot))
+        finally:
+            bot.close_driver()
+    return measurements, booked
+
+
+def _run_fake(rounds):
+    # book_tomorrow_slot은 "내일" 날짜를 찾으므로 캘린더의 예약 가능 날짜를 내일로 바꿔 둔다
+    site = FakeSite(open_day=(datetime.now() + timedelta(days=1)).day)
+    config = dict(fake_config([FIXTURE_TIME]), profile_driver=True)
+    bot = GolfBookingBot(config, driver_factory=lambda: FakeDriver(site))
+    if not bot.setup_driver():
+        raise RuntimeError("가짜 드라이버를 시작할 수 없습니다")
+    measurements = []
+    booked = 0
+    try:
+        for _ in range(rounds):
+            tracer = bot.start_trace('perf_gate')
+            with tracer.span('booking'):
+                success, _ = bot.book_tomorrow_slot()
+            booked += 1 if success else 0
+            measurements.append(measure(bot))
+    finally:
+        bot.close_driver()
+    return measurements, booked
+
+
+RUNNERS = {'mock': _run_mock, 'fake': _run_fake}
+
+
+def run_gate(rounds, backend='mock'):
+    """
+    예약 경로를 rounds번 실행
+
+    Returns:
+        tuple: (항목 측정값 목록, 예약 성공 횟수)
+    """
+    return RUNNERS[backend](rounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='예약 경로 성능 회귀 검사')
+    parser.add_argument('--backend', choices=BACKENDS, default='mock',
+                        help='mock: 모의 서버 + Chrome, fake: 가짜 드라이버')
+    parser.add_argument('--rounds', type=int, default=3, help='실행 횟수 (중앙값으로 비교)')
+    parser.add_argument('--budgets', default=BUDGET_FILE, help='예산 파일 (없으면 기본 예산)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='허용 오차 (비율)')
+    parser.add_argument('--write-budgets', action='store_true', help='이번 측정 중앙값을 예산 파일에 저장')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    measurements, booked = run_gate(args.rounds, args.backend)
+    budgets = load_budgets(args.budgets, args.backend)
+    passed, rows = check(measurements, budgets, args.tolerance)
+    # 예약 자체가 실패하면 시간 비교는 의미가 없으므로 실패 처리
+    passed = passed and booked == args.rounds
+
+    if args.json:
+        json.dump({'passed': passed, 'backend': args.backend, 'booked': booked, 'rounds': args.rounds,
+                   'checks': rows, 'measurements': measurements},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_rows(rows))
+        print(f"예약 성공 {booked}/{args.rounds}회 → {'✅ 통과' if passed else '❌ 실패'}")
+
+    if args.write_budgets:
+        write_budgets(args.budgets, args.backend, rows)
+        print(f"💾 예산 저장: {args.budgets} ({args.backend})", file=sys.stderr)
+        return
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
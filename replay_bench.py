@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 예약 경로 재생 벤치마크
+
+fixture_server.py가 로컬에서 서빙하는 저장된 네이버 페이지를 대상으로
+타석 확인 → 날짜 선택 → 시간 선택 → 다음 → 동의하고 예약하기 → 예약 확인을
+반복 실행하고 단계별 소요 시간(평균 / p50 / p95)을 출력한다.
+
+book_tomorrow_slot()은 내일 날짜에 고정되어 있으므로, 저장된 캘린더의 날짜(--day)로
+각 단계 메서드를 직접 호출한다. 로그인/쿠키/알림/실행 기록은 사용하지 않는다.
+
+사용법:
+    python replay_bench.py --iterations 10
+    python replay_bench.py --day 27 --time 08:00 --json
+"""
+
+import argparse
+import json
+import sys
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 벤치마크 로그가 golf_booking.log에 섞이지 않음
+setup_logging('replay_bench.log', json_file=None)
+
+from booking_trace import percentile  # noqa: E402
+from fixture_server import FIXTURE_BOOTH, FIXTURE_DAY, FIXTURE_TIME, FixtureServer  # noqa: E402
+from golf_auto_booking import GolfBookingBot, normalize_time  # noqa: E402
+
+REPLAY_PHASES = ['booth_page', 'date_select', 'time_snapshot', 'time_select', 'next', 'agree', 'confirm', 'total']
+
+
+def replay_config(headless=True):
+    """재생용 설정 (쿠키/기록/알림 없이 드라이버만 사용)"""
+    return {
+        'headless': headless,
+        'cookie_file': '.replay_no_cookies.pkl',
+        'enable_notification': False,
+        'enable_history': False,
+        'enable_trace': False,
+        'flight_recorder': False,
+    }
+
+
+def replay_once(bot, server, day=FIXTURE_DAY, time_ladder=(FIXTURE_TIME,), booth_num=FIXTURE_BOOTH):
+    """
+    예약 경로 한 번 재생
+
+    Returns:
+        tuple: (성공 여부, {단계: ms})
+    """
+    tracer = bot.start_trace('replay')
+    booth_info = {'num': booth_num, 'text': f'{booth_num}번타석예약', 'href': server.booth_url(booth_num)}
+    success = False
+    with tracer.span('total'):
+        result = bot._check_booth_availability(booth_info, day, list(time_ladder))
+        if result:
+            with tracer.span('time_select'):
+                result['time_btn'].click()
+            success = bot._click_next_button() and bot._click_agree_and_book() and bot._confirm_booking()
+    return success, tracer.phase_durations()
+
+
+def summarize(samples):
+    """단계별 평균 / p50 / p95 (ms)"""
+    summary = {}
+    for phase in REPLAY_PHASES:
+        values = sorted(sample[phase] for sample in samples if phase in sample)
+        if not values:
+            continue
+        summary[phase] = {
+            'count': len(values),
+            'mean_ms': round(sum(values) / len(values), 1),
+            'p50_ms': round(percentile(values, 50), 1),
+            'p95_ms': round(percentile(values, 95), 1),
+        }
+    return summary
+
+
+def format_summary(summary, runs, successes):
+    lines = [
+        f"재생 {runs}회 / 성공 {successes}회",
+        f"{'단계':<14} {'횟수':>5} {'평균ms':>10} {'p50ms':>10} {'p95ms':>10}",
+    ]
+    for phase, stats in summary.items():
+        lines.append(
+            f"{phase:<14} {stats['count']:>5} {stats['mean_ms']:>10.1f} "
+            f"{stats['p50_ms']:>10.1f} {stats['p95_ms']:>10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장된 네이버 페이지로 예약 경로 재생 벤치마크')
+    parser.add_argument('--iterations', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--day', type=int, default=FIXTURE_DAY, help='선택할 날짜 (저장된 캘린더 기준)')
+    parser.add_argument('--time', default=FIXTURE_TIME, help='선택할 시간 (24시간제)')
+    parser.add_argument('--no-headless', action='store_true', help='브라우저 창 표시')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        bot = GolfBookingBot(replay_config(headless=not args.no_headless))
+        if not bot.setup_driver():
+            print("❌ 드라이버를 시작할 수 없습니다")
+            sys.exit(1)
+        samples = []
+        successes = 0
+        try:
+            for _ in range(args.iterations):
+                success, phases = replay_once(bot, server, args.day, [normalize_time(args.time)])
+                successes += 1 if success else 0
+                samples.append(phases)
+        finally:
+            bot.close_driver()
+
+    summary = summarize(samples)
+    if args.json:
+        json.dump({'runs': len(samples), 'success': successes, 'phases': summary},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_summary(summary, len(samples), successes))
+    sys.exit(0 if successes == len(samples) else 1)
+
+
+if __name__ == "__main__":
+    main()
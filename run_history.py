@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예약 실행 기록 저장소 (SQLite)
+
+실행(시도) 한 번당 한 행: 모드, 지점, 계정, 확인한 타석, 선택한 슬롯,
+단계별 소요 시간, 결과. 로그 전체를 뒤지는 대신 인덱스 조회로 이력을 본다.
+
+사용법:
+    python run_history.py                 # 최근 20건
+    python run_history.py mode2 50        # 2번 모드 최근 50건
+"""
+
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = 'booking_history.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    branch TEXT,
+    account TEXT,
+    success INTEGER NOT NULL,
+    booths_tried TEXT,
+    booth TEXT,
+    slot_date TEXT,
+    slot_time TEXT,
+    error TEXT,
+    duration_ms REAL,
+    phases TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_mode_started_at ON runs (mode, started_at);
+"""
+
+_JSON_COLUMNS = ('booths_tried', 'phases')
+
+
+class RunHistory:
+    """실행 기록 저장소 (스레드마다 새 연결을 열어 사용)"""
+
+    _init_lock = threading.Lock()
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        with self._init_lock, closing(self._connect()) as conn, conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(self, started_at, mode, success, branch=None, account=None,
+               booths_tried=None, booking_info=None, duration_ms=None, phases=None):
+        """
+        실행 기록 한 건 저장
+
+        Args:
+            started_at: 실행 시작 시각 (datetime)
+            mode: 실행 모드 (예: 'mode2')
+            success: 예약 성공 여부
+            booths_tried: 확인한 타석 번호 목록 (확인 순서)
+            booking_info: 예약 결과 정보 (booth_text, date, time, error)
+            duration_ms: 전체 소요 시간
+            phases: 단계별 소요 시간 {단계: ms}
+
+        Returns:
+            int: 저장한 행 id (실패 시 None)
+        """
+        info = booking_info or {}
+        try:
+            with closing(self._connect()) as conn, conn:
+                cursor = conn.execute(
+                    "INSERT INTO runs (started_at, mode, branch, account, success, booths_tried,"
+                    " booth, slot_date, slot_time, error, duration_ms, phases)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        started_at.isoformat(timespec='seconds'),
+                        mode,
+                        branch,
+                        account,
+                        1 if success else 0,
+                        json.dumps(booths_tried or []),
+                        info.get('booth_text'),
+                        info.get('date'),
+                        info.get('time'),
+                        None if success else info.get('error'),
+                        duration_ms,
+                        json.dumps(phases or {}, ensure_ascii=False),
+                    ),
+                )
+                return cursor.lastrowid
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️  실행 기록 저장 실패: {str(e)}")
+            return None
+
+    def query(self, mode=None, since=None, success=None, limit=20):
+        """
+        실행 기록 조회 (최신순)
+
+        Args:
+            mode: 모드 필터 (예: 'mode2')
+            since: 이 시각 이후 (ISO 문자열 또는 datetime)
+            success: True/False 필터
+            limit: 최대 건수
+
+        Returns:
+            list: 실행 기록 딕셔너리 목록
+        """
+        clauses, params = [], []
+        if mode:
+            clauses.append("mode = ?")
+            params.append(mode)
+        if since:
+            clauses.append("started_at >= ?")
+            params.append(since if isinstance(since, str) else since.isoformat(timespec='seconds'))
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(1 if success else 0)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT * FROM runs{where} ORDER BY started_at DESC, id DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        records = []
+        for row in rows:
+            record = dict(row)
+            for column in _JSON_COLUMNS:
+                record[column] = json.loads(record[column] or 'null')
+            record['success'] = bool(record['success'])
+            records.append(record)
+        return records
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else None
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    for record in RunHistory().query(mode=mode, limit=limit):
+        result = '✅' if record['success'] else '❌'
+        slot = f"{record['booth']} {record['slot_date']} {record['slot_time']}" if record['success'] else record['error']
+        duration = f"{record['duration_ms'] / 1000:.1f}s" if record['duration_ms'] is not None else '-'
+        print(f"{record['started_at']}  {record['mode']:<6} {record['branch'] or '-':<6} "
+              f"{record['account'] or '-':<8} {result} {duration:>7}  "
+              f"타석 {','.join(map(str, record['booths_tried'] or [])) or '-'}  {slot}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+선택자(셀렉터) 방식별 조회 속도 마이크로 벤치마크
+
+fixture_server.py로 저장된 예약 페이지를 headless Chrome에 띄우고, 같은 요소를 찾는
+여러 방식(XPath / CSS / 스크립트)을 반복 실행해 조회 한 번의 소요 시간을 비교한다.
+대상은 _select_date, _select_calendar_date, _select_time, _find_ladder_slot,
+_click_next_button, _process_booking_steps, _click_agree_and_book에서 쓰는 선택자다.
+
+결과를 기준값(selector_baseline.json)으로 저장해 두면 이후 선택자 변경 시
+p50 변화율을 함께 출력한다.
+
+사용법:
+    python selector_bench.py                       # 기준값이 있으면 비교
+    python selector_bench.py --iterations 200 --save-baseline
+    python selector_bench.py --target date --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 벤치마크 로그가 golf_booking.log에 섞이지 않음
+setup_logging('selector_bench.log', json_file=None)
+
+from selenium.webdriver.common.by import By  # noqa: E402
+
+from booking_trace import percentile  # noqa: E402
+from fixture_server import FIXTURE_BOOTH, FIXTURE_DAY, FIXTURE_TIME, FixtureServer  # noqa: E402
+from golf_auto_booking import TIME_SLOT_SNAPSHOT_JS, GolfBookingBot  # noqa: E402
+
+BASELINE_FILE = 'selector_baseline.json'
+# 기준값보다 p50이 이 비율 이상 느리면 표시
+DEFAULT_TOLERANCE = 0.2
+
+
+def _xpath(expression):
+    return lambda driver, p: driver.find_elements(By.XPATH, expression.format(**p))
+
+
+def _css(selector):
+    return lambda driver, p: driver.find_elements(By.CSS_SELECTOR, selector.format(**p))
+
+
+def _script(source):
+    # 스크립트는 arguments[0]으로 파라미터(dict)를 받는다
+    return lambda driver, p: driver.execute_script(source, p)
+
+
+def _css_text(selector, key):
+    """CSS로 후보를 모두 찾은 뒤 .text를 하나씩 비교 (요소마다 WebDriver 왕복)"""
+    return lambda driver, p: [e for e in driver.find_elements(By.CSS_SELECTOR, selector) if e.text.strip() == str(p[key])]
+
+
+def _span_then_ancestor(driver, p):
+    """_select_calendar_date 방식: span.num 찾기 → 부모 button으로 한 번 더 이동"""
+    spans = driver.find_elements(By.XPATH, f"//span[@class='num' and text()='{p['day']}']")
+    return [s.find_element(By.XPATH, "./ancestor::button[contains(@class, 'calendar_date')]") for s in spans]
+
+
+# (대상, 페이지, 변형 이름, 조회 함수)
+SELECTOR_CASES = [
+    # 날짜 버튼 (_select_date / _select_calendar_date)
+    ('date', 'booth', 'xpath_button_text', _xpath("//button[text()='{day}']")),
+    ('date', 'booth', 'xpath_button_contains', _xpath("//button[contains(text(), '{day}')]")),
+    ('date', 'booth', 'xpath_date_class', _xpath("//*[contains(@class, 'date')]//*[text()='{day}']")),
+    ('date', 'booth', 'xpath_span_then_ancestor', _span_then_ancestor),
+    ('date', 'booth', 'xpath_single', _xpath(
+        "//button[contains(@class, 'calendar_date')][span[@class='num' and text()='{day}']]")),
+    ('date', 'booth', 'css_text_filter', _css_text('button.calendar_date span.num', 'day')),
+    ('date', 'booth', 'script', _script(
+        "return Array.from(document.querySelectorAll('button.calendar_date span.num'))"
+        ".filter(function (s) { return s.textContent.trim() === String(arguments[0].day); })"
+        ".map(function (s) { return s.closest('button'); });")),
+    # 시간 버튼 (_select_time / _find_ladder_slot)
+    ('time', 'booth', 'xpath_button_contains', _xpath("//button[contains(text(), '{time12}')]")),
+    ('time', 'booth', 'xpath_span_ancestor', _xpath("//span[contains(text(), '{time12}')]/ancestor::button")),
+    ('time', 'booth', 'xpath_time_class', _xpath(
+        "//*[contains(@class, 'time')]//*[contains(text(), '{time12}')]/ancestor::button")),
+    ('time', 'booth', 'css_text_filter', _css_text('button.btn_time', 'time12')),
+    ('time', 'booth', 'script_snapshot', _script(TIME_SLOT_SNAPSHOT_JS)),
+    # '다음' 버튼 (_click_next_button / _process_booking_steps)
+    ('next', 'booth', 'xpath_click_code_enabled', _xpath(
+        "//button[@data-click-code='nextbuttonview.request'][not(contains(@class, 'disabled'))]")),
+    ('next', 'booth', 'xpath_click_code', _xpath("//button[@data-click-code='nextbuttonview.request']")),
+    ('next', 'booth', 'xpath_class_contains', _xpath("//button[contains(@class, 'NextButton__btn_next')]")),
+    ('next', 'booth', 'xpath_text', _xpath("//button[contains(text(), '다음')]")),
+    ('next', 'booth', 'css_click_code', _css('button[data-click-code="nextbuttonview.request"]')),
+    ('next', 'booth', 'css_class_prefix', _css('button[class*="NextButton__btn_next"]')),
+    ('next', 'booth', 'script', _script(
+        "return document.querySelector('button[data-click-code=\"nextbuttonview.request\"]');")),
+    # '동의하고 예약하기' 버튼 (_click_agree_and_book)
+    ('agree', 'order', 'xpath_click_code', _xpath("//button[@data-click-code='submitbutton.submit']")),
+    ('agree', 'order', 'xpath_class_contains', _xpath("//button[contains(@class, 'btn_request')]")),
+    ('agree', 'order', 'xpath_text', _xpath("//button[contains(text(), '동의하고 예약하기')]")),
+    ('agree', 'order', 'css_click_code', _css('button[data-click-code="submitbutton.submit"]')),
+    ('agree', 'order', 'css_class', _css('button.btn_request')),
+    ('agree', 'order', 'script', _script(
+        "return document.querySelector('button[data-click-code=\"submitbutton.submit\"]');")),
+]
+
+
+def _match_count(result):
+    if result is None:
+        return 0
+    return len(result) if isinstance(result, list) else 1
+
+
+def bench_case(driver, lookup, params, iterations, warmup=3):
+    """조회 함수 반복 실행 (ms 단위 통계 + 찾은 요소 수)"""
+    matches = 0
+    for _ in range(warmup):
+        matches = _match_count(lookup(driver, params))
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        lookup(driver, params)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'matches': matches,
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'p50_ms': round(percentile(samples, 50), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+    }
+
+
+def run_suite(driver, server, iterations, targets=None):
+    """
+    전체 선택자 벤치마크
+
+    Returns:
+        dict: {'대상/변형': 통계}
+    """
+    hour, minute = (int(part) for part in FIXTURE_TIME.split(':'))
+    params = {'day': FIXTURE_DAY, 'time12': f"{hour % 12 or 12}:{minute:02d}"}
+    pages = {'booth': server.booth_url(FIXTURE_BOOTH), 'order': server.url(server.order_path)}
+    results = {}
+    loaded = None
+    for target, page, name, lookup in SELECTOR_CASES:
+        if targets and target not in targets:
+            continue
+        if loaded != page:
+            driver.get(pages[page])
+            loaded = page
+        results[f"{target}/{name}"] = bench_case(driver, lookup, params, iterations)
+    return results
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def format_results(results, baseline=None, tolerance=DEFAULT_TOLERANCE):
+    base = (baseline or {}).get('results', {})
+    lines = [f"{'대상/변형':<38} {'요소':>4} {'평균ms':>8} {'p50ms':>8} {'p95ms':>8} {'기준 대비':>10}"]
+    for key, stats in results.items():
+        delta = ''
+        previous = base.get(key)
+        if previous and previous['p50_ms']:
+            change = stats['p50_ms'] / previous['p50_ms'] - 1
+            delta = f"{change * 100:+.0f}%" + (' ⚠️' if change > tolerance else '')
+        lines.append(
+            f"{key:<38} {stats['matches']:>4} {stats['mean_ms']:>8.2f} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {delta:>10}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='선택자 방식별 조회 속도 벤치마크 (저장된 예약 페이지)')
+    parser.add_argument('--iterations', type=int, default=50, help='변형별 반복 횟수')
+    parser.add_argument('--target', action='append', choices=['date', 'time', 'next', 'agree'],
+                        help='대상만 실행 (여러 번 지정 가능)')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='기준값 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='느려짐 표시 기준 (비율)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        bot = GolfBookingBot({'headless': True, 'enable_history': False, 'enable_trace': False,
+                              'flight_recorder': False})
+        if not bot.setup_driver():
+            print("❌ 드라이버를 시작할 수 없습니다")
+            sys.exit(1)
+        try:
+            # 없는 요소를 찾을 때 암묵적 대기가 측정에 섞이지 않도록
+            bot.driver.implicitly_wait(0)
+            results = run_suite(bot.driver, server, args.iterations, args.target)
+            browser = bot.driver.capabilities.get('browserVersion')
+        finally:
+            bot.close_driver()
+
+    report = {
+        'measured_at': datetime.now().isoformat(timespec='seconds'),
+        'browser_version': browser,
+        'iterations': args.iterations,
+        'results': results,
+    }
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_results(results, load_baseline(args.baseline), args.tolerance))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 세션 기록 (record mode)
+
+실제 실행 중 다음을 기록해 실행마다 zip 아카이브 하나로 저장한다.
+- WebDriver 명령: 시각(타임라인 기준 ms), 단계, 소요 시간, 오류
+- 페이지 스냅샷: 페이지 이동 / 클릭 / iframe 전환 직후의 DOM (같은 내용은 한 번만 저장)
+- 네트워크 응답: Chrome performance 로그에서 예약 API 응답(URL/상태/시간 + 본문)
+- 단계별 타임라인: Tracer.to_dict()
+
+아카이브 구조 (recordings/session_YYYYMMDD_HHMMSS_<실행>.zip):
+    manifest.json      메타 / 명령 / 스냅샷 목록 / 응답 목록 / 타임라인
+    pages/<sha1>.html  스냅샷 DOM
+    bodies/<sha1>      응답 본문
+
+스냅샷과 응답 수집은 계측 래퍼를 거치지 않고 드라이버 클래스의 execute를 바로 호출하므로
+명령 프로파일 / 플라이트 레코더 / 지표에는 섞이지 않는다. 다만 실제로 드라이버 왕복이 추가되므로
+기록 모드의 전체 소요 시간은 평소보다 길다 (각 명령의 ms는 명령 자체만 측정).
+
+performance 로그는 network_capture.PerformanceLog로 읽는다 (시간표 캡처와 함께 써도 항목을 나눠 가짐).
+
+재생은 session_replay.py 참고.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from datetime import datetime
+
+from network_capture import PerformanceLog
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+# 이 명령 직후의 화면을 스냅샷으로 남김
+SNAPSHOT_COMMANDS = {'get', 'refresh', 'clickElement', 'switchToFrame'}
+# 기록할 네트워크 응답 (예약 API / GraphQL)
+DEFAULT_RESPONSE_PATTERN = r'booking\.naver\.com/.*(api|graphql)|/graphql'
+CURRENT_URL_JS = 'return document.location.href;'
+
+
+def _digest(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _is_script_click(driver_command, params):
+    return driver_command in ('executeScript', 'w3cExecuteScript') and '.click()' in (params or {}).get('script', '')
+
+
+class SessionRecorder:
+    """드라이버 명령 / 페이지 스냅샷 / 네트워크 응답 기록기"""
+
+    def __init__(self, directory='recordings', phase_fn=None, response_pattern=None, log=None):
+        """
+        Args:
+            directory: 아카이브 저장 폴더
+            phase_fn: 현재 단계 이름을 돌려주는 함수
+            response_pattern: 본문까지 기록할 응답 URL 정규식 (None이면 예약 API)
+            log: 공유 PerformanceLog (None이면 혼자 읽음)
+        """
+        self.directory = directory
+        self.phase_fn = phase_fn or (lambda: None)
+        self.response_re = re.compile(response_pattern or DEFAULT_RESPONSE_PATTERN)
+        self.log = log or PerformanceLog()
+        self.log.register(self)
+        self._network = True
+        self.reset()
+
+    def reset(self, origin=None):
+        """새 실행 시작 (origin: 타임라인 기준 시각, Tracer.origin)"""
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.events = []
+        self.snapshots = []
+        self.responses = []
+        self.pages = {}
+        self.bodies = {}
+
+    def _ms(self, t):
+        return round((t - self.origin) * 1000, 3)
+
+    def attach(self, driver):
+        """드라이버 execute를 감싸 명령과 스냅샷을 기록 (중복 적용 안 함)"""
+        if getattr(driver, '_session_recorder', None) is self:
+            return driver
+        original = driver.execute
+        # 계측 래퍼를 거치지 않는 원래 execute (스냅샷 수집용)
+        raw = type(driver).execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            error = None
+            try:
+                return original(driver_command, params)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                end = time.perf_counter()
+                self.events.append({
+                    'at_ms': self._ms(start),
+                    'command': driver_command,
+                    'phase': self.phase_fn(),
+                    'ms': round((end - start) * 1000, 3),
+                    'error': error,
+                })
+                if error is None and (driver_command in SNAPSHOT_COMMANDS or _is_script_click(driver_command, params)):
+                    self._snapshot(lambda command, p=None: raw(driver, command, p)['value'], driver_command)
+
+        driver.execute = execute
+        driver._session_recorder = self
+        return driver
+
+    def _snapshot(self, call, after):
+        start = time.perf_counter()
+        try:
+            html = call('getPageSource')
+            url = call('w3cExecuteScript', {'script': CURRENT_URL_JS, 'args': []})
+        except Exception as e:
+            logger.debug("스냅샷 실패: %s", e)
+            return
+        digest = _digest(html)
+        self.pages.setdefault(digest, html)
+        self.snapshots.append({
+            'at_ms': self._ms(start),
+            'after': after,
+            'phase': self.phase_fn(),
+            'url': url,
+            'page': digest,
+            'capture_ms': round((time.perf_counter() - start) * 1000, 3),
+        })
+        self._collect_responses(call)
+
+    def _collect_responses(self, call):
+        """performance 로그의 응답 중 예약 API만 본문과 함께 기록 (로그가 없는 드라이버면 중단)"""
+        if not self._network:
+            return
+        try:
+            entries = self.log.read(call, self)
+        except Exception as e:
+            logger.debug("네트워크 로그 사용 불가: %s", e)
+            self._network = False
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            params = message.get('params', {})
+            response = params.get('response', {})
+            if not self.response_re.search(response.get('url', '')):
+                continue
+            record = {
+                'url': response.get('url'),
+                'status': response.get('status'),
+                'mime': response.get('mimeType'),
+                'phase': self.phase_fn(),
+                'timing': response.get('timing'),
+                'body': None,
+            }
+            try:
+                body = call('executeCdpCommand', {
+                    'cmd': 'Network.getResponseBody', 'params': {'requestId': params.get('requestId')},
+                })
+                text = body.get('body', '')
+                digest = _digest(text)
+                self.bodies.setdefault(digest, text)
+                record['body'] = digest
+                record['base64'] = bool(body.get('base64Encoded'))
+            except Exception as e:
+                # 본문이 이미 버려진 응답 (리다이렉트 등)
+                record['body_error'] = type(e).__name__
+            self.responses.append(record)
+
+    def save(self, tracer):
+        """
+        아카이브 저장
+
+        Args:
+            tracer: 이번 실행의 Tracer (타임라인 / 실행 이름)
+
+        Returns:
+            str: 아카이브 경로 (실패 시 None)
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(
+                self.directory, f"session_{tracer.started_at.strftime('%Y%m%d_%H%M%S')}_{tracer.run_name}.zip"
+            )
+            manifest = {
+                'version': ARCHIVE_VERSION,
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'events': self.events,
+                'snapshots': self.snapshots,
+                'responses': self.responses,
+                'trace': tracer.to_dict(),
+            }
+            with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('manifest.json', json.dumps(manifest, ensure_ascii=False, default=str))
+                for digest, html in self.pages.items():
+                    archive.writestr(f"pages/{digest}.html", html)
+                for digest, text in self.bodies.items():
+                    archive.writestr(f"bodies/{digest}", text)
+            logger.info(f"📼 세션 기록 저장: {path} (스냅샷 {len(self.snapshots)}개 / 응답 {len(self.responses)}개)")
+            return path
+        except Exception as e:
+            logger.warning(f"⚠️  세션 기록 저장 실패: {str(e)}")
+            return None
+
+
+class SessionArchive:
+    """저장된 세션 아카이브 읽기"""
+
+    def __init__(self, path):
+        self.path = path
+        with zipfile.ZipFile(path) as archive:
+            self.manifest = json.loads(archive.read('manifest.json').decode('utf-8'))
+            self.pages = {
+                name[len('pages/'):-len('.html')]: archive.read(name).decode('utf-8')
+                for name in archive.namelist() if name.startswith('pages/')
+            }
+            self.bodies = {
+                name[len('bodies/'):]: archive.read(name).decode('utf-8')
+                for name in archive.namelist() if name.startswith('bodies/')
+            }
+
+    @property
+    def snapshots(self):
+        return self.manifest.get('snapshots', [])
+
+    @property
+    def events(self):
+        return self.manifest.get('events', [])
+
+    @staticmethod
+    def url_key(url):
+        """스냅샷 조회 키: 호스트 + 경로 (쿼리/프래그먼트 무시)"""
+        match = re.match(r'^[a-z]+://([^/?#]+)([^?#]*)', url or '')
+        return (match.group(1), match.group(2) or '/') if match else (None, url)
+
+    def last_pages(self):
+        """URL(호스트 + 경로)별 마지막 스냅샷 HTML (가장 많이 진행된 화면)"""
+        pages = {}
+        for snapshot in self.snapshots:
+            html = self.pages.get(snapshot['page'])
+            if html is not None:
+                pages[self.url_key(snapshot['url'])] = html
+        return pages
+
+    def slowest_commands(self, limit=10):
+        return sorted(self.events, key=lambda e: e['ms'], reverse=True)[:limit]
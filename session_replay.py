@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기록된 세션(session_recorder.py 아카이브) 재생
+
+- show:  기록 요약 (단계별 소요 시간, 가장 느린 명령, 스냅샷/응답 수)
+- serve: 기록된 페이지를 픽스처 서버로 서빙 (replay_bench / selector_bench / 브라우저 확인용)
+- fake:  기록된 페이지로 가짜 드라이버 벤치마크 (fake_bench.py와 같은 측정)
+
+URL(호스트 + 경로)마다 마지막 스냅샷을 쓴다 (날짜 클릭 후처럼 가장 많이 진행된 화면).
+기록에 없는 URL은 저장된 픽스처 페이지로 대신한다.
+
+사용법:
+    python session_replay.py show recordings/session_20250101_000000_mode2.zip
+    python session_replay.py serve recordings/session_20250101_000000_mode2.zip --port 8800
+    python session_replay.py fake recordings/session_20250101_000000_mode2.zip --mode booking --iterations 200
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+from booking_logging import setup_logging
+
+# golf_auto_booking을 불러오기 전에 설정해야 재생 로그가 golf_booking.log에 섞이지 않음
+setup_logging('session_replay.log', json_file=None)
+
+from fixture_server import FixtureServer, sanitize_page, strip_assets  # noqa: E402
+from session_recorder import SessionArchive  # noqa: E402
+
+PLACE_HOST_RE = re.compile(r'https?://pcmap\.place\.naver\.com')
+BOOTH_PATH_RE = re.compile(r'^/booking/\d+/bizes/\d+/items/\d+')
+
+
+def recorded_target(archive):
+    """
+    기록된 실행의 예약 대상 날짜(일) / 시간
+
+    Returns:
+        tuple: (일, 'HH:MM' 또는 None) - 기록 시작일 다음 날 / 마지막 시간 선택
+    """
+    trace = archive.manifest.get('trace', {})
+    started = datetime.fromisoformat(trace['started_at']) if trace.get('started_at') else datetime.now()
+    picked = [span['attrs'].get('time') for span in trace.get('spans', []) if span['name'] == 'time_select']
+    return (started + timedelta(days=1)).day, (picked[-1] if picked and picked[-1] else None)
+
+
+def last_booth_page(pages):
+    """기록에 없는 타석 대신 쓸 마지막 타석 페이지 (타석 페이지는 구조가 같음)"""
+    return next((html for (host, path), html in reversed(list(pages.items())) if BOOTH_PATH_RE.match(path)), None)
+
+
+def make_archive_site(archive, **kwargs):
+    """기록된 페이지를 돌려주는 FakeSite (fake_driver를 쓸 때만 불러옴: selenium 필요)"""
+    from fake_driver import FakeSite
+
+    class ArchiveSite(FakeSite):
+        def __init__(self):
+            super().__init__(**kwargs)
+            self.archive_pages = archive.last_pages()
+            self.booth_page = last_booth_page(self.archive_pages)
+            day, slot_time = recorded_target(archive)
+            self.source_day = day
+            self.slot_time = slot_time or self.slot_time
+
+        def page_for(self, url):
+            kind, key, build = super().page_for(url)
+            page_key = SessionArchive.url_key(url)
+            html = self.archive_pages.get(page_key)
+            if html is None and kind == 'booth':
+                html, page_key = self.booth_page, ('booking.naver.com', '/items')
+            if html is None:
+                return kind, key, build
+            return (kind if kind != 'not_found' else 'archive'), f"archive:{''.join(page_key)}", \
+                lambda: strip_assets(html)
+
+    return ArchiveSite()
+
+
+class ArchiveFixtureServer(FixtureServer):
+    """
+    기록된 페이지를 서빙하는 픽스처 서버
+
+    /map/<경로> → map.naver.com, /pcmap/<경로> → pcmap.place.naver.com, 그 외 → booking.naver.com
+    """
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive_pages = archive.last_pages()
+        self.booth_page = last_booth_page(self.archive_pages)
+
+    @staticmethod
+    def page_key(path):
+        if path.startswith('/map/'):
+            return 'map.naver.com', path[len('/map'):]
+        if path.startswith('/pcmap/'):
+            return 'pcmap.place.naver.com', path[len('/pcmap'):]
+        return 'booking.naver.com', path
+
+    def page_for(self, path, query):
+        key = self.page_key(path)
+        html = self.archive_pages.get(key)
+        if html is None and BOOTH_PATH_RE.match(path):
+            html, key = self.booth_page, ('booking.naver.com', '/items')
+        if html is None:
+            return super().page_for(path, query)
+        page = self._fixtures.get(key)
+        if page is None:
+            page = sanitize_page(html, self.base_url, self.state_script % self.script_params())
+            page = self._fixtures[key] = PLACE_HOST_RE.sub(self.base_url + '/pcmap', page)
+        return 200, page
+
+
+def format_archive(archive, limit=10):
+    manifest = archive.manifest
+    trace = manifest.get('trace', {})
+    lines = [
+        f"📼 {archive.path}",
+        f"  실행: {trace.get('run')} / 시작 {trace.get('started_at')} / "
+        f"성공 {trace.get('meta', {}).get('success')}",
+        f"  명령 {len(archive.events)}개 / 스냅샷 {len(archive.snapshots)}개 "
+        f"(고유 페이지 {len(archive.pages)}개) / 응답 {len(manifest.get('responses', []))}개",
+        "",
+        f"{'단계':<16} {'합계ms':>10}",
+    ]
+    for name, total in sorted(trace.get('phase_totals_ms', {}).items(), key=lambda item: -item[1]):
+        lines.append(f"{name:<16} {total:>10.1f}")
+    lines += ["", f"가장 느린 명령 {limit}개", f"{'시각ms':>10} {'ms':>9}  {'단계':<16} 명령"]
+    for event in archive.slowest_commands(limit):
+        lines.append(
+            f"{event['at_ms']:>10.1f} {event['ms']:>9.1f}  {str(event['phase']):<16} {event['command']}"
+            + (f" ({event['error']})" if event.get('error') else '')
+        )
+    responses = manifest.get('responses', [])
+    if responses:
+        lines += ["", "예약 API 응답"]
+        for response in responses:
+            lines.append(f"  {response.get('status')} {response.get('phase')} {response.get('url')}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록된 세션 재생 (요약 / 픽스처 서버 / 가짜 드라이버)')
+    parser.add_argument('command', choices=['show', 'serve', 'fake'])
+    parser.add_argument('archive', help='session_recorder.py 아카이브 (.zip)')
+    parser.add_argument('--port', type=int, default=8800, help='serve: 포트')
+    parser.add_argument('--mode', choices=['replay', 'booking'], default='replay', help='fake: 실행 경로')
+    parser.add_argument('--iterations', type=int, default=200, help='fake: 반복 횟수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    archive = SessionArchive(args.archive)
+
+    if args.command == 'show':
+        if args.json:
+            json.dump({'snapshots': archive.snapshots, 'slowest_commands': archive.slowest_commands(),
+                       'trace': archive.manifest.get('trace')}, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+        else:
+            print(format_archive(archive))
+        return
+
+    if args.command == 'serve':
+        with ArchiveFixtureServer(archive, port=args.port) as server:
+            print(f"기록 서버: {server.base_url} (페이지 {len(server.archive_pages)}개)")
+            for host, path in sorted(server.archive_pages):
+                prefix = {'map.naver.com': '/map', 'pcmap.place.naver.com': '/pcmap'}.get(host, '')
+                print(f"  {server.url(prefix + path)}")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+        return
+
+    from fake_bench import bench, format_report
+
+    report = bench(args.mode, args.iterations, site=make_archive_site(archive))
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_report(report))
+    sys.exit(0 if report['success'] == report['iterations'] else 1)
+
+
+if __name__ == "__main__":
+    main()
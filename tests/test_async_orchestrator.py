@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""asyncio 오케스트레이터 (가짜 드라이버 레인)"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from async_orchestrator import AsyncBookingOrchestrator  # noqa: E402
+from fake_bench import SleepRecorder, fake_config  # noqa: E402
+from fake_driver import FakeDriver, FakeSite  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+
+
+def test_failed_lane_is_logged_and_others_continue(monkeypatch, caplog):
+    site = FakeSite()
+    site.open_day = (datetime.now() + timedelta(days=1)).day
+    monkeypatch.setattr(GolfBookingBot, 'naver_login', lambda self: True)
+    orchestrator = AsyncBookingOrchestrator(
+        dict(fake_config([site.slot_time]), async_lanes=2),
+        driver_factory=lambda: FakeDriver(site),
+        bot_class=GolfBookingBot,
+    )
+
+    def broken(*args):
+        raise RuntimeError('lane down')
+
+    monkeypatch.setattr(orchestrator.lanes[0], '_check_booth_availability', broken)
+    with SleepRecorder(), caplog.at_level(logging.ERROR, logger='async_orchestrator'):
+        assert orchestrator.run('1')
+    assert any('레인 0' in record.getMessage() and 'lane down' in record.getMessage() for record in caplog.records)
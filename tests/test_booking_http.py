@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""HTTP 예약 확정 결과 구분 (모의 예약 서버 /commit)"""
+
+import pytest
+
+pytest.importorskip('requests')
+
+from booking_http import BOOKED, REJECTED, UNCONFIRMED, UNKNOWN, HttpBookingClient, slot_fields  # noqa: E402
+from mock_booking_server import MockBookingServer  # noqa: E402
+
+BOOTH = 11
+TIME = '06:00'
+
+
+class _BrokenCompletionServer(MockBookingServer):
+    """예약은 받지만 완료 리소스가 500"""
+
+    def page_for(self, path, query):
+        if path.startswith('/my/bookings/'):
+            return 500, '<html><body>error</body></html>'
+        return super().page_for(path, query)
+
+
+def _commit(server, timeout=5.0, origin=None):
+    client = HttpBookingClient(server.http_commit_request, origin=origin or server.base_url, timeout=timeout)
+    slot = {'booth_num': BOOTH, 'booth_href': server.booth_url(BOOTH),
+            'date': server.target_date.isoformat(), 'time': TIME}
+    return client.commit(slot_fields(slot, server.biz_id, client.origin))
+
+
+def _open(server):
+    server.arm(server.server_time() - 1)
+    return server
+
+
+def test_commit_booked():
+    with MockBookingServer() as server:
+        result = _commit(_open(server))
+    assert result['outcome'] == BOOKED
+    assert result['ok'] and result['booking_id'] == server.booking_id
+
+
+def test_commit_rejected_when_slot_taken():
+    with MockBookingServer() as server:
+        _open(server)
+        assert _commit(server)['outcome'] == BOOKED
+        result = _commit(server)
+    assert result['outcome'] == REJECTED
+    assert result['status'] == 409 and result['booking_id'] is None
+
+
+def test_commit_rejected_when_not_sent():
+    with MockBookingServer() as server:
+        origin = server.base_url
+    result = _commit(server, origin=origin)
+    assert result['outcome'] == REJECTED
+
+
+def test_commit_unknown_on_read_timeout():
+    with MockBookingServer(latency=0.5) as server:
+        result = _commit(_open(server), timeout=0.1)
+    assert result['outcome'] == UNKNOWN
+    assert not result['ok']
+
+
+def test_commit_unconfirmed_when_completion_fails():
+    with _BrokenCompletionServer() as server:
+        result = _commit(_open(server))
+    assert result['outcome'] == UNCONFIRMED
+    assert result['booking_id'] == server.booking_id and not result['ok']
+
+
+def test_bot_http_commit_sends_browser_user_agent():
+    pytest.importorskip('selenium')
+    from fake_driver import FakeDriver
+    from golf_auto_booking import GolfBookingBot
+    from replay_bench import replay_config
+
+    with MockBookingServer() as server:
+        _open(server)
+        bot = GolfBookingBot(dict(replay_config(), http_commit=True, http_commit_origin=server.base_url,
+                                  http_commit_request=server.http_commit_request))
+        bot.driver = FakeDriver()
+        bot.start_trace('http_commit')
+        outcome = bot._http_commit({'booth_num': BOOTH, 'booth_href': server.booth_url(BOOTH),
+                                    'date': server.target_date.isoformat(), 'time': TIME})
+    assert outcome == BOOKED
+    assert bot.http_booking.session.headers['User-Agent'] == FakeDriver.USER_AGENT
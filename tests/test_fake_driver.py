@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""가짜 드라이버 스모크 테스트 - 실제 selenium 명령 표와 맞는지 예약 1회로 확인"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import fake_bench  # noqa: E402
+
+
+def test_fake_booking_once():
+    report = fake_bench.bench('booking', 1)
+    assert report['success'] == 1
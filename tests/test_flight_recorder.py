@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""실패 플라이트 레코더 (드라이버는 호출 스레드에서만 읽는지)"""
+
+import json
+import os
+import threading
+
+from flight_recorder import FlightRecorder
+
+
+class _Page:
+    """현재 페이지만 흉내 내는 드라이버 (읽은 스레드를 기록)"""
+
+    def __init__(self):
+        self.url = 'https://booking.naver.com/a'
+        self.threads = set()
+
+    def _read(self, value):
+        self.threads.add(threading.get_ident())
+        return value
+
+    @property
+    def current_url(self):
+        return self._read(self.url)
+
+    @property
+    def title(self):
+        return self._read('title')
+
+    @property
+    def page_source(self):
+        return self._read(f'<html>{self.url}</html>')
+
+    def get_screenshot_as_png(self):
+        return self._read(b'png')
+
+
+def test_capture_reads_driver_synchronously(tmp_path):
+    recorder = FlightRecorder(directory=str(tmp_path))
+    driver = _Page()
+    future = recorder.capture(driver, 'confirm_not_found')
+    # 캡처 직후 페이지가 바뀌어도 번들은 실패 시점의 페이지
+    driver.url = 'https://booking.naver.com/b'
+    path = future.result(timeout=5)
+
+    assert driver.threads == {threading.get_ident()}
+    with open(os.path.join(path, 'bundle.json'), encoding='utf-8') as f:
+        assert json.load(f)['url'].endswith('/a')
+    with open(os.path.join(path, 'dom.html'), encoding='utf-8') as f:
+        assert f.read().endswith('/a</html>')
+    with open(os.path.join(path, 'screenshot.png'), 'rb') as f:
+        assert f.read() == b'png'
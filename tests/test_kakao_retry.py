@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""카카오 API 재시도 정책 (요청이 나가지 않은 경우 / Retry-After 429만 재시도)"""
+
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError  # noqa: E402
+
+import kakao_notification  # noqa: E402
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _Session:
+    """미리 정한 결과(응답 또는 예외)를 차례로 돌려주는 세션"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _refused():
+    return requests.ConnectionError(MaxRetryError(None, '/', NewConnectionError(None, 'refused')))
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    monkeypatch.setattr(kakao_notification.time, 'sleep', lambda seconds: None)
+
+
+def test_retries_connection_refused():
+    session = _Session(_refused(), _Response(200))
+    assert kakao_notification.post_with_retry(session, 'https://kapi.kakao.com').status_code == 200
+    assert session.calls == 2
+
+
+def test_read_timeout_not_retried():
+    session = _Session(requests.ReadTimeout(), _Response(200))
+    with pytest.raises(requests.ReadTimeout):
+        kakao_notification.post_with_retry(session, 'https://kapi.kakao.com')
+    assert session.calls == 1
+
+
+def test_server_error_not_retried():
+    session = _Session(_Response(500), _Response(200))
+    assert kakao_notification.post_with_retry(session, 'https://kapi.kakao.com').status_code == 500
+    assert session.calls == 1
+
+
+@pytest.mark.parametrize('headers, calls', [({'Retry-After': '1'}, 2), ({}, 1), ({'Retry-After': '600'}, 1)])
+def test_too_many_requests_retried_only_with_retry_after(headers, calls):
+    session = _Session(_Response(429, headers), _Response(200))
+    kakao_notification.post_with_retry(session, 'https://kapi.kakao.com')
+    assert session.calls == calls
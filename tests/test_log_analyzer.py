@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""로테이션 로그 파일 순서"""
+
+import os
+
+import log_analyzer
+
+
+def test_rotated_files_oldest_first(tmp_path):
+    log = tmp_path / 'golf_booking.log'
+    for name in ('golf_booking.log', 'golf_booking.log.1.gz', 'golf_booking.log.2.gz',
+                 'golf_booking.log.10.gz', 'golf_booking.log.3', 'golf_booking.log.old.4',
+                 'golf_booking.log.bak'):
+        (tmp_path / name).write_text('')
+    names = [os.path.basename(path) for path in log_analyzer.rotated_files(str(log))]
+    assert names == ['golf_booking.log.10.gz', 'golf_booking.log.3', 'golf_booking.log.2.gz',
+                     'golf_booking.log.1.gz', 'golf_booking.log']
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""다중 계정 타석 배정 / 다중 지점 설정"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from golf_auto_booking import MultiAccountOrchestrator, MultiBranchBooker  # noqa: E402
+
+
+def _config(accounts, booth_numbers=(1, 2, 3)):
+    return {'booth_numbers': list(booth_numbers), 'priority_seats': [3], 'accounts': accounts}
+
+
+def test_fixed_and_auto_shares_do_not_overlap():
+    configs = MultiAccountOrchestrator(_config([
+        {'user_id': 'a', 'booths': [3]},
+        {'user_id': 'b'},
+        {'user_id': 'c'},
+    ])).build_account_configs()
+    booths = {c['name']: c['allowed_booths'] for c in configs}
+    assert booths == {'a': [3], 'b': [1], 'c': [2]}
+
+
+def test_account_without_booths_left_is_skipped():
+    configs = MultiAccountOrchestrator(_config([
+        {'user_id': 'a', 'booths': [1, 2]},
+        {'user_id': 'b'},
+        {'user_id': 'c'},
+    ])).build_account_configs()
+    assert [(c['name'], c['allowed_booths']) for c in configs] == [('a', [1, 2]), ('b', [3])]
+
+
+def test_duplicate_fixed_booths_rejected():
+    orchestrator = MultiAccountOrchestrator(_config([
+        {'user_id': 'a', 'booths': [1, 2]},
+        {'user_id': 'b', 'booths': [2]},
+    ]))
+    with pytest.raises(ValueError):
+        orchestrator.build_account_configs()
+
+
+def test_branches_use_separate_cookie_files(tmp_path):
+    shared = tmp_path / 'naver_cookies.pkl'
+    shared.write_bytes(b'cookies')
+    config = {
+        'branch': ['중계점', '테스트점'],
+        'branches': {'테스트점': {'place_id': '1', 'biz_id': '2'}},
+        'cookie_file': str(shared),
+    }
+    configs = MultiBranchBooker(config).build_account_configs()
+    cookie_files = [c['cookie_file'] for c in configs]
+    assert len(set(cookie_files)) == 2 and str(shared) not in cookie_files
+    # 처음 실행하는 지점은 공용 쿠키에서 시작
+    assert all(open(path, 'rb').read() == b'cookies' for path in cookie_files)
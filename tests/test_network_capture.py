@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""시간표 API 응답 → 예약 가능 시간"""
+
+from network_capture import parse_schedule
+
+
+def _slots(*nodes):
+    return {slot['time']: slot['available'] for slot in parse_schedule({'data': {'schedule': list(nodes)}})}
+
+
+def test_stock_decides_availability():
+    assert _slots(
+        {'unitStartDateTime': '2026-10-20T06:00:00', 'unitStock': 1, 'unitBookingCount': 0},
+        {'unitStartDateTime': '2026-10-20T07:00:00', 'unitStock': 1, 'unitBookingCount': 1},
+        {'unitStartDateTime': '2026-10-20T08:00:00', 'unitStock': 1, 'isUnitSaleDay': False},
+    ) == {'06:00': True, '07:00': False, '08:00': False}
+
+
+def test_stockless_node_needs_explicit_open_flag():
+    assert _slots(
+        {'unitStartDateTime': '2026-10-20T06:00:00'},
+        {'unitStartDateTime': '2026-10-20T07:00:00', 'isUnitSaleDay': True},
+        {'unitStartDateTime': '2026-10-20T08:00:00', 'isUnitSaleDay': True, 'isUnitBusinessDay': False},
+    ) == {'06:00': False, '07:00': True, '08:00': False}
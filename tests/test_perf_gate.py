@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""예약 경로 성능 예산 (가짜 드라이버로 실제 대기 포함 측정, Chrome이 있으면 모의 서버로도)"""
+
+import os
+import shutil
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import fake_bench  # noqa: E402
+import perf_gate  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(perf_gate.__file__)), perf_gate.BUDGET_FILE)
+
+needs_chrome = pytest.mark.skipif(
+    not any(shutil.which(name) for name in ('google-chrome', 'chromium', 'chromium-browser', 'chrome')),
+    reason='Chrome 없음',
+)
+BACKENDS = [pytest.param('mock', marks=needs_chrome), 'fake']
+
+
+def run_checked_gate(backend, rounds):
+    measurements, booked = perf_gate.run_gate(rounds=rounds, backend=backend)
+    passed, rows = perf_gate.check(
+        measurements, perf_gate.load_budgets(BUDGET_PATH, backend), perf_gate.DEFAULT_TOLERANCE
+    )
+    return booked, passed, rows
+
+
+def test_booking_fixed_waits_within_budget():
+    report = fake_bench.bench('booking', 1)
+    assert report['success'] == 1
+    assert report['skipped_sleep_s'] * 1000 <= perf_gate.BOOKING_WAIT_MS
+
+
+def test_default_booking_budget_is_sum_of_phases():
+    for budgets in perf_gate.DEFAULT_BUDGETS.values():
+        assert budgets['booking_ms'] >= (
+            budgets['first_slot_ms'] + budgets['click_to_confirm_ms'] + perf_gate.SUCCESS_WAIT_MS
+        )
+
+
+def test_perf_gate_fake_driver():
+    booked, passed, rows = run_checked_gate('fake', rounds=1)
+    assert booked == 1
+    assert passed, perf_gate.format_rows(rows)
+
+
+@needs_chrome
+def test_perf_gate_mock_server():
+    booked, passed, rows = run_checked_gate('mock', rounds=3)
+    assert booked == 3
+    assert passed, perf_gate.format_rows(rows)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_perf_gate_rejects_one_extra_sleep(monkeypatch, backend):
+    original = GolfBookingBot._process_booking_steps
+
+    def slower_steps(self):
+        time.sleep(2)
+        return original(self)
+
+    monkeypatch.setattr(GolfBookingBot, '_process_booking_steps', slower_steps)
+    booked, passed, rows = run_checked_gate(backend, rounds=1)
+    assert booked == 1
+    assert not passed
+    failed = {row['name'] for row in rows if not row['ok']}
+    assert {'click_to_confirm_ms', 'booking_ms'} <= failed
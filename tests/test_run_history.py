@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""실행 기록 저장 (봇마다 저장소 하나, 확인한 타석 기록)"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+from run_history import RunHistory  # noqa: E402
+
+
+def test_record_run_reuses_history_and_records_booths(tmp_path):
+    db_path = str(tmp_path / 'history.db')
+    bot = GolfBookingBot({
+        'headless': True,
+        'cookie_file': str(tmp_path / 'cookies.pkl'),
+        'enable_notification': False,
+        'enable_trace': False,
+        'enable_history': True,
+        'history_db': db_path,
+    })
+    histories = []
+    for booths in ([11, 7], [8]):
+        bot.start_trace('mode0')
+        for booth in booths:
+            with bot.tracer.span('booth_scan', booth=booth):
+                pass
+        bot.record_run(False)
+        histories.append(bot.run_history)
+
+    assert histories[0] is histories[1]
+    records = RunHistory(db_path).query(limit=2)
+    assert [r['booths_tried'] for r in records] == [[8], [11, 7]]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""런타임 게이지 수집 (수집기 예외는 debug 로그로만 남으므로 직접 호출해서 확인)"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import kakao_notification  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+
+# 드라이버/알림/기록 파일을 쓰지 않는 설정
+CONFIG = {
+    'headless': True,
+    'cookie_file': '.test_no_cookies.pkl',
+    'enable_notification': False,
+    'enable_history': False,
+    'enable_trace': False,
+    'flight_recorder': False,
+}
+
+
+def test_collect_runtime_metrics_sets_queue_depth():
+    bot = GolfBookingBot(CONFIG)
+    bot._collect_runtime_metrics()
+    assert 'golf_notification_queue_depth' in bot.metrics.render()
+
+
+def test_collect_runtime_metrics_does_not_start_dispatcher(monkeypatch):
+    monkeypatch.setattr(kakao_notification, '_dispatcher', None)
+    bot = GolfBookingBot(CONFIG)
+    bot._collect_runtime_metrics()
+    assert kakao_notification.current_notification_dispatcher() is None
+    assert 'golf_notification_queue_depth 0' in bot.metrics.render()
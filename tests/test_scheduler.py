@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""상주 스케줄러 자정 예약 작업"""
+
+import pytest
+
+pytest.importorskip('selenium')
+pytest.importorskip('schedule')
+
+from golf_auto_booking import BookingScheduler  # noqa: E402
+
+
+# 드라이버/알림을 쓰지 않는 설정 (작업 등록과 작업 본문만 확인)
+CONFIG = {'headless': True, 'cookie_file': '.test_no_cookies.pkl', 'enable_notification': False}
+
+
+def _scheduler(**scheduler_config):
+    return BookingScheduler(dict(CONFIG, scheduler=scheduler_config))
+
+
+@pytest.mark.parametrize('lead', [0, -30, 24 * 3600])
+def test_invalid_prep_lead_rejected(lead):
+    with pytest.raises(ValueError):
+        _scheduler(nightly_prep_lead_seconds=lead).register_jobs()
+
+
+@pytest.mark.parametrize('prepared', [True, False])
+def test_nightly_booking_reuses_prepared_session(monkeypatch, prepared):
+    scheduler = _scheduler()
+    calls = []
+    monkeypatch.setattr(scheduler.bot, 'prepare_session', lambda **kwargs: prepared)
+    monkeypatch.setattr(scheduler.bot, 'run_mode_2', lambda **kwargs: calls.append(kwargs))
+    scheduler._run_nightly_booking()
+    assert calls == [{'reuse_session': prepared}]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""드라이버 세션 준비 / 쿠키 저장"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from fake_driver import FakeDriver, FakeSite  # noqa: E402
+from golf_auto_booking import GolfBookingBot  # noqa: E402
+from replay_bench import replay_config  # noqa: E402
+
+
+class _Backend:
+    def __init__(self):
+        self.closed = False
+        self.cookie_calls = 0
+
+    def set_cookies(self, cookies):
+        self.cookie_calls += 1
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class _DeadDriver:
+    @property
+    def current_url(self):
+        raise ConnectionError('chromedriver gone')
+
+
+def test_dead_driver_closes_backend(monkeypatch):
+    bot = GolfBookingBot(replay_config())
+    backend = bot.browser = _Backend()
+    bot.driver = _DeadDriver()
+    monkeypatch.setattr(bot, 'setup_driver', lambda: False)
+
+    assert not bot.prepare_session()
+    assert backend.closed and bot.browser is None
+
+
+def test_save_cookies_does_not_reinject(tmp_path):
+    bot = GolfBookingBot(dict(replay_config(), cookie_file=str(tmp_path / 'cookies.pkl')))
+    bot.driver = FakeDriver(FakeSite())
+    backend = bot.browser = _Backend()
+    bot.save_cookies()
+
+    assert (tmp_path / 'cookies.pkl').exists()
+    assert backend.cookie_calls == 0 and bot.cookies_injected